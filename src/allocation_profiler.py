@@ -0,0 +1,147 @@
+import dis
+import os
+import sys
+from collections import Counter
+from types import FrameType
+from typing import Any
+
+import amonite
+from amonite.node import Node
+from amonite.state_machine import State
+
+# Only frames from game and engine sources are considered call sites, so that allocations made inside other libraries (e.g. pyglet.math) are attributed to the code using them.
+SOURCES_DIR: str = os.path.dirname(os.path.abspath(__file__))
+ENGINE_DIR: str = os.path.dirname(os.path.abspath(amonite.__file__))
+CALL_SITE_DIRS: tuple[str, ...] = (SOURCES_DIR, ENGINE_DIR)
+
+# Builtin functions known to allocate their result, mapped to their result type by number of arguments.
+ALLOCATING_BUILTINS: dict[str, dict[int, str]] = {
+    # round(x) returns an int, round(x, ndigits) a float.
+    "round": {1: "int", 2: "float"}
+}
+
+# Opcodes performing function calls, whose argument is the number of arguments passed.
+CALL_OPCODES: frozenset[int] = frozenset(dis.opmap[name] for name in ("CALL", "CALL_KW", "CALL_FUNCTION", "CALL_FUNCTION_KW") if name in dis.opmap)
+
+def get_call_argument_count(frame: FrameType) -> int | None:
+    """
+    Returns the number of arguments passed by the call [frame] is currently performing, or None if unknown.
+    """
+
+    code: bytes = frame.f_code.co_code
+    if frame.f_lasti < 0 or frame.f_lasti + 1 >= len(code) or code[frame.f_lasti] not in CALL_OPCODES:
+        return None
+
+    return code[frame.f_lasti + 1]
+
+class AllocationProfiler:
+    """
+    Debug profiler counting object allocations per physics tick, attributing them to call sites, node types and allocated types.
+    Allocations are detected by profiling calls to Python constructors (__init__ and named tuples' __new__, e.g. pyglet.math.Vec2) and to known allocating builtins (e.g. round()).
+    Constructors called by other constructors on the same object (e.g. super().__init__()) are not counted again.
+    Allocations which run no Python code (e.g. tuple displays or float arithmetic) are not detected.
+    """
+
+    def __init__(self) -> None:
+        self.ticks: int = 0
+
+        self.call_sites: Counter[str] = Counter()
+        self.node_types: Counter[str] = Counter()
+        self.allocated_types: Counter[str] = Counter()
+
+    def __enter__(self) -> None:
+        sys.setprofile(self.__on_profile_event)
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        sys.setprofile(None)
+        self.ticks += 1
+
+    def reset(self) -> None:
+        self.ticks = 0
+        self.call_sites.clear()
+        self.node_types.clear()
+        self.allocated_types.clear()
+
+    def __on_profile_event(self, frame: FrameType, event: str, arg: Any) -> None:
+        allocated_type: str | None = None
+        caller: FrameType | None = None
+
+        if event == "call":
+            code = frame.f_code
+
+            if code.co_name == "__init__" and code.co_argcount > 0 and code.co_varnames[0] == "self":
+                allocated: Any = frame.f_locals["self"]
+
+                # Only count the outermost constructor of each object.
+                outer: FrameType | None = frame.f_back
+                if outer is not None and outer.f_code.co_name == "__init__" and outer.f_locals.get("self") is allocated:
+                    return
+
+                allocated_type = type(allocated).__name__
+            elif code.co_argcount > 0 and code.co_varnames[0] == "_cls":
+                # Named tuples' generated __new__.
+                allocated_type = frame.f_locals["_cls"].__name__
+            else:
+                return
+
+            caller = frame.f_back
+        elif event == "c_call":
+            result_types: dict[int, str] | None = ALLOCATING_BUILTINS.get(getattr(arg, "__name__", ""))
+            if result_types is None:
+                return
+
+            argument_count: int | None = get_call_argument_count(frame)
+            allocated_type = result_types.get(argument_count) if argument_count is not None else None
+            if allocated_type is None:
+                return
+
+            # Builtin calls are reported on the frame calling them.
+            caller = frame
+        else:
+            return
+
+        # Find the closest game or engine call site.
+        while caller is not None and not caller.f_code.co_filename.startswith(CALL_SITE_DIRS):
+            caller = caller.f_back
+
+        if caller is None:
+            return
+
+        file_path: str = caller.f_code.co_filename
+        file_name: str = os.path.relpath(file_path, SOURCES_DIR) if file_path.startswith(SOURCES_DIR) else f"amonite/{os.path.relpath(file_path, ENGINE_DIR)}"
+
+        self.allocated_types[allocated_type] += 1
+        self.call_sites[f"{file_name}:{caller.f_lineno} {caller.f_code.co_name} ({allocated_type})"] += 1
+        self.node_types[self.__get_owner_type(caller)] += 1
+
+    def __get_owner_type(self, frame: FrameType | None) -> str:
+        """
+        Returns the type of the closest node or state up the call stack.
+        """
+
+        while frame is not None:
+            owner: Any = frame.f_locals.get("self") if frame.f_code.co_filename.startswith(CALL_SITE_DIRS) else None
+            if isinstance(owner, (Node, State)):
+                return type(owner).__name__
+            frame = frame.f_back
+
+        return "<none>"
+
+    def get_report(self, top: int = 10) -> str:
+        """
+        Returns the [top] call sites, node types and allocated types by allocations per tick.
+        """
+
+        ticks: int = max(self.ticks, 1)
+        lines: list[str] = [f"Allocations per tick over {self.ticks} ticks: {sum(self.allocated_types.values()) / ticks:.1f}"]
+
+        for title, counter in (
+            ("call sites", self.call_sites),
+            ("node types", self.node_types),
+            ("allocated types", self.allocated_types)
+        ):
+            lines.append(f"Top {top} {title}:")
+            for name, count in counter.most_common(top):
+                lines.append(f"{count / ticks:10.2f}  {name}")
+
+        return "\n".join(lines)
@@ -0,0 +1,55 @@
+from amonite.animation import Animation
+
+from asset_loaders import load_animation
+
+class AnimationRegistry:
+    """
+    Process-wide registry of animations, keyed by their source path.
+    Animations are read and sliced once and shared by all their users.
+    Animations fetched since the last scene build started are tracked, so that all others can be evicted once the new scene is swapped in.
+    """
+
+    def __init__(self) -> None:
+        self.__animations: dict[str, Animation] = {}
+
+        # Sources of all animations fetched since the last call to clear_fetched().
+        self.__fetched: set[str] = set()
+
+    def fetch(self, source: str) -> Animation:
+        """
+        Returns the shared animation defined by the provided source file, loading it if needed.
+        """
+
+        animation: Animation | None = self.__animations.get(source)
+
+        if animation is None:
+            animation = load_animation(source = source)
+            self.__animations[source] = animation
+
+        self.__fetched.add(source)
+
+        return animation
+
+    def clear_fetched(self) -> None:
+        """
+        Forgets all previous fetches. Should be called right before building a new scene.
+        """
+
+        self.__fetched.clear()
+
+    def evict_unused(self) -> None:
+        """
+        Evicts all animations which have not been fetched since the last call to clear_fetched().
+        Evicted animations stay valid for anyone still using them, they're just loaded again on their next fetch.
+        """
+
+        for source in [source for source in self.__animations.keys() if source not in self.__fetched]:
+            del self.__animations[source]
+
+    def __contains__(self, source: str) -> bool:
+        return source in self.__animations
+
+    def __len__(self) -> int:
+        return len(self.__animations)
+
+ANIMATION_REGISTRY: AnimationRegistry = AnimationRegistry()
@@ -0,0 +1,212 @@
+import argparse
+from io import BytesIO
+import json
+import mmap
+import os
+import struct
+from typing import Any
+from typing import BinaryIO
+import pyglet
+
+import resource_internals
+
+# File layout:
+# header: magic, version, index offset and index length.
+# body: all asset files, one after the other, uncompressed so that they can be read straight from the mapped file.
+# index: UTF-8 JSON object mapping each asset path (relative to the assets dir) to its offset, length and source file modification time.
+MAGIC: bytes = b"FGAB"
+VERSION: int = 2
+
+HEADER_FORMAT: struct.Struct = struct.Struct("<4sBQQ")
+
+ASSETS_DIR: str = f"{os.path.dirname(os.path.abspath(__file__))}/../assets"
+BUNDLE_PATH: str = f"{os.path.dirname(os.path.abspath(__file__))}/../assets.bundle"
+
+# Asset dirs compiled into bundles, relative to the assets dir.
+# Settings are left out on purpose, since they're meant to be edited by hand.
+BUNDLED_DIRS: tuple[str, ...] = (
+    "scenes",
+    "compiled_scenes",
+    "tilemaps",
+    "tilesets",
+    "wallmaps",
+    "watermaps",
+    "sprites",
+    "fonts",
+    "atlas"
+)
+
+class AssetBundleError(Exception):
+    pass
+
+class BundleLocation(pyglet.resource.Location):
+    """
+    pyglet.resource location reading files out of a mounted asset bundle.
+    """
+
+    def __init__(self, bundle: "AssetBundle") -> None:
+        self.bundle: AssetBundle = bundle
+
+    def open(self, name: str, mode: str = "rb") -> BytesIO:
+        return BytesIO(self.bundle.read(source = name))
+
+class AssetBundle:
+    """
+    Memory mapped, indexed bundle of all game assets, compiled by running this module.
+    Once mounted, all asset reads (both by the game and by pyglet.resource) come straight from the mapped file, with a single open for the whole game.
+    If no bundle is mounted, or it does not contain the requested asset, loose files in the assets dir are read instead.
+    Loose files edited after the bundle was built (i.e. with a different size or a later modification time) are read instead of their bundled version too.
+    """
+
+    def __init__(self) -> None:
+        self.__file: BinaryIO | None = None
+        self.__map: mmap.mmap | None = None
+        self.__view: memoryview | None = None
+
+        # Offset, length and source file modification time of each up to date asset, by path.
+        self.__index: dict[str, tuple[int, int, float]] = {}
+
+    def mount(self, file_path: str = BUNDLE_PATH) -> bool:
+        """
+        Maps the provided bundle file and makes all its up to date assets available through pyglet.resource, along with all loose files in the assets dir.
+        Returns False if no bundle exists at the provided path (or if pyglet.resource can't read from it), in which case pyglet.resource should be reindexed as usual.
+        """
+
+        if not os.path.exists(file_path) or not resource_internals.is_supported():
+            return False
+
+        self.__file = open(file = file_path, mode = "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access = mmap.ACCESS_READ)
+        self.__view = memoryview(self.__map)
+
+        magic, version, index_offset, index_length = HEADER_FORMAT.unpack_from(self.__map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise AssetBundleError(f"{file_path} is not a version {VERSION} asset bundle")
+
+        # Leave out all assets edited after the bundle was built, so that their loose files are read instead.
+        self.__index = {
+            source: (entry[0], entry[1], entry[2])
+            for source, entry in json.loads(bytes(self.__view[index_offset:index_offset + index_length])).items()
+            if not self.__is_outdated(source = source, length = entry[1], mtime = entry[2])
+        }
+
+        # Index loose files as usual, so that assets missing from the bundle (e.g. added after it was built) are still found.
+        # Bundled assets are then read from the bundle in place of their loose files.
+        pyglet.resource.reindex()
+        location: BundleLocation = BundleLocation(bundle = self)
+        for source in self.__index:
+            resource_internals.set_location(name = source, location = location)
+
+        return True
+
+    def __is_outdated(self, source: str, length: int, mtime: float) -> bool:
+        """
+        Tells whether the loose file of the provided bundled asset was edited after the bundle was built.
+        Assets with no loose file are never outdated.
+        """
+
+        file_path: str = f"{pyglet.resource.path[0]}/{source}"
+
+        if not os.path.exists(file_path):
+            return False
+
+        return os.path.getsize(file_path) != length or os.path.getmtime(file_path) > mtime
+
+    def is_mounted(self) -> bool:
+        return self.__view is not None
+
+    def __contains__(self, source: str) -> bool:
+        return source in self.__index
+
+    def exists(self, source: str) -> bool:
+        return source in self.__index or os.path.exists(f"{pyglet.resource.path[0]}/{source}")
+
+    def get_mtime(self, source: str) -> float:
+        """
+        Returns the modification time of the provided asset file (relative to the assets dir).
+        Bundled assets report the modification time their source file had when bundled.
+        """
+
+        entry: tuple[int, int, float] | None = self.__index.get(source)
+
+        if entry is None:
+            return os.path.getmtime(f"{pyglet.resource.path[0]}/{source}")
+
+        return entry[2]
+
+    def read(self, source: str) -> memoryview | bytes:
+        """
+        Returns the content of the provided asset file (relative to the assets dir).
+        Bundled assets are returned as a view on the mapped file, without copying them.
+        """
+
+        entry: tuple[int, int, float] | None = self.__index.get(source)
+
+        if entry is None or self.__view is None:
+            with open(file = f"{pyglet.resource.path[0]}/{source}", mode = "rb") as content:
+                return content.read()
+
+        return self.__view[entry[0]:entry[0] + entry[1]]
+
+    def read_text(self, source: str) -> str:
+        return str(self.read(source = source), encoding = "UTF-8")
+
+    def read_json(self, source: str) -> Any:
+        return json.loads(self.read_text(source = source))
+
+    def open(self, source: str) -> BytesIO:
+        """
+        Returns a binary file object on the content of the provided asset file.
+        """
+
+        return BytesIO(self.read(source = source))
+
+    @staticmethod
+    def build(
+        assets_dir: str = ASSETS_DIR,
+        file_path: str = BUNDLE_PATH,
+        dirs: tuple[str, ...] = BUNDLED_DIRS
+    ) -> int:
+        """
+        Compiles all files in [dirs] (relative to [assets_dir]) into a single bundle file.
+        Returns the number of bundled files.
+        """
+
+        sources: list[str] = []
+        for bundled_dir in dirs:
+            for dir_path, _, file_names in os.walk(f"{assets_dir}/{bundled_dir}"):
+                for file_name in file_names:
+                    sources.append(os.path.relpath(os.path.join(dir_path, file_name), assets_dir).replace(os.sep, "/"))
+        sources.sort()
+
+        index: dict[str, tuple[int, int, float]] = {}
+        with open(file = file_path, mode = "wb") as bundle:
+            # Leave room for the header, which is only known once the index is written.
+            bundle.write(bytes(HEADER_FORMAT.size))
+
+            for source in sources:
+                with open(file = f"{assets_dir}/{source}", mode = "rb") as content:
+                    data: bytes = content.read()
+
+                index[source] = (bundle.tell(), len(data), os.path.getmtime(f"{assets_dir}/{source}"))
+                bundle.write(data)
+
+            index_offset: int = bundle.tell()
+            encoded_index: bytes = json.dumps(index, separators = (",", ":")).encode("UTF-8")
+            bundle.write(encoded_index)
+
+            bundle.seek(0)
+            bundle.write(HEADER_FORMAT.pack(MAGIC, VERSION, index_offset, len(encoded_index)))
+
+        return len(sources)
+
+ASSET_BUNDLE: AssetBundle = AssetBundle()
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Compiles all game assets into a single memory mappable bundle.")
+    parser.add_argument("--assets", default = ASSETS_DIR, help = "assets directory")
+    parser.add_argument("--output", default = BUNDLE_PATH, help = "bundle file to write")
+    args: argparse.Namespace = parser.parse_args()
+
+    count: int = AssetBundle.build(assets_dir = args.assets, file_path = args.output)
+    print(f"Bundled {count} files into {args.output}")
@@ -0,0 +1,161 @@
+import pyglet
+
+from amonite.animation import Animation
+from amonite.scene_node import Bounds
+from amonite.settings import GLOBALS
+from amonite.settings import SETTINGS
+from amonite.settings import Keys
+from amonite.tilemap_node import TilemapNode
+from amonite.tilemap_node import Tileset
+from amonite.utils import utils
+from amonite.utils.hittables_loader import HittableNode
+
+from asset_bundle import ASSET_BUNDLE
+from scene_template import HittableTemplate
+from scene_template import TilemapTemplate
+
+# Bundle and template aware equivalents of amonite's file based loaders (animations, tilemaps and hittables).
+# amonite's own loaders always open loose files in the assets dir, so these read through the asset bundle (or build from already parsed scene templates) instead, while producing exactly the same objects.
+
+def load_animation(source: str) -> Animation:
+    """
+    Reads and returns the animation defined by the provided definition file.
+    Mirrors amonite.animation.Animation's constructor.
+    """
+
+    animation: Animation = Animation.__new__(Animation)
+    animation.source = source
+    animation.source_data = ASSET_BUNDLE.read_json(source = source)
+
+    # Make sure all mandatory fields are present in the definition file.
+    assert "path" in animation.source_data.keys() and "name" in animation.source_data.keys()
+
+    animation.name = animation.source_data["name"]
+
+    path: str = animation.source_data["path"]
+    if path.split(".")[1] == "gif":
+        animation.content = pyglet.resource.animation(path)
+    else:
+        assert "rows" in animation.source_data.keys() and "columns" in animation.source_data.keys()
+        image_grid: pyglet.image.ImageGrid = pyglet.image.ImageGrid(
+            pyglet.resource.image(path),
+            rows = animation.source_data["rows"],
+            columns = animation.source_data["columns"]
+        )
+        animation.content = pyglet.image.Animation.from_image_sequence(image_grid, duration = 0.1)
+
+    if "anchor_x" in animation.source_data.keys():
+        utils.set_animation_anchor_x(animation = animation.content, anchor = animation.source_data["anchor_x"])
+    if "anchor_y" in animation.source_data.keys():
+        utils.set_animation_anchor_y(animation = animation.content, anchor = animation.source_data["anchor_y"])
+
+    if animation.source_data.get("center_x") is True:
+        utils.x_center_animation(animation = animation.content)
+    if animation.source_data.get("center_y") is True:
+        utils.y_center_animation(animation = animation.content)
+
+    if "duration" in animation.source_data.keys():
+        utils.set_animation_duration(animation = animation.content, duration = animation.source_data["duration"])
+
+    # Set not looping if so specified.
+    if animation.source_data.get("loop") is False:
+        animation.content.frames[-1].duration = None
+
+    return animation
+
+def build_tileset(template: TilemapTemplate) -> Tileset:
+    """
+    Creates the tileset shared by all layers of the provided tilemap template.
+    """
+
+    return Tileset(
+        sources = list(template.tilesets),
+        tile_width = template.tile_width,
+        tile_height = template.tile_height
+    )
+
+def build_tilemap_region(
+    template: TilemapTemplate,
+    tileset: Tileset,
+    layer_index: int,
+    first_row: int,
+    rows: int,
+    first_column: int,
+    columns: int,
+    batch: pyglet.graphics.Batch | None = None
+) -> TilemapNode | None:
+    """
+    Creates the provided region (rows counting from the top) of a single layer of the provided tilemap template.
+    Tiles are placed exactly as if the whole layer was created at once, so layers can be split into any number of regions and built a region at a time.
+    Returns None if the requested region contains no tiles.
+    Mirrors amonite.tilemap_node.TilemapNode.from_tmx_file().
+    """
+
+    layer_name, layer_content = template.layers[layer_index]
+    rows = min(rows, template.map_height - first_row)
+    columns = min(columns, template.map_width - first_column)
+
+    data: list[int] = []
+    for row in range(first_row, first_row + rows):
+        row_start: int = row * template.map_width + first_column
+        data.extend(layer_content[row_start:row_start + columns])
+
+    if all(tile < 0 for tile in data):
+        return None
+
+    spacing: int = int(SETTINGS[Keys.LAYERS_Z_SPACING])
+
+    # Only apply layers offset if not a rat layer.
+    z_offset: int = 0 if "rat" in layer_name else spacing * (len(template.layers) - layer_index)
+
+    # Rows below the region, which TilemapNode would otherwise place the region on.
+    rows_below: int = template.map_height - first_row - rows
+    x: float = first_column * template.tile_width * float(GLOBALS[Keys.SCALING])
+    y: float = rows_below * template.tile_height * float(GLOBALS[Keys.SCALING])
+
+    return TilemapNode(
+        tileset = tileset,
+        data = data,
+        map_width = columns,
+        map_height = rows,
+        x = x,
+        y = y,
+        # TilemapNode sorts tiles by their unscaled y, so compensate for the scaled region offset.
+        z_offset = int(z_offset + rows_below * template.tile_height - y),
+        batch = batch
+    )
+
+def get_tilemap_bounds(template: TilemapTemplate) -> Bounds:
+    """
+    Returns the camera bounds of the provided tilemap template.
+    Mirrors amonite.tilemap_node.TilemapNode's own bounds.
+    """
+
+    return Bounds(
+        bottom = int(SETTINGS[Keys.TILEMAP_BUFFER]) * template.tile_height,
+        right = (template.map_width - int(SETTINGS[Keys.TILEMAP_BUFFER])) * template.tile_width,
+        left = int(SETTINGS[Keys.TILEMAP_BUFFER]) * template.tile_width,
+        top = (template.map_height - int(SETTINGS[Keys.TILEMAP_BUFFER])) * template.tile_height
+    )
+
+def build_hittable(
+    template: HittableTemplate,
+    hittable_type: type[HittableNode] = HittableNode,
+    z: float = 0.0,
+    batch: pyglet.graphics.Batch | None = None
+) -> HittableNode:
+    """
+    Creates a hittable node of type [hittable_type] from the provided hittable template.
+    Mirrors amonite.utils.hittables_loader.HittablesLoader.fetch().
+    """
+
+    return hittable_type(
+        x = template.x,
+        y = template.y,
+        z = z,
+        width = template.width,
+        height = template.height,
+        sensor = template.sensor,
+        tags = list(template.tags),
+        batch = batch
+    )
@@ -0,0 +1,138 @@
+import os
+import xml.etree.ElementTree as xml
+from typing import Any
+
+from asset_bundle import ASSET_BUNDLE
+
+# Path to tileset images, as used when reading tilemaps.
+TILESETS_PATH: str = "tilesets/"
+
+# Fonts used by the game, regardless of the scene.
+FONTS: tuple[str, ...] = (
+    "fonts/I-pixel-u.ttf",
+    "fonts/rughai.ttf"
+)
+
+# Sprites (animation definition files) used by each scene child type, including all its states and components.
+# Must be kept up to date with all animations fetched by each child, otherwise they'll just be loaded lazily on the main thread.
+BUTTON_ICON_SPRITES: tuple[str, ...] = (
+    "sprites/button_icon/button_icon.json",
+)
+CHILD_SPRITES: dict[str, tuple[str, ...]] = {
+    "fish_node": (
+        "sprites/fish/dumbo_swim.json",
+        "sprites/fish/dumbo_swim_dash.json",
+        "sprites/fish/dumbo_idle.json",
+        "sprites/fish/dumbo_land_idle.json",
+        "sprites/fish/dumbo_shoot_preload.json",
+        "sprites/fish/dumbo_shoot_load.json",
+        "sprites/fish/ink_fly.json",
+        "sprites/fish/ink_splat.json",
+        "sprites/fish/ink_parabola.json",
+        *BUTTON_ICON_SPRITES
+    ),
+    "leg_node": (
+        "sprites/leg/leg_idle.json",
+        "sprites/leg/leg_walk.json",
+        "sprites/leg/leg_jump.json",
+        *BUTTON_ICON_SPRITES
+    ),
+    "door": (
+        "sprites/door/door_closed.json",
+        "sprites/door/door_open.json",
+        "sprites/door/door_opening.json",
+        "sprites/lightbulbs/lightbulb_off.json",
+        "sprites/lightbulbs/lightbulb_red.json",
+        "sprites/lightbulbs/lightbulb_purple.json"
+    ),
+    "ink_button_node": (
+        "sprites/buttons/button_up.json",
+        "sprites/buttons/button_down.json"
+    ),
+    "press_button_node": (
+        "sprites/buttons/button_up.json",
+        "sprites/buttons/button_down.json"
+    ),
+    "red_platform_node": (
+        "sprites/platforms/platform_active.json",
+        "sprites/platforms/platform_inactive.json",
+        "sprites/platforms/platform_activating.json"
+    )
+}
+
+class AssetManifest:
+    """
+    List of all assets needed by a single scene, derived from its scene file.
+    """
+
+    __slots__ = (
+        "scene_src",
+        "sprites",
+        "images",
+        "tilesets",
+        "fonts"
+    )
+
+    def __init__(
+        self,
+        scene_src: str,
+        sprites: list[str],
+        images: list[str],
+        tilesets: list[str],
+        fonts: list[str]
+    ) -> None:
+        self.scene_src: str = scene_src
+
+        # Animation definition files.
+        self.sprites: list[str] = sprites
+
+        # Sprite sheets referenced by animation definition files.
+        self.images: list[str] = images
+
+        # Tileset images referenced by the scene tilemap.
+        self.tilesets: list[str] = tilesets
+
+        self.fonts: list[str] = fonts
+
+    def get_all_images(self) -> list[str]:
+        """
+        Returns all image files (sprite sheets and tilesets) needed by the scene.
+        """
+
+        return [*self.images, *self.tilesets]
+
+    @staticmethod
+    def from_scene_file(scene_src: str) -> "AssetManifest":
+        config_data: dict[str, Any] = ASSET_BUNDLE.read_json(source = scene_src)
+
+        # Keep insertion order, but skip duplicates.
+        sprites: dict[str, None] = {}
+        for child in config_data["children"]:
+            for sprite in CHILD_SPRITES.get(child["name"], ()):
+                sprites[sprite] = None
+
+        images: dict[str, None] = {}
+        for sprite in sprites:
+            path: str = ASSET_BUNDLE.read_json(source = sprite)["path"]
+
+            # Animated gifs are decoded by pyglet as a whole, so they can't be preloaded.
+            if path.endswith(".png"):
+                images[path] = None
+
+        tilesets: list[str] = []
+        if config_data.get("tilemap") is not None:
+            root: xml.Element = xml.fromstring(ASSET_BUNDLE.read_text(source = config_data["tilemap"]))
+
+            # Tilemaps reference tileset definitions, whose image shares the same name.
+            tilesets = [
+                f"{TILESETS_PATH}{os.path.splitext(os.path.basename(tileset.attrib['source']))[0]}.png"
+                for tileset in root.findall("tileset")
+            ]
+
+        return AssetManifest(
+            scene_src = scene_src,
+            sprites = list(sprites),
+            images = list(images),
+            tilesets = tilesets,
+            fonts = list(FONTS)
+        )
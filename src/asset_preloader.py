@@ -0,0 +1,244 @@
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import pyglet
+
+from asset_bundle import ASSET_BUNDLE
+from asset_manifest import AssetManifest
+import resource_internals
+from scene_compiler import load_scene_template
+from scene_template import SceneTemplate
+
+# Border left around each image in texture atlases, same as pyglet.resource's default.
+ATLAS_BORDER: int = 1
+
+# Bytes taken by each pixel of decoded images (RGBA).
+IMAGE_PIXEL_SIZE: int = 4
+
+class AssetPreloader:
+    """
+    Preloads all assets listed in scene manifests.
+    Scene files are read and parsed and images are decoded on a worker thread as soon as a scene is requested, while texture upload (which needs the GL context) only happens on the main thread.
+    Uploaded textures are handed to pyglet.resource, so all regular lazy loads (e.g. animations and tilesets) find them already in place.
+    """
+
+    def __init__(self) -> None:
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "asset_preloader")
+
+        # Manifests and parsed scene templates being (or done being) read, by scene source.
+        self.__manifests: dict[str, Future[AssetManifest]] = {}
+        self.__templates: dict[str, Future[SceneTemplate]] = {}
+
+        # Images being (or done being) decoded, by path.
+        self.__decodes: dict[str, Future[pyglet.image.ImageData]] = {}
+
+        # Uploaded textures needed by the active scene, by path.
+        # pyglet.resource only keeps weak references to its textures, so they must be kept alive here.
+        self.__textures: dict[str, pyglet.image.AbstractImage] = {}
+
+        self.__fonts: set[str] = set()
+
+        # Warn right away if uploaded textures can't be handed to pyglet.resource (e.g. after a pyglet upgrade).
+        resource_internals.check()
+
+    def get_manifest(self, scene_src: str) -> AssetManifest:
+        """
+        Returns the manifest of the provided scene, waiting for it to be read if needed.
+        """
+
+        self.request(scene_src = scene_src)
+
+        return self.__manifests[scene_src].result()
+
+    def get_template(self, scene_src: str) -> SceneTemplate:
+        """
+        Returns the parsed template of the provided scene, waiting for it to be parsed if needed.
+        Templates are kept until evicted (see evict()), so each resident scene file is only ever parsed once.
+        """
+
+        self.request(scene_src = scene_src)
+
+        return self.__templates[scene_src].result()
+
+    def request(self, scene_src: str) -> None:
+        """
+        Starts reading the provided scene's manifest and template, then decoding all images it needs, on the worker thread.
+        Returns immediately, so it can be called repeatedly (e.g. every tick) until the scene is ready.
+        """
+
+        if scene_src not in self.__manifests:
+            self.__manifests[scene_src] = self.__executor.submit(AssetManifest.from_scene_file, scene_src)
+
+        if scene_src not in self.__templates:
+            self.__templates[scene_src] = self.__executor.submit(load_scene_template, scene_src)
+
+        # Images are only known once the manifest is read.
+        manifest: Future[AssetManifest] = self.__manifests[scene_src]
+        if not manifest.done():
+            return
+
+        for image in manifest.result().get_all_images():
+            if image in self.__decodes or self.__get_texture(image = image) is not None:
+                continue
+
+            self.__decodes[image] = self.__executor.submit(self.__decode, image)
+
+    def is_ready(self, scene_src: str) -> bool:
+        """
+        Tells whether the provided scene is parsed and all images it needs are decoded (or already uploaded), requesting them if not.
+        """
+
+        self.request(scene_src = scene_src)
+
+        if not self.__manifests[scene_src].done() or not self.__templates[scene_src].done():
+            return False
+
+        # Make sure images are requested now that the manifest is read.
+        self.request(scene_src = scene_src)
+
+        return all(
+            image not in self.__decodes or self.__decodes[image].done()
+            for image in self.get_manifest(scene_src = scene_src).get_all_images()
+        )
+
+    def upload(self, scene_src: str) -> None:
+        """
+        Uploads all images needed by the provided scene to textures and loads its fonts.
+        Waits for anything still being read or decoded, so is_ready() should be checked first in order not to stall.
+        Must be called on the main thread.
+        """
+
+        manifest: AssetManifest = self.get_manifest(scene_src = scene_src)
+        self.request(scene_src = scene_src)
+
+        textures: dict[str, pyglet.image.AbstractImage] = {}
+        for image in manifest.get_all_images():
+            texture: pyglet.image.AbstractImage | None = self.__get_texture(image = image)
+            decode: Future[pyglet.image.ImageData] | None = self.__decodes.pop(image, None)
+
+            if texture is None:
+                assert decode is not None
+                texture = self.__upload(image = image, image_data = decode.result())
+
+            textures[image] = texture
+
+        # Only keep textures needed by the new scene, all others are freed as soon as the previous scene is.
+        self.__textures = textures
+
+        for font in manifest.fonts:
+            self.load_font(source = font)
+
+    def is_resident(self, scene_src: str) -> bool:
+        """
+        Tells whether the provided scene's manifest and template are requested and kept in memory.
+        """
+
+        return scene_src in self.__templates
+
+    def is_parsed(self, scene_src: str) -> bool:
+        """
+        Tells whether the provided scene's template is parsed, without requesting it.
+        """
+
+        template: Future[SceneTemplate] | None = self.__templates.get(scene_src)
+
+        return template is not None and template.done() and not template.cancelled() and template.exception() is None
+
+    def get_images(self, scene_src: str) -> list[str]:
+        """
+        Returns all images (sprites and tilesets) needed by the provided scene, without requesting it.
+        Images are only known once the scene's manifest is read, so none is returned before.
+        """
+
+        manifest: Future[AssetManifest] | None = self.__manifests.get(scene_src)
+
+        if manifest is None or not manifest.done() or manifest.cancelled() or manifest.exception() is not None:
+            return []
+
+        return manifest.result().get_all_images()
+
+    def get_image_size(self, image: str) -> int | None:
+        """
+        Returns the size in bytes of the provided image once decoded, whether still waiting for upload or already uploaded.
+        Returns None if the image is not decoded yet.
+        """
+
+        decode: Future[pyglet.image.ImageData] | None = self.__decodes.get(image)
+        decoded: pyglet.image.AbstractImage | None = None
+
+        if decode is not None:
+            if decode.done() and not decode.cancelled() and decode.exception() is None:
+                decoded = decode.result()
+        else:
+            decoded = self.__get_texture(image = image)
+
+        if decoded is None:
+            return None
+
+        return decoded.width * decoded.height * IMAGE_PIXEL_SIZE
+
+    def evict(self, scene_src: str) -> None:
+        """
+        Drops the provided scene's manifest and template, along with all decoded images no other resident scene needs.
+        Work not started yet is cancelled, so that nothing is read for a scene that's not going to be needed anymore.
+        The scene is simply read again if requested later on.
+        """
+
+        manifest: Future[AssetManifest] | None = self.__manifests.pop(scene_src, None)
+        template: Future[SceneTemplate] | None = self.__templates.pop(scene_src, None)
+
+        for future in (manifest, template):
+            if future is not None:
+                future.cancel()
+
+        # Keep images still needed by any other scene read so far.
+        needed: set[str] = set()
+        for other in self.__manifests.values():
+            if other.done() and not other.cancelled() and other.exception() is None:
+                needed.update(other.result().get_all_images())
+
+        for image in [image for image in self.__decodes.keys() if image not in needed]:
+            self.__decodes.pop(image).cancel()
+
+    def load_font(self, source: str) -> None:
+        """
+        Loads the provided font file, unless already loaded.
+        """
+
+        if source in self.__fonts:
+            return
+
+        pyglet.font.add_file(ASSET_BUNDLE.open(source = source))
+        self.__fonts.add(source)
+
+    def __get_texture(self, image: str) -> pyglet.image.AbstractImage | None:
+        """
+        Returns the texture already uploaded for the provided image, if any.
+        """
+
+        texture: pyglet.image.AbstractImage | None = self.__textures.get(image)
+
+        if texture is None:
+            texture = resource_internals.get_cached_image(name = image)
+
+        return texture
+
+    def __decode(self, image: str) -> pyglet.image.ImageData:
+        """
+        Decodes the provided image file, without touching any GL state. Runs on the worker thread.
+        """
+
+        with pyglet.resource.file(image) as content:
+            return pyglet.image.load(image, file = content).get_image_data()
+
+    def __upload(self, image: str, image_data: pyglet.image.ImageData) -> pyglet.image.AbstractImage:
+        """
+        Uploads the provided image data to a texture and registers it with pyglet.resource.
+        """
+
+        # Mirror pyglet.resource's own image allocation, so that preloaded images end up in the same texture atlases lazily loaded ones would.
+        texture: pyglet.image.AbstractImage = resource_internals.allocate_texture(image_data = image_data, border = ATLAS_BORDER)
+        resource_internals.cache_image(name = image, image = texture)
+
+        return texture
+
+ASSET_PRELOADER: AssetPreloader = AssetPreloader()
@@ -0,0 +1,190 @@
+import argparse
+import glob
+import json
+import os
+from typing import Any
+
+# Only pyglet's bundled PNG codec is used, so that atlases can be built without any GL context.
+import pyglet.extlibs.png as png
+
+from sprite_atlas import ATLAS_INDEX
+from sprite_atlas import ATLAS_VERSION
+
+ASSETS_DIR: str = f"{os.path.dirname(os.path.abspath(__file__))}/../assets"
+
+# Transparent pixels left around each sheet, so that no sheet bleeds into its neighbours.
+PADDING: int = 1
+
+class AtlasSheet:
+    """
+    Single sprite sheet to be packed, stored as RGBA rows from top to bottom.
+    """
+
+    __slots__ = (
+        "source",
+        "width",
+        "height",
+        "rows",
+        "size",
+        "mtime",
+        "page",
+        "x",
+        "y"
+    )
+
+    def __init__(
+        self,
+        source: str,
+        width: int,
+        height: int,
+        rows: list[bytearray],
+        size: int,
+        mtime: float
+    ) -> None:
+        self.source: str = source
+        self.width: int = width
+        self.height: int = height
+        self.rows: list[bytearray] = rows
+
+        # Source file size and modification time, so that sheets edited after packing can be told apart.
+        self.size: int = size
+        self.mtime: float = mtime
+
+        # Packed position: page index and top left corner.
+        self.page: int = 0
+        self.x: int = 0
+        self.y: int = 0
+
+class AtlasBuilder:
+    """
+    Packs all sprite sheets into as few pages as possible, using shelf packing.
+    """
+
+    def __init__(
+        self,
+        assets_dir: str = ASSETS_DIR,
+        page_size: int = 1024
+    ) -> None:
+        self.assets_dir: str = assets_dir
+        self.page_size: int = page_size
+
+    def load_sheets(self, pattern: str = "sprites/**/*.png") -> list[AtlasSheet]:
+        sheets: list[AtlasSheet] = []
+
+        for file_path in sorted(glob.glob(f"{self.assets_dir}/{pattern}", recursive = True)):
+            width, height, rows, _ = png.Reader(filename = file_path).asRGBA8()
+            sheet: AtlasSheet = AtlasSheet(
+                source = os.path.relpath(file_path, self.assets_dir).replace(os.sep, "/"),
+                width = width,
+                height = height,
+                rows = [bytearray(row) for row in rows],
+                size = os.path.getsize(file_path),
+                mtime = os.path.getmtime(file_path)
+            )
+
+            if sheet.width + 2 * PADDING > self.page_size or sheet.height + 2 * PADDING > self.page_size:
+                raise ValueError(f"{sheet.source} ({sheet.width}x{sheet.height}) does not fit in a {self.page_size}x{self.page_size} atlas page")
+
+            sheets.append(sheet)
+
+        return sheets
+
+    def pack(self, sheets: list[AtlasSheet]) -> int:
+        """
+        Assigns a page and a position to each sheet and returns the number of pages used.
+        """
+
+        page: int = 0
+        shelf_x: int = 0
+        shelf_y: int = 0
+        shelf_height: int = 0
+
+        # Tallest sheets first, so that shelves waste as little height as possible.
+        for sheet in sorted(sheets, key = lambda sheet: (-sheet.height, -sheet.width, sheet.source)):
+            padded_width: int = sheet.width + 2 * PADDING
+            padded_height: int = sheet.height + 2 * PADDING
+
+            # Start a new shelf if the current one is full.
+            if shelf_x + padded_width > self.page_size:
+                shelf_x = 0
+                shelf_y += shelf_height
+                shelf_height = 0
+
+            # Start a new page if the current one is full.
+            if shelf_y + padded_height > self.page_size:
+                page += 1
+                shelf_x = 0
+                shelf_y = 0
+                shelf_height = 0
+
+            sheet.page = page
+            sheet.x = shelf_x + PADDING
+            sheet.y = shelf_y + PADDING
+
+            shelf_x += padded_width
+            shelf_height = max(shelf_height, padded_height)
+
+        return page + 1 if len(sheets) > 0 else 0
+
+    def build(self) -> dict[str, Any]:
+        """
+        Packs all sprite sheets and writes atlas pages and their index next to each other, in the assets dir.
+        Returns the written index.
+        """
+
+        output_dir: str = os.path.dirname(ATLAS_INDEX)
+
+        sheets: list[AtlasSheet] = self.load_sheets()
+        pages_count: int = self.pack(sheets = sheets)
+
+        os.makedirs(f"{self.assets_dir}/{output_dir}", exist_ok = True)
+
+        index: dict[str, Any] = {
+            "version": ATLAS_VERSION,
+            "pages": [],
+            "images": {}
+        }
+
+        for page in range(pages_count):
+            page_sheets: list[AtlasSheet] = [sheet for sheet in sheets if sheet.page == page]
+
+            # Shrink the page to the used area.
+            width: int = max(sheet.x + sheet.width + PADDING for sheet in page_sheets)
+            height: int = max(sheet.y + sheet.height + PADDING for sheet in page_sheets)
+
+            rows: list[bytearray] = [bytearray(width * 4) for _ in range(height)]
+            for sheet in page_sheets:
+                for row_index, row in enumerate(sheet.rows):
+                    rows[sheet.y + row_index][sheet.x * 4:(sheet.x + sheet.width) * 4] = row
+
+            page_src: str = f"{output_dir}/sprites_{page}.png"
+            with open(file = f"{self.assets_dir}/{page_src}", mode = "wb") as page_file:
+                png.Writer(width = width, height = height, greyscale = False, alpha = True).write(page_file, rows)
+
+            index["pages"].append(page_src)
+
+            for sheet in page_sheets:
+                index["images"][sheet.source] = {
+                    "page": page,
+                    # Regions are stored in pyglet coordinates, with the origin at the bottom left of the page.
+                    "x": sheet.x,
+                    "y": height - sheet.y - sheet.height,
+                    "width": sheet.width,
+                    "height": sheet.height,
+                    "size": sheet.size,
+                    "mtime": sheet.mtime
+                }
+
+        with open(file = f"{self.assets_dir}/{ATLAS_INDEX}", mode = "w", encoding = "UTF-8") as index_file:
+            json.dump(index, index_file, indent = 4)
+
+        return index
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Packs all sprite sheets into texture atlas pages, along with a JSON index used at runtime.")
+    parser.add_argument("--assets", default = ASSETS_DIR, help = "assets directory")
+    parser.add_argument("--page-size", type = int, default = 1024, help = "maximum width and height of each atlas page")
+    args: argparse.Namespace = parser.parse_args()
+
+    index: dict[str, Any] = AtlasBuilder(assets_dir = args.assets, page_size = args.page_size).build()
+    print(f"Packed {len(index['images'])} sprite sheets into {len(index['pages'])} pages")
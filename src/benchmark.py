@@ -0,0 +1,320 @@
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+# Headless runner must be imported first, since it sets pyglet up for offscreen rendering.
+from headless import HeadlessFishGame
+import pyglet
+
+import amonite.controllers as controllers
+from amonite.input_controller import ControllerButton
+
+from allocation_profiler import AllocationProfiler
+from input_recording import BUTTONS
+from input_recording import InputState
+import scene_composer
+
+SCENES: tuple[str, ...] = (
+    "scenes/0_0_0.json",
+    "scenes/0_0_1.json"
+)
+
+# Metrics where higher values are better, all others are better when lower.
+HIGHER_IS_BETTER: tuple[str, ...] = (
+    "ticks_per_second",
+)
+
+# Metrics checked against the baseline.
+CHECKED_METRICS: tuple[str, ...] = (
+    "ticks_per_second",
+    "p99_tick_ms",
+    "allocations_per_tick",
+    "peak_alloc_kib_per_tick"
+)
+
+def get_buttons_mask(*buttons: ControllerButton) -> int:
+    mask: int = 0
+    for button in buttons:
+        mask |= 1 << BUTTONS.index(button.value)
+    return mask
+
+def get_state(
+    fish_stick: tuple[float, float] = (0.0, 0.0),
+    fish_buttons: int = 0,
+    fish_button_presses: int = 0,
+    fish_button_releases: int = 0,
+    leg_stick: tuple[float, float] = (0.0, 0.0),
+    key_presses: list[int] | None = None
+) -> InputState:
+    """
+    Builds an input state for both characters' controllers.
+    """
+
+    return InputState(
+        keys = [],
+        key_presses = key_presses if key_presses is not None else [],
+        key_releases = [],
+        buttons = [fish_buttons, 0],
+        button_presses = [fish_button_presses, 0],
+        button_releases = [fish_button_releases, 0],
+        sticks = [
+            (*fish_stick, 0.0, 0.0),
+            (*leg_stick, 0.0, 0.0)
+        ],
+        triggers = [(0.0, 0.0), (0.0, 0.0)]
+    )
+
+################################
+# Scenarios.
+# Each scenario returns the inputs for the provided tick.
+################################
+def idle(tick: int) -> InputState:
+    """
+    Both characters idling.
+    """
+
+    return get_state()
+
+def swim_dash(tick: int) -> InputState:
+    """
+    Fish continuously swimming around, dashing every 45 ticks.
+    """
+
+    angle: float = tick * 0.02
+    dash: int = get_buttons_mask(ControllerButton.SOUTH) if tick % 45 == 0 else 0
+
+    return get_state(
+        fish_stick = (math.cos(angle), math.sin(angle)),
+        fish_buttons = dash,
+        fish_button_presses = dash
+    )
+
+def shoot_cycles(tick: int) -> InputState:
+    """
+    Fish repeatedly loading ink for 60 ticks and shooting it, every 90 ticks.
+    """
+
+    cycle_tick: int = tick % 90
+    aim: int = get_buttons_mask(ControllerButton.EAST)
+
+    if cycle_tick < 60:
+        return get_state(
+            fish_stick = (0.7, 0.7),
+            fish_buttons = aim,
+            fish_button_presses = aim if cycle_tick == 0 else 0
+        )
+
+    return get_state(fish_button_releases = aim if cycle_tick == 60 else 0)
+
+def resets(tick: int) -> InputState:
+    """
+    Scene reset every 120 ticks.
+    """
+
+    return get_state(key_presses = [pyglet.window.key.R] if tick % 120 == 0 else [])
+
+SCENARIOS: dict[str, Callable[[int], InputState]] = {
+    "idle": idle,
+    "swim_dash": swim_dash,
+    "shoot_cycles": shoot_cycles,
+    "resets": resets
+}
+################################
+################################
+
+class Benchmark:
+    """
+    Runs all scenarios in all scenes for a fixed number of ticks, on a headless game.
+    """
+
+    def __init__(
+        self,
+        ticks: int = 3000
+    ) -> None:
+        self.ticks: int = ticks
+        self.__game: HeadlessFishGame = HeadlessFishGame(scene_src = SCENES[0])
+
+    def __load(self, scene_src: str) -> None:
+        assert scene_composer.SCENE_COMPOSER is not None
+        scene_composer.SCENE_COMPOSER.load_scene(config_file_path = scene_src)
+
+    def __run_ticks(
+        self,
+        scenario: Callable[[int], InputState],
+        on_tick_start: Callable[[], None],
+        on_tick_end: Callable[[], None]
+    ) -> None:
+        tick: int = 0
+        while tick < self.ticks:
+            scenario(tick).apply(input_controller = controllers.INPUT_CONTROLLER)
+
+            on_tick_start()
+            if self.__game.tick():
+                tick += 1
+            on_tick_end()
+
+    def run_scenario(
+        self,
+        scene_src: str,
+        scenario: Callable[[int], InputState]
+    ) -> dict[str, float]:
+        """
+        Runs the provided scenario in the provided scene three times: once for timings, once for allocation counts and once for allocated memory, since tracing allocations slows everything down and both tracers would count each other's allocations.
+        """
+
+        ################################
+        # Timings.
+        ################################
+        self.__load(scene_src = scene_src)
+
+        tick_times: list[float] = []
+        tick_start_time: float = 0.0
+
+        def start_timing() -> None:
+            nonlocal tick_start_time
+            tick_start_time = time.perf_counter()
+
+        def end_timing() -> None:
+            tick_times.append(time.perf_counter() - tick_start_time)
+
+        gc_collections: int = sum(stats["collections"] for stats in gc.get_stats())
+        start_time: float = time.perf_counter()
+        self.__run_ticks(scenario = scenario, on_tick_start = start_timing, on_tick_end = end_timing)
+        elapsed: float = time.perf_counter() - start_time
+        gc_collections = sum(stats["collections"] for stats in gc.get_stats()) - gc_collections
+        ################################
+        ################################
+
+        ################################
+        # Allocation counts.
+        ################################
+        self.__load(scene_src = scene_src)
+
+        allocation_profiler: AllocationProfiler = AllocationProfiler()
+
+        def start_profiling() -> None:
+            allocation_profiler.__enter__()
+
+        def end_profiling() -> None:
+            allocation_profiler.__exit__(None, None, None)
+
+        self.__run_ticks(scenario = scenario, on_tick_start = start_profiling, on_tick_end = end_profiling)
+        ################################
+        ################################
+
+        ################################
+        # Allocated memory.
+        ################################
+        self.__load(scene_src = scene_src)
+
+        allocated_bytes: int = 0
+        traced_ticks: int = 0
+        tick_start_memory: int = 0
+
+        def start_tracing() -> None:
+            nonlocal tick_start_memory
+            tracemalloc.reset_peak()
+            tick_start_memory = tracemalloc.get_traced_memory()[0]
+
+        def end_tracing() -> None:
+            nonlocal allocated_bytes, traced_ticks
+            allocated_bytes += tracemalloc.get_traced_memory()[1] - tick_start_memory
+            traced_ticks += 1
+
+        tracemalloc.start()
+        self.__run_ticks(scenario = scenario, on_tick_start = start_tracing, on_tick_end = end_tracing)
+        tracemalloc.stop()
+        ################################
+        ################################
+
+        tick_times.sort()
+
+        return {
+            "ticks": self.ticks,
+            "ticks_per_second": self.ticks / elapsed,
+            "p99_tick_ms": tick_times[max(int(round(0.99 * len(tick_times))) - 1, 0)] * 1000.0,
+            "max_tick_ms": tick_times[-1] * 1000.0,
+            # Objects allocated within each tick, as detected by the allocation profiler.
+            "allocations_per_tick": sum(allocation_profiler.allocated_types.values()) / max(allocation_profiler.ticks, 1),
+            # Peak memory allocated within each tick, on top of what was allocated before it.
+            "peak_alloc_kib_per_tick": allocated_bytes / 1024.0 / traced_ticks,
+            "gc_collections": gc_collections
+        }
+
+    def run(self) -> dict[str, dict[str, float]]:
+        results: dict[str, dict[str, float]] = {}
+
+        for scene_src in SCENES:
+            for name, scenario in SCENARIOS.items():
+                key: str = f"{os.path.splitext(os.path.basename(scene_src))[0]}/{name}"
+                results[key] = self.run_scenario(scene_src = scene_src, scenario = scenario)
+                print(f"{key}: {results[key]['ticks_per_second']:.1f} ticks/s, p99 {results[key]['p99_tick_ms']:.3f}ms, {results[key]['allocations_per_tick']:.1f} allocations/tick, peak {results[key]['peak_alloc_kib_per_tick']:.2f}KiB/tick")
+
+        return results
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float
+) -> list[str]:
+    """
+    Returns a description of each checked metric that's worse than its baseline by more than [tolerance] (relative).
+    """
+
+    regressions: list[str] = []
+
+    for key, baseline_metrics in baseline.items():
+        if key not in results:
+            continue
+
+        for metric in CHECKED_METRICS:
+            if metric not in baseline_metrics:
+                continue
+
+            value: float = results[key][metric]
+            baseline_value: float = baseline_metrics[metric]
+
+            regressed: bool = value < baseline_value * (1.0 - tolerance) if metric in HIGHER_IS_BETTER else value > baseline_value * (1.0 + tolerance)
+            if regressed:
+                regressions.append(f"{key} {metric}: {value:.3f} (baseline {baseline_value:.3f})")
+
+    return regressions
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Runs scripted gameplay scenarios headless and checks their performance against a baseline.")
+    parser.add_argument("--ticks", type = int, default = 3000, help = "number of physics ticks per scenario")
+    parser.add_argument("--output", default = f"{os.path.dirname(__file__)}/../benchmark_results.json", help = "file to write results to")
+    parser.add_argument("--baseline", default = f"{os.path.dirname(__file__)}/../benchmark_baseline.json", help = "baseline results file")
+    parser.add_argument("--update-baseline", action = "store_true", help = "store results as the new baseline instead of checking them")
+    parser.add_argument("--tolerance", type = float, default = 0.2, help = "relative regression allowed before failing")
+    parser.add_argument("--allow-missing-baseline", action = "store_true", help = "succeed without checking anything if no baseline is found")
+    args: argparse.Namespace = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = Benchmark(ticks = args.ticks).run()
+
+    with open(file = args.output, mode = "w", encoding = "UTF-8") as output:
+        json.dump(results, output, indent = 4)
+
+    if args.update_baseline:
+        with open(file = args.baseline, mode = "w", encoding = "UTF-8") as baseline_file:
+            json.dump(results, baseline_file, indent = 4)
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline found at {args.baseline}, run with --update-baseline to create one")
+        sys.exit(0 if args.allow_missing_baseline else 1)
+
+    with open(file = args.baseline, mode = "r", encoding = "UTF-8") as baseline_file:
+        baseline: dict[str, dict[str, float]] = json.load(baseline_file)
+
+    regressions: list[str] = find_regressions(results = results, baseline = baseline, tolerance = args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    sys.exit(1 if len(regressions) > 0 else 0)
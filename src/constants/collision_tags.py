@@ -1,3 +1,6 @@
+from typing import Iterable
+from typing import Iterator
+
 # Actual player collisions, used for collision resolution.
 PLAYER_COLLISION: str = "player_collision"
 
@@ -28,3 +31,86 @@ INK: str = "ink"
 
 # Collisions with doors to next levels.
 LEVEL_DOOR: str = "level_door"
+
+################################
+# Bit layers.
+################################
+# Bit position of each tag, interned the first time it's seen.
+TAG_BITS: dict[str, int] = {}
+
+# All interned tags, by bit position.
+BIT_TAGS: list[str] = []
+
+# Masks of all tag lists seen so far, by tags.
+TAG_MASKS: dict[tuple[str, ...], "TagMask"] = {}
+
+class TagMask(int):
+    """
+    Bitmask of collision tags, one bit per interned tag.
+    Can be used just like the list of tags it stands for (e.g. `WATER in tags`), so that code checking tags by name keeps working.
+    """
+
+    def __contains__(self, tag: str | int) -> bool:
+        # Masks are checked for any common tag.
+        if isinstance(tag, int):
+            return bool(self & tag)
+
+        # Tags never interned are in no mask.
+        position: int | None = TAG_BITS.get(tag)
+        if position is None:
+            return False
+
+        return bool(self >> position & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        return (tag for position, tag in enumerate(BIT_TAGS) if self >> position & 1)
+
+    def __len__(self) -> int:
+        return self.bit_count()
+
+    def __repr__(self) -> str:
+        return f"TagMask({list(self)})"
+
+def get_bit(tag: str) -> int:
+    """
+    Returns the single bit mask of the provided tag, interning it if never seen before.
+    """
+
+    position: int | None = TAG_BITS.get(tag)
+
+    if position is None:
+        position = len(BIT_TAGS)
+        TAG_BITS[tag] = position
+        BIT_TAGS.append(tag)
+
+    return 1 << position
+
+def get_mask(tags: Iterable[str]) -> TagMask:
+    """
+    Returns the mask of all provided tags, interning any never seen before.
+    """
+
+    key: tuple[str, ...] = tuple(tags)
+    mask: TagMask | None = TAG_MASKS.get(key)
+
+    if mask is None:
+        bits: int = 0
+        for tag in key:
+            bits |= get_bit(tag)
+        mask = TagMask(bits)
+        TAG_MASKS[key] = mask
+
+    return mask
+
+# Bits of all known tags, interned at startup in the same order they're defined in.
+PLAYER_COLLISION_BIT: int = get_bit(PLAYER_COLLISION)
+PLAYER_SENSE_BIT: int = get_bit(PLAYER_SENSE)
+LEG_SENSE_BIT: int = get_bit(LEG_SENSE)
+FISH_SENSE_BIT: int = get_bit(FISH_SENSE)
+PLAYER_INTERACTION_BIT: int = get_bit(PLAYER_INTERACTION)
+FALL_BIT: int = get_bit(FALL)
+WATER_BIT: int = get_bit(WATER)
+GRABBABLE_BIT: int = get_bit(GRABBABLE)
+INTERACTABLE_BIT: int = get_bit(INTERACTABLE)
+INK_BIT: int = get_bit(INK)
+LEVEL_DOOR_BIT: int = get_bit(LEVEL_DOOR)
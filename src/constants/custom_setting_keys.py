@@ -2,4 +2,42 @@
 KEYBOARD_CONTROLS: str = "keyboard_controls"
 
 # Tells whether the user is playing in single player or coop mode.
-SINGLE_PLAYER: str = "single_player"
\ No newline at end of file
+SINGLE_PLAYER: str = "single_player"
+
+# Maximum number of physics ticks performed in a single frame when catching up on accumulated time.
+MAX_PHYSICS_SUBSTEPS: str = "max_physics_substeps"
+
+# What to do with accumulated time that could not be consumed within the maximum number of physics ticks per frame:
+# "drop" discards it, so that the game skips ahead, while "slow" keeps it for later frames (capped), so that the game slows down until it catches up.
+PHYSICS_CATCH_UP_POLICY: str = "physics_catch_up_policy"
+
+# Physics ticks per second, independent of the rendering rate.
+PHYSICS_HZ: str = "physics_hz"
+
+# Rendered frames per second, independent of the physics rate.
+RENDER_HZ: str = "render_hz"
+
+# Path of the file to record all inputs to, per physics tick. No inputs are recorded if empty.
+RECORD_INPUT: str = "record_input"
+
+# Path of a recorded inputs file to replay. No inputs are replayed if empty.
+REPLAY_INPUT: str = "replay_input"
+
+# Number of top allocating call sites, node types and types to report on exit. Allocations are not profiled if 0.
+PROFILE_ALLOCATIONS: str = "profile_allocations"
+
+
+# Time (in milliseconds) spent building or tearing down scenes by each physics step, so that scene changes are spread over multiple frames.
+SCENE_BUILD_BUDGET: str = "scene_build_budget"
+
+# Size (in pixels) of the square regions static scene children are partitioned into.
+REGION_SIZE: str = "region_size"
+
+# Distance (in pixels) beyond the view around each character and camera within which scene regions are active.
+REGION_MARGIN: str = "region_margin"
+
+# Size (in pixels) of the square cells static colliders are indexed in, so that characters are only checked against nearby ones.
+COLLISION_CELL_SIZE: str = "collision_cell_size"
+
+# Memory (in kilobytes) parsed rooms and their decoded images can take before the least recently used rooms are evicted. The current room and its neighbors are always kept.
+WORLD_MEMORY_BUDGET: str = "world_memory_budget"
\ No newline at end of file
@@ -1,4 +1,3 @@
-from typing import Any
 from typing import Callable
 import pyglet
 import pyglet.math as pm
@@ -11,11 +10,14 @@ from amonite.collision.collision_node import CollisionType
 from amonite.collision.collision_shape import CollisionRect
 from amonite.node import PositionNode
 from amonite.sprite_node import SpriteNode
-from amonite.animation import Animation
 from amonite.door_node import DOOR_COLOR
 
+from animation_registry import ANIMATION_REGISTRY
+from asset_preloader import ASSET_PRELOADER
 from constants import collision_tags
 from constants import uniques
+from utils.utils import move_to_batch
+from utils.utils import pause_animations
 
 class DoorNode(PositionNode):
     def __init__(
@@ -28,7 +30,7 @@ class DoorNode(PositionNode):
         anchor_x: int = 0,
         anchor_y: int = 0,
         destination: str = "",
-        on_triggered: Callable[[None], None] | None = None,
+        on_triggered: Callable[[int, CollisionNode, bool], None] | None = None,
         batch: pyglet.graphics.Batch | None = None
     ) -> None:
         super().__init__(
@@ -37,13 +39,13 @@ class DoorNode(PositionNode):
             z = z
         )
 
-        self.__door_closed_img: pimg.Animation = Animation(source = "sprites/door/door_closed.json").content
-        self.__door_open_img: pimg.Animation = Animation(source = "sprites/door/door_open.json").content
-        self.__door_opening_img: pimg.Animation = Animation(source = "sprites/door/door_opening.json").content
+        self.__door_closed_img: pimg.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/door/door_closed.json").content
+        self.__door_open_img: pimg.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/door/door_open.json").content
+        self.__door_opening_img: pimg.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/door/door_opening.json").content
 
-        self.__light_bulb_off_img: pimg.Animation = Animation(source = "sprites/lightbulbs/lightbulb_off.json").content
-        self.__light_bulb_red_img: pimg.Animation = Animation(source = "sprites/lightbulbs/lightbulb_red.json").content
-        self.__light_bulb_purple_img: pimg.Animation = Animation(source = "sprites/lightbulbs/lightbulb_purple.json").content
+        self.__light_bulb_off_img: pimg.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/lightbulbs/lightbulb_off.json").content
+        self.__light_bulb_red_img: pimg.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/lightbulbs/lightbulb_red.json").content
+        self.__light_bulb_purple_img: pimg.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/lightbulbs/lightbulb_purple.json").content
 
         self.__red_light_offset: pm.Vec2 = pm.Vec2(-8.0, 42.0)
         self.__purple_light_offset: pm.Vec2 = pm.Vec2(8.0, 42.0)
@@ -95,7 +97,7 @@ class DoorNode(PositionNode):
         self.add_component(self.collider)
         controllers.COLLISION_CONTROLLER.add_collider(self.collider)
 
-        self.__on_triggered: Callable[[list[str], Any, bool], None] | None = on_triggered
+        self.__on_triggered: Callable[[int, CollisionNode, bool], None] | None = on_triggered
 
         self.__fish_sensed: bool = False
         self.__leg_sensed: bool = False
@@ -105,6 +107,41 @@ class DoorNode(PositionNode):
 
         self.__destination: str = destination
 
+    def reset(
+        self,
+        x: float,
+        y: float,
+        destination: str = "",
+        on_triggered: Callable[[int, CollisionNode, bool], None] | None = None
+    ) -> None:
+        """
+        Closes the door at the provided position and registers its collider again, as if just created.
+        The collider shape is kept as it is.
+        """
+
+        self.__sprite.set_image(self.__door_closed_img)
+        self.__red_light_sprite.set_image(self.__light_bulb_off_img)
+        self.__purple_light_sprite.set_image(self.__light_bulb_off_img)
+
+        self.set_position((x, y))
+        controllers.COLLISION_CONTROLLER.add_collider(self.collider)
+
+        self.__on_triggered = on_triggered
+
+        self.__fish_sensed = False
+        self.__leg_sensed = False
+
+        self.__open = False
+        self.__opening = False
+
+        self.__destination = destination
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        move_to_batch(self, batch = batch)
+
+    def set_paused(self, paused: bool) -> None:
+        pause_animations(self, paused = paused)
+
     def __on_sprite_animation_end(self) -> None:
         if self.__opening:
             self.__sprite.set_image(self.__door_open_img)
@@ -113,16 +150,23 @@ class DoorNode(PositionNode):
             return
 
         if self.__open:
-            uniques.NEXT_SCENE_SRC = f"scenes/{self.__destination}.json"
+            uniques.NEXT_SCENE_SRC = self.__get_destination_src()
             return
 
-    def __on_collision_triggered(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
-        if collision_tags.FISH_SENSE in tags:
+    def __get_destination_src(self) -> str:
+        return f"scenes/{self.__destination}.json"
+
+    def __on_collision_triggered(self, tags: int, collider: CollisionNode, entered: bool) -> None:
+        if tags & collision_tags.FISH_SENSE_BIT:
             self.__fish_sensed = entered
 
-        if collision_tags.LEG_SENSE in tags:
+        if tags & collision_tags.LEG_SENSE_BIT:
             self.__leg_sensed = entered
 
+        # Start reading and decoding the destination scene in the background as soon as any character approaches, so that it's ready once the door opens.
+        if entered and self.__destination:
+            ASSET_PRELOADER.request(scene_src = self.__get_destination_src())
+
     def update(self, dt: float) -> None:
         super().update(dt = dt)
 
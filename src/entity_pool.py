@@ -0,0 +1,71 @@
+from collections import deque
+from typing import Hashable
+import pyglet
+
+from amonite.node import Node
+
+class EntityPool:
+    """
+    Pool of scene children (e.g. characters, doors and buttons), reused when their scene is reset or another scene is built.
+    Children are only created when no released one of the same kind is available: after that they're just moved to the requested batch, reset and repositioned.
+    Pooled children are expected to provide set_batch() and set_paused(), moving all their sprites and collider shapes to a batch and pausing all their animations respectively.
+    """
+
+    def __init__(self) -> None:
+        # Released children, by kind, in release order.
+        self.__free: dict[Hashable, deque[Node]] = {}
+
+        # Batch holding all released children's sprites and collider shapes, never drawn.
+        self.__batch: pyglet.graphics.Batch = pyglet.graphics.Batch()
+
+    def acquire(
+        self,
+        kind: Hashable,
+        batch: pyglet.graphics.Batch
+    ) -> Node | None:
+        """
+        Moves the earliest released child of the provided kind to the provided batch and returns it, or returns None if there's none.
+        The returned child still needs to be reset before use.
+        """
+
+        free: deque[Node] | None = self.__free.get(kind)
+
+        if free is None or len(free) <= 0:
+            return None
+
+        child: Node = free.popleft()
+
+        # Resume animations before the child is reset, since pyglet keeps animations set on paused sprites running while still flagging them as paused.
+        child.set_batch(batch = batch)
+        child.set_paused(paused = False)
+
+        return child
+
+    def release(
+        self,
+        kind: Hashable,
+        child: Node
+    ) -> None:
+        """
+        Makes the provided child available for reuse, by hiding it and pausing all its animations.
+        The child should already be detached from its scene and its colliders from the collision controller.
+        """
+
+        child.set_paused(paused = True)
+        child.set_batch(batch = self.__batch)
+
+        self.__free.setdefault(kind, deque()).append(child)
+
+    def clear(self) -> None:
+        """
+        Deletes all released children. Should be called whenever they're not going to be reused anymore.
+        """
+
+        for free in self.__free.values():
+            for child in free:
+                child.delete()
+
+        self.__free.clear()
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self.__free.values())
@@ -14,11 +14,16 @@ from amonite.collision.collision_node import CollisionMethod
 from amonite.settings import GLOBALS
 from amonite.settings import Keys
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import collision_tags
 from constants import uniques
+from render_interpolation import RENDER_INTERPOLATOR
 from interactable.interactor import Interactor
 from grabbable.grabbable import Grabbable
 from fish.ink.ink_node import InkNode
+from utils.utils import move_to_batch
+from utils.utils import pause_animations
+from utils.utils import reset_collider
 
 
 class FishDataNode(PositionNode, Grabbable):
@@ -61,6 +66,9 @@ class FishDataNode(PositionNode, Grabbable):
         self.heading: float = 0.0
         self.ink: InkNode | None = None
 
+        # Inks shot and possibly still flying or splatting in the active scene.
+        self.__shot_inks: list[InkNode] = []
+
 
         ################################
         # Input movement.
@@ -69,6 +77,10 @@ class FishDataNode(PositionNode, Grabbable):
         self.max_move_speed: float = 80.0
         self.move_accel: float = 400.0
         self.heading: float = 0.0
+        # Move speed change made by acceleration over the current tick.
+        # move() applies the average speed over the tick (trapezoidal rule) instead of the speed at its end, so that positions don't depend on the physics rate.
+        # The change is dropped once applied, so that ticks with no acceleration move at constant speed.
+        self.move_step: pm.Vec2 = pm.Vec2(0.0, 0.0)
         ################################
         ################################
 
@@ -79,6 +91,8 @@ class FishDataNode(PositionNode, Grabbable):
         self.gravity_vec: pm.Vec2 = pm.Vec2(0.0, 0.0)
         self.target_gravity_speed: float = math.inf
         self.gravity_accel: pm.Vec2 = pm.Vec2(0.0, -800.0)
+        # Gravity speed change over the current tick, averaged just like move_step.
+        self.gravity_step: pm.Vec2 = pm.Vec2(0.0, 0.0)
         ################################
         ################################
 
@@ -98,6 +112,8 @@ class FishDataNode(PositionNode, Grabbable):
         self.aim_vec: pm.Vec2 = pm.Vec2(0.0, 0.0)
         self.ink_offset: pm.Vec2 = pm.Vec2(16.0, 16.0)
 
+        self.__fetch_ink_animations()
+
 
         self.__interactor: Interactor = Interactor(
             sensor_shape = CollisionRect(
@@ -116,12 +132,13 @@ class FishDataNode(PositionNode, Grabbable):
         # Sprite
         ################################
         self.sprite: SpriteNode = SpriteNode(
-            resource = Animation(source = "sprites/fish/dumbo_swim.json").content,
+            resource = ANIMATION_REGISTRY.fetch(source = "sprites/fish/dumbo_swim.json").content,
             y_sort = False,
             on_animation_end = on_sprite_animation_end,
             batch = batch
         )
         self.add_component(self.sprite)
+        RENDER_INTERPOLATOR.register(self.sprite)
         ################################
         ################################
 
@@ -205,8 +222,8 @@ class FishDataNode(PositionNode, Grabbable):
 
         self.target_gravity_speed = math.inf
 
-    def on_collision(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
-        if collision_tags.WATER not in tags:
+    def on_collision(self, tags: int, collider: CollisionNode, entered: bool) -> None:
+        if not tags & collision_tags.WATER_BIT:
             return
 
         # Remove vertical movement.
@@ -228,7 +245,7 @@ class FishDataNode(PositionNode, Grabbable):
 
             return
 
-    def on_ground_collision(self, tags: list[str], collider_id: int, entered: bool) -> None:
+    def on_ground_collision(self, tags: int, collider_id: int, entered: bool) -> None:
         if entered:
             self.__ground_collision_ids.add(collider_id)
         else:
@@ -244,7 +261,7 @@ class FishDataNode(PositionNode, Grabbable):
         if self.grounded:
             self.gravity_vec *= 0.0
 
-    def on_interactable_found(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
+    def on_interactable_found(self, tags: int, collider: CollisionNode, entered: bool) -> None:
         if (collider.owner is not None):
             if entered:
                 self.__interactables.add(collider.owner)
@@ -266,6 +283,18 @@ class FishDataNode(PositionNode, Grabbable):
         if uniques.ACTIVE_SCENE is not None:
             uniques.ACTIVE_SCENE.add_child(self.ink)
 
+    def __fetch_ink_animations(self) -> None:
+        """
+        Ink is spawned mid scene, so make sure its animations are already loaded by then and kept across scene changes.
+        """
+
+        for ink_animation_src in (
+            "sprites/fish/ink_fly.json",
+            "sprites/fish/ink_splat.json",
+            "sprites/fish/ink_parabola.json"
+        ):
+            ANIMATION_REGISTRY.fetch(source = ink_animation_src)
+
     def delete_ink(self) -> None:
         # Restore aim vector since there can be no aiming with no ink (for now).
         self.aim_vec *= 0.0
@@ -302,8 +331,25 @@ class FishDataNode(PositionNode, Grabbable):
             return
 
         self.ink.release()
+
+        # Forget inks already done, since they delete themselves.
+        self.__shot_inks = [ink for ink in self.__shot_inks if uniques.ACTIVE_SCENE is not None and uniques.ACTIVE_SCENE.contains(ink)]
+        self.__shot_inks.append(self.ink)
+
         self.ink = None
 
+    def delete_shot_inks(self) -> None:
+        """
+        Deletes all shot inks still in the active scene, so that none outlives the fish.
+        """
+
+        for ink in self.__shot_inks:
+            if uniques.ACTIVE_SCENE is not None and uniques.ACTIVE_SCENE.contains(ink):
+                uniques.ACTIVE_SCENE.remove_child(ink)
+                ink.delete()
+
+        self.__shot_inks.clear()
+
     def toggle_grab(self, toggle: bool) -> None:
         Grabbable.toggle_grab(self, toggle)
 
@@ -343,8 +389,69 @@ class FishDataNode(PositionNode, Grabbable):
         # Flip sprite if moving to the left.
         self.sprite.set_scale(x_scale = self.__hor_facing)
 
+    def reset(self, x: float, y: float) -> None:
+        """
+        Restores the initial state at the provided position and registers all colliders again, as if just created.
+        """
+
+        self.delete_ink()
+        self.delete_shot_inks()
+
+        # Fetch ink animations again, since the fish may be reused by another scene.
+        self.__fetch_ink_animations()
+
+        self.__hor_facing = 1
+        self.heading = 0.0
+        self.grabbed = False
+
+        self.move_vec = pm.Vec2(0.0, 0.0)
+        self.move_step = pm.Vec2(0.0, 0.0)
+        self.gravity_vec = pm.Vec2(0.0, 0.0)
+        self.target_gravity_speed = math.inf
+        self.gravity_step = pm.Vec2(0.0, 0.0)
+        self.aim_vec = pm.Vec2(0.0, 0.0)
+
+        self.__ground_collision_ids.clear()
+        self.__interactables.clear()
+        self.grounded = False
+        self.in_water = False
+
+        self.set_position((x, y))
+        self.sprite.set_scale(x_scale = self.__hor_facing)
+        RENDER_INTERPOLATOR.register(self.sprite)
+
+        # Register all colliders in the same order as on creation, since it drives collision resolution order.
+        self.__interactor.reset()
+        reset_collider(self.__collider, position = (x, y))
+        reset_collider(self.__ground_sensor)
+        controllers.COLLISION_CONTROLLER.add_collider(self.__collider)
+        controllers.COLLISION_CONTROLLER.add_collider(self.__ground_sensor)
+        controllers.COLLISION_CONTROLLER.add_collider(self.__grab_trigger)
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        """
+        Moves the sprite and all colliders to the provided batch, along with all inks and prompts spawned from now on.
+        Inks already spawned live in the previous batch and scene, so they're deleted.
+        """
+
+        if batch is self.__batch:
+            return
+
+        self.delete_ink()
+        self.delete_shot_inks()
+
+        self.__batch = batch
+        self.__interactor.set_batch(batch = batch)
+        move_to_batch(self, batch = batch)
+        move_to_batch(self.__collider, batch = batch)
+
+    def set_paused(self, paused: bool) -> None:
+        pause_animations(self, paused = paused)
+
     def delete(self) -> None:
         self.delete_ink()
+        self.delete_shot_inks()
+        RENDER_INTERPOLATOR.unregister(self.sprite)
         self.__collider.delete()
         super().delete()
 
@@ -367,6 +474,7 @@ class FishDataNode(PositionNode, Grabbable):
     ) -> None:
         target_speed: float = 0.0
 
+        previous_move_vec: pm.Vec2 = self.move_vec
         current_speed: float = self.move_vec.length()
 
         # Set target speed and heading from input move vector.
@@ -390,10 +498,15 @@ class FishDataNode(PositionNode, Grabbable):
             angle = self.heading
         )
 
+        self.move_step = self.move_vec - previous_move_vec
+
     def compute_gravity_speed(self, dt: float) -> None:
         if self.grounded:
+            self.gravity_step = pm.Vec2(0.0, 0.0)
             return
 
+        previous_gravity_vec: pm.Vec2 = self.gravity_vec
+
         if self.gravity_vec.length() < self.target_gravity_speed:
             # Accelerate when not grounded.
             self.gravity_vec += self.gravity_accel * self.get_gravity_dampening() * dt
@@ -410,14 +523,18 @@ class FishDataNode(PositionNode, Grabbable):
             angle = self.gravity_vec.heading()
         )
 
+        self.gravity_step = self.gravity_vec - previous_gravity_vec
+
     def move(self, dt: float) -> None:
         # Apply movement after collision.
         self.set_position(self.__collider.get_position())
 
-        velocity: pm.Vec2 = self.move_vec
+        # Use the average movement and gravity speeds over the tick.
+        velocity: pm.Vec2 = self.move_vec - self.move_step * 0.5
+        self.move_step = pm.Vec2(0.0, 0.0)
 
         if not self.grabbed:
-            velocity += self.gravity_vec
+            velocity += self.gravity_vec - self.gravity_step * 0.5
 
         if velocity.length() > 0.0:
             self.heading = velocity.heading()
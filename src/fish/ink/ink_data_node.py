@@ -14,8 +14,10 @@ from amonite.settings import SETTINGS
 from amonite.settings import GLOBALS
 from amonite.settings import Keys
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import collision_tags
 from constants import uniques
+from render_interpolation import RENDER_INTERPOLATOR
 from parabola import Parabola
 
 
@@ -44,6 +46,8 @@ class InkDataNode(PositionNode):
         self.move_vec: pm.Vec2 = pm.Vec2(0.0, 0.0)
         self.max_move_speed: float = 80.0
         self.move_accel: float = 20.0
+        # Flight speed lost over the current tick, only applied once (see move()).
+        self.move_step: pm.Vec2 = pm.Vec2(0.0, 0.0)
         ################################
         ################################
 
@@ -54,6 +58,8 @@ class InkDataNode(PositionNode):
         self.gravity_vec: pm.Vec2 = pm.Vec2(0.0, 0.0)
         self.target_gravity_speed: float = math.inf
         self.gravity_accel: pm.Vec2 = pm.Vec2(0.0, -300.0)
+        # Gravity speed change over the current tick, so that ink arcs don't depend on the physics rate.
+        self.gravity_step: pm.Vec2 = pm.Vec2(0.0, 0.0)
         ################################
         ################################
 
@@ -73,7 +79,7 @@ class InkDataNode(PositionNode):
         # Sprite
         ################################
         self.__sprite: SpriteNode = SpriteNode(
-            resource = Animation(source = "sprites/fish/ink_fly.json").content,
+            resource = ANIMATION_REGISTRY.fetch(source = "sprites/fish/ink_fly.json").content,
             x = 0.0,
             y = 0.0,
             z = 0.0,
@@ -82,6 +88,7 @@ class InkDataNode(PositionNode):
             batch = batch
         )
         self.add_component(self.__sprite)
+        RENDER_INTERPOLATOR.register(self.__sprite)
         ################################
         ################################
 
@@ -118,13 +125,13 @@ class InkDataNode(PositionNode):
         ################################
         ################################
 
-    def on_collision(self, tags: list[str], collider_id: int, entered: bool) -> None:
+    def on_collision(self, tags: int, collider_id: int, entered: bool) -> None:
         if self.__on_collision is not None:
             self.__on_collision(tags, collider_id, entered)
 
     def spawn_parabola(self) -> None:
         self.parabola = Parabola(
-            sprite_resource = Animation(source = "sprites/fish/ink_parabola.json").content,
+            sprite_resource = ANIMATION_REGISTRY.fetch(source = "sprites/fish/ink_parabola.json").content,
             gravity = self.gravity_accel.length(),
             batch = self.__batch
         )
@@ -146,6 +153,7 @@ class InkDataNode(PositionNode):
         self.parabola = None
 
     def delete(self) -> None:
+        RENDER_INTERPOLATOR.unregister(self.__sprite)
         controllers.COLLISION_CONTROLLER.remove_collider(self.__collider)
         self.__collider.delete()
 
@@ -170,6 +178,7 @@ class InkDataNode(PositionNode):
         target_speed: float = 0.0
         target_heading: float = self.move_vec.heading()
 
+        previous_move_vec: pm.Vec2 = self.move_vec
         current_speed: float = self.move_vec.length()
 
         if self.move_vec.length() < target_speed:
@@ -188,10 +197,15 @@ class InkDataNode(PositionNode):
             angle = target_heading
         )
 
+        self.move_step = self.move_vec - previous_move_vec
+
     def compute_gravity_speed(self, dt: float) -> None:
         if self.grounded:
+            self.gravity_step = pm.Vec2(0.0, 0.0)
             return
 
+        previous_gravity_vec: pm.Vec2 = self.gravity_vec
+
         if self.gravity_vec.length() < self.target_gravity_speed:
             # Accelerate when not grounded.
             self.gravity_vec += self.gravity_accel * dt
@@ -208,12 +222,15 @@ class InkDataNode(PositionNode):
             angle = self.gravity_vec.heading()
         )
 
+        self.gravity_step = self.gravity_vec - previous_gravity_vec
+
     def move(self, dt: float) -> None:
         # Apply movement after collision.
         self.set_position(self.__collider.get_position())
 
-        # Sum movement with gravity.
-        velocity: pm.Vec2 = self.move_vec + self.gravity_vec
+        # Use the average movement and gravity speeds over the tick.
+        velocity: pm.Vec2 = self.move_vec - self.move_step * 0.5 + self.gravity_vec - self.gravity_step * 0.5
+        self.move_step = pm.Vec2(0.0, 0.0)
 
         if velocity.length() > 0.0:
             self.heading = velocity.heading()
@@ -92,5 +92,5 @@ class InkNode(PositionNode):
     def on_sprite_animation_end(self):
         self.__state_machine.on_animation_end()
 
-    def on_collision(self, tags: list[str], collider_id: int, entered: bool):
+    def on_collision(self, tags: int, collider_id: int, entered: bool):
         self.__state_machine.on_collision(tags = tags, enter = entered)
\ No newline at end of file
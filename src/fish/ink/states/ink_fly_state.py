@@ -2,6 +2,7 @@ import pyglet.math as pm
 
 from amonite.animation import Animation
 
+from animation_registry import ANIMATION_REGISTRY
 from fish.ink.ink_data_node import InkDataNode
 from fish.ink.states.ink_state import InkState
 from fish.ink.states.ink_state import InkStates
@@ -15,7 +16,7 @@ class InkFlyState(InkState):
             actor = actor,
         )
 
-        self.__animation: Animation = Animation(source = "sprites/fish/ink_fly.json")
+        self.__animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/ink_fly.json")
 
         self.__collided: bool = False
 
@@ -40,6 +41,6 @@ class InkFlyState(InkState):
             self.actor.gravity_vec *= 0.0
             return InkStates.SPLAT
         
-    def on_collision(self, tags: list[str], enter: bool) -> None:
+    def on_collision(self, tags: int, enter: bool) -> None:
         # TODO Check for the right collision tags.
         self.__collided = True
\ No newline at end of file
@@ -1,5 +1,6 @@
 from amonite.animation import Animation
 
+from animation_registry import ANIMATION_REGISTRY
 from fish.ink.ink_data_node import InkDataNode
 from fish.ink.states.ink_state import InkState
 
@@ -12,7 +13,7 @@ class InkSplatState(InkState):
             actor = actor,
         )
 
-        self.__animation: Animation = Animation(source = "sprites/fish/ink_splat.json")
+        self.__animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/ink_splat.json")
 
         self.__animation_ended: bool = False
 
@@ -7,6 +7,7 @@ from amonite.animation import Animation
 from amonite import controllers
 from amonite.input_controller import ControllerStick
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import custom_setting_keys
 from constants import uniques
 from fish.fish_data_node import FishDataNode
@@ -25,7 +26,7 @@ class FishDashState(FishState):
         )
 
         # Animation.
-        self.__animation: Animation = Animation(source = "sprites/fish/dumbo_swim_dash.json")
+        self.__animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/dumbo_swim_dash.json")
         self.__startup: bool = False
         self.__animation_ended: bool = False
 
@@ -85,6 +86,9 @@ class FishDashState(FishState):
                 angle = self.actor.heading
             )
 
+            # The dash speed applies from the start of the tick.
+            self.actor.move_step = pm.Vec2(0.0, 0.0)
+
         # Move the player.
         self.actor.move(dt = dt)
 
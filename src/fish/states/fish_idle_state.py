@@ -8,6 +8,7 @@ import amonite.controllers as controllers
 from amonite.input_controller import ControllerButton
 from amonite.input_controller import ControllerStick
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import custom_setting_keys
 from constants import uniques
 from fish.fish_data_node import FishDataNode
@@ -25,8 +26,8 @@ class FishIdleState(FishState):
             input_enabled = input_enabled
         )
 
-        self.__land_animation: Animation = Animation(source = "sprites/fish/dumbo_land_idle.json")
-        self.__midair_animation: Animation = Animation(source = "sprites/fish/dumbo_swim.json")
+        self.__land_animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/dumbo_land_idle.json")
+        self.__midair_animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/dumbo_swim.json")
         self.__animation: Animation = self.__land_animation if self.actor.grounded else self.__midair_animation
 
         # Inputs.
@@ -8,6 +8,7 @@ import amonite.controllers as controllers
 from amonite.input_controller import ControllerButton
 from amonite.input_controller import ControllerStick
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import custom_setting_keys
 from constants import uniques
 from fish.fish_data_node import FishDataNode
@@ -28,8 +29,8 @@ class FishShootLoadState(FishState):
         ########################
         # Animation.
         ########################
-        self.__preload_animation: Animation = Animation(source = "sprites/fish/dumbo_shoot_preload.json")
-        self.__load_animation: Animation = Animation(source = "sprites/fish/dumbo_shoot_load.json")
+        self.__preload_animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/dumbo_shoot_preload.json")
+        self.__load_animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/dumbo_shoot_load.json")
         ########################
         ########################
 
@@ -1,5 +1,6 @@
 from amonite.animation import Animation
 
+from animation_registry import ANIMATION_REGISTRY
 from fish.fish_data_node import FishDataNode
 from fish.states.fish_state import FishStates
 from fish.states.fish_state import FishState
@@ -15,7 +16,7 @@ class FishShootState(FishState):
             input_enabled = input_enabled
         )
 
-        self.__animation: Animation = Animation(source = "sprites/fish/dumbo_idle.json")
+        self.__animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/dumbo_idle.json")
 
         # Other.
         self.__animation_ended: bool = False
@@ -8,6 +8,7 @@ import amonite.controllers as controllers
 from amonite.input_controller import ControllerButton
 from amonite.input_controller import ControllerStick
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import custom_setting_keys
 from constants import uniques
 from fish.fish_data_node import FishDataNode
@@ -26,7 +27,7 @@ class FishSwimState(FishState):
         )
 
         # Animation.
-        self.__animation: Animation = Animation(source = "sprites/fish/dumbo_swim.json")
+        self.__animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/fish/dumbo_swim.json")
 
         # Input.
         self.__move_vec: pyglet.math.Vec2 = pyglet.math.Vec2()
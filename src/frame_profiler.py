@@ -0,0 +1,196 @@
+from collections import deque
+import time
+import pyglet
+
+# Profiled sections.
+INPUT: str = "input"
+SCENE: str = "scene"
+GLOBAL_INPUT: str = "global_input"
+COLLISIONS: str = "collisions"
+TRIGGERS: str = "triggers"
+DRAW: str = "draw"
+UPSCALE: str = "upscale"
+
+SECTIONS: tuple[str, ...] = (
+    INPUT,
+    SCENE,
+    GLOBAL_INPUT,
+    COLLISIONS,
+    TRIGGERS,
+    DRAW,
+    UPSCALE
+)
+
+class ProfilerSection:
+    """
+    Accumulates the time spent in a single section of code over the current frame.
+    Can be used as a context manager or through explicit start() and stop() calls.
+    """
+
+    __slots__ = (
+        "frame_time",
+        "__start_time"
+    )
+
+    def __init__(self) -> None:
+        self.frame_time: float = 0.0
+        self.__start_time: float = 0.0
+
+    def start(self) -> None:
+        self.__start_time = time.perf_counter()
+
+    def stop(self) -> None:
+        self.frame_time += time.perf_counter() - self.__start_time
+
+    def __enter__(self) -> None:
+        self.start()
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.stop()
+
+class FrameProfiler:
+    """
+    Times separate sections of each frame and keeps the last [history] frames in ring buffers.
+    """
+
+    def __init__(
+        self,
+        sections: tuple[str, ...] = SECTIONS,
+        history: int = 240
+    ) -> None:
+        self.__sections: dict[str, ProfilerSection] = {name: ProfilerSection() for name in sections}
+
+        # Ring buffers of per frame timings, one for each section, plus one for whole frames.
+        self.history: int = history
+        self.section_times: dict[str, deque[float]] = {name: deque(maxlen = history) for name in sections}
+        self.frame_times: deque[float] = deque(maxlen = history)
+
+        self.__last_frame_time: float | None = None
+
+    def section(self, name: str) -> ProfilerSection:
+        """
+        Returns the section with the provided name, to be used as a context manager around the code to time.
+        """
+
+        return self.__sections[name]
+
+    def end_frame(self) -> None:
+        """
+        Stores all section timings accumulated so far as a single frame and starts a new one.
+        """
+
+        for name, section in self.__sections.items():
+            self.section_times[name].append(section.frame_time)
+            section.frame_time = 0.0
+
+        current_time: float = time.perf_counter()
+        if self.__last_frame_time is not None:
+            self.frame_times.append(current_time - self.__last_frame_time)
+        self.__last_frame_time = current_time
+
+    def get_percentile(self, samples: deque[float], percentile: float) -> float:
+        """
+        Returns the provided percentile (0 to 100) of the provided samples, using the nearest rank method.
+        """
+
+        if len(samples) <= 0:
+            return 0.0
+
+        sorted_samples: list[float] = sorted(samples)
+        rank: int = max(int(round(percentile / 100.0 * len(sorted_samples))) - 1, 0)
+        return sorted_samples[rank]
+
+    def get_report(self) -> str:
+        """
+        Returns a textual report of mean, 50th, 99th percentile and max timings for all sections and for whole frames, in milliseconds.
+        """
+
+        lines: list[str] = []
+
+        for name, samples in [*self.section_times.items(), ("frame", self.frame_times)]:
+            mean: float = sum(samples) / len(samples) if len(samples) > 0 else 0.0
+            lines.append(
+                f"{name:<12} avg {mean * 1000:6.2f} p50 {self.get_percentile(samples, 50.0) * 1000:6.2f} p99 {self.get_percentile(samples, 99.0) * 1000:6.2f} max {max(samples, default = 0.0) * 1000:6.2f}"
+            )
+
+        return "\n".join(lines)
+
+class FrameProfilerOverlay:
+    """
+    Draws profiler readouts and a frame time graph.
+    """
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        x: float,
+        y: float,
+        scaling: int = 1,
+        graph_height: float = 32.0,
+        # Frame time (in seconds) corresponding to the full graph height.
+        graph_max_time: float = 1.0 / 30.0,
+        # Number of frames between text refreshes, since text layout is expensive.
+        refresh_frames: int = 15
+    ) -> None:
+        self.__profiler: FrameProfiler = profiler
+        self.__graph_height: float = graph_height * scaling
+        self.__graph_max_time: float = graph_max_time
+        self.__refresh_frames: int = refresh_frames
+        self.__frames: int = 0
+
+        self.__batch: pyglet.graphics.Batch = pyglet.graphics.Batch()
+
+        self.__background: pyglet.shapes.Rectangle = pyglet.shapes.Rectangle(
+            x = x,
+            y = y,
+            width = profiler.history * scaling,
+            height = self.__graph_height,
+            color = (0x00, 0x00, 0x00, 0x7F),
+            batch = self.__batch
+        )
+
+        # One bar per frame, most recent frames to the right.
+        self.__bars: list[pyglet.shapes.Rectangle] = [
+            pyglet.shapes.Rectangle(
+                x = x + index * scaling,
+                y = y,
+                width = scaling,
+                height = 0,
+                color = (0x00, 0xFF, 0x00, 0xFF),
+                batch = self.__batch
+            ) for index in range(profiler.history)
+        ]
+
+        self.__label: pyglet.text.Label = pyglet.text.Label(
+            text = "",
+            font_name = "monospace",
+            font_size = 4 * scaling,
+            x = x,
+            y = y + self.__graph_height + 2 * scaling,
+            width = profiler.history * 2 * scaling,
+            anchor_y = "bottom",
+            multiline = True,
+            color = (0xFF, 0xFF, 0xFF, 0xFF),
+            batch = self.__batch
+        )
+
+    def __update_graph(self) -> None:
+        frame_times: deque[float] = self.__profiler.frame_times
+        offset: int = len(self.__bars) - len(frame_times)
+
+        for index, frame_time in enumerate(frame_times):
+            bar: pyglet.shapes.Rectangle = self.__bars[offset + index]
+            bar.height = min(frame_time / self.__graph_max_time, 1.0) * self.__graph_height
+
+            # Frames slower than the graph max time are highlighted.
+            bar.color = (0xFF, 0x00, 0x00, 0xFF) if frame_time > self.__graph_max_time else (0x00, 0xFF, 0x00, 0xFF)
+
+    def draw(self) -> None:
+        if self.__frames % self.__refresh_frames == 0:
+            self.__label.text = self.__profiler.get_report()
+        self.__frames += 1
+
+        self.__update_graph()
+        self.__batch.draw()
+
+FRAME_PROFILER: FrameProfiler = FrameProfiler()
@@ -43,8 +43,7 @@ class GlobalInputNode(Node):
         if scene_composer.SCENE_COMPOSER is None:
             return
 
-        if uniques.ACTIVE_SCENE_SRC is not None:
-            scene_composer.SCENE_COMPOSER.load_scene(uniques.ACTIVE_SCENE_SRC)
+        scene_composer.SCENE_COMPOSER.reset_scene()
 
     def __switch_characters(self) -> None:
         if uniques.FISH is None or uniques.LEG is None:
@@ -4,16 +4,18 @@ import pyglet.math as pm
 import amonite.controllers as controllers
 from amonite.node import PositionNode
 from amonite.sprite_node import SpriteNode
-from amonite.animation import Animation
 from amonite.collision.collision_node import CollisionNode
 from amonite.collision.collision_node import CollisionType
 from amonite.collision.collision_shape import CollisionShape
 from amonite.collision.collision_shape import CollisionRect
 from amonite.collision.collision_node import CollisionMethod
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import collision_tags
-from constants import uniques
 from grabbable.grabbable import Grabbable
+from prompt_pool import PROMPT_POOL
+from utils.utils import move_to_batch
+from utils.utils import reset_collider
 
 class Grabber(PositionNode):
     def __init__(
@@ -35,6 +37,7 @@ class Grabber(PositionNode):
         self.__button_offset: pm.Vec2 = pm.Vec2(0.0, 32.0)
         self.__grabbable_offset: pm.Vec2 = pm.Vec2(0.0, 26.0)
 
+        self.__button_signal_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/button_icon/button_icon.json").content
         self.__button_signal: SpriteNode | None = None
 
         self.__grab_sensor: CollisionNode = CollisionNode(
@@ -69,21 +72,23 @@ class Grabber(PositionNode):
 
         self.toggle_grabbable_button()
 
+        if self.__button_signal is not None:
+            self.__button_signal.set_position(position = self.__get_button_position())
+
     def __turn_button_signal_on(self) -> None:
         if self.__button_signal is None:
-            self.__button_signal = self.__build_button_signal()
-            self.add_component(self.__button_signal)
+            self.__button_signal = PROMPT_POOL.acquire(
+                image = self.__button_signal_img,
+                position = self.__get_button_position(),
+                batch = self.__batch
+            )
 
     def __turn_button_signal_off(self) -> None:
         if self.__button_signal is not None:
-            if uniques.ACTIVE_SCENE is not None:
-                uniques.ACTIVE_SCENE.remove_child(self.__button_signal)
-            # TODO Amonite's PositionNode should expose a "remove_component" mehtod.
-            self.components.remove(self.__button_signal)
-            self.__button_signal.delete()
+            PROMPT_POOL.release(self.__button_signal, batch = self.__batch)
             self.__button_signal = None
 
-    def on_grabbable_found(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
+    def on_grabbable_found(self, tags: int, collider: CollisionNode, entered: bool) -> None:
         if collider.owner is None:
             return
 
@@ -137,11 +142,41 @@ class Grabber(PositionNode):
     def is_grabbing(self) -> bool:
         return self.__grabbed is not None
 
-    def __build_button_signal(self) -> SpriteNode:
-        return SpriteNode(
-            resource = Animation(source = "sprites/button_icon/button_icon.json").content,
-            x = self.__button_offset.x,
-            y = self.__button_offset.y,
-            y_sort = False,
-            batch = self.__batch
+    def reset(self) -> None:
+        """
+        Forgets all perceived grabbables and registers the grab sensor again, as if just created.
+        Any grabbed object is just forgotten, not dropped, since it's expected to be reset as well.
+        """
+
+        self.__turn_button_signal_off()
+
+        self.__grabbables.clear()
+        self.__grabbed = None
+        self.__on = True
+
+        reset_collider(self.__grab_sensor)
+        controllers.COLLISION_CONTROLLER.add_collider(self.__grab_sensor)
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        """
+        Moves the grab sensor to the provided batch, along with all prompts shown from now on.
+        Any prompt shown in the previous batch is handed back, so that it's shown again in the new one on the next update.
+        """
+
+        self.__turn_button_signal_off()
+        self.__batch = batch
+
+        move_to_batch(self, batch = batch)
+
+    def delete(self) -> None:
+        # The button signal is owned by the prompt pool, so just hand it back.
+        self.__turn_button_signal_off()
+
+        super().delete()
+
+    def __get_button_position(self) -> tuple[float, float]:
+        position: tuple[float, float] = self.get_position()
+        return (
+            position[0] + self.__button_offset.x,
+            position[1] + self.__button_offset.y
         )
\ No newline at end of file
@@ -0,0 +1,198 @@
+import argparse
+import os
+import time
+import pyglet
+
+# Headless mode must be set before any window module is imported: it provides an offscreen (EGL) GL context, so that no display is needed at all.
+pyglet.options.headless = True
+
+# pyglet's Linux input backend always references the xlib window module, which is never imported in headless mode.
+import pyglet.window.xlib
+
+import amonite.controllers as controllers
+from amonite.collision.collision_controller import CollisionController
+from amonite.input_controller import InputController
+from amonite.settings import GLOBALS
+from amonite.settings import SETTINGS
+from amonite.settings import Keys
+from amonite.settings import load_settings
+
+from constants import custom_setting_keys
+import scene_composer
+from scene_composer import SceneComposer
+from allocation_profiler import AllocationProfiler
+from asset_bundle import ASSET_BUNDLE
+from asset_manifest import FONTS
+from asset_preloader import ASSET_PRELOADER
+from input_recording import InputReplayer
+from simulation import Simulation
+from sprite_atlas import SPRITE_ATLAS
+
+class HeadlessInputController(InputController):
+    """
+    Input controller with no devices attached.
+    Its state is never written by window or controller events, so no input is ever read unless explicitly written.
+    """
+
+    def __init__(self) -> None:
+        # Device enumeration is skipped altogether, since it requires access to input devices.
+
+        # Keyboard.
+        self.keys: dict[int, bool] = {}
+        self.key_presses: dict[int, bool] = {}
+        self.key_releases: dict[int, bool] = {}
+
+        # Controller.
+        self.buttons: list[dict[str, bool]] = []
+        self.button_presses: list[dict[str, bool]] = []
+        self.button_releases: list[dict[str, bool]] = []
+        self.sticks: list[dict[str, tuple[float, float]]] = []
+        self.triggers: list[dict[str, float]] = []
+        self.controllers: list[pyglet.input.Controller] = []
+
+class HeadlessRunReport:
+    """
+    Outcome of a headless run.
+    """
+
+    def __init__(
+        self,
+        ticks: int,
+        elapsed: float,
+        worst_tick_time: float
+    ) -> None:
+        self.ticks: int = ticks
+        self.elapsed: float = elapsed
+        self.worst_tick_time: float = worst_tick_time
+
+    def get_ticks_per_second(self) -> float:
+        return self.ticks / self.elapsed if self.elapsed > 0.0 else 0.0
+
+    def __str__(self) -> str:
+        return "\n".join([
+            f"ticks: {self.ticks}",
+            f"elapsed: {self.elapsed:.3f}s",
+            f"ticks per second: {self.get_ticks_per_second():.1f}",
+            f"worst tick: {self.worst_tick_time * 1000:.3f}ms"
+        ])
+
+class HeadlessFishGame:
+    """
+    Runs the game simulation with no window, upscaler or FPS display.
+    Physics ticks are performed back to back as fast as the CPU allows, at the same fixed timestep used by the game.
+    """
+
+    def __init__(
+        self,
+        scene_src: str = "scenes/0_0_0.json",
+        input_replayer: InputReplayer | None = None,
+        allocation_profiler: AllocationProfiler | None = None
+    ) -> None:
+        """
+        If an [input_replayer] is provided, its scene and physics rate are used instead of the provided ones.
+        """
+
+        # Set resources path.
+        pyglet.resource.path = [f"{os.path.dirname(__file__)}/../assets"]
+
+        # Read all assets from the compiled bundle if any, from loose files otherwise.
+        if not ASSET_BUNDLE.mount():
+            pyglet.resource.reindex()
+
+        # Load font files.
+        for font in FONTS:
+            ASSET_PRELOADER.load_font(source = font)
+
+        # Load settings from file.
+        load_settings(f"{pyglet.resource.path[0]}/settings.json")
+
+        # The offscreen context is only needed to own GL resources: nothing is ever drawn to it.
+        self.__context: pyglet.window.BaseWindow = pyglet.window.Window(
+            width = int(SETTINGS[Keys.VIEW_WIDTH]),
+            height = int(SETTINGS[Keys.VIEW_HEIGHT])
+        )
+
+        # Sprites are read from the prebuilt atlas, if any.
+        SPRITE_ATLAS.install()
+
+        # Controllers.
+        controllers.COLLISION_CONTROLLER = CollisionController()
+        controllers.INPUT_CONTROLLER = HeadlessInputController()
+
+        # No upscaling happens without a window.
+        GLOBALS[Keys.SCALING] = 1
+
+        # Replays only reproduce exactly at the physics rate they were recorded at.
+        if input_replayer is not None:
+            SETTINGS[custom_setting_keys.PHYSICS_HZ] = input_replayer.physics_hz
+            scene_src = input_replayer.scene_src
+
+        # Same physics timestep as the windowed game.
+        # The simulation must be created before any scene is loaded.
+        self.phys_timestep: float = 1.0 / float((SETTINGS[custom_setting_keys.PHYSICS_HZ]))
+        self.__simulation: Simulation = Simulation(
+            timestep = self.phys_timestep,
+            input_replayer = input_replayer,
+            allocation_profiler = allocation_profiler,
+            scene_build_budget = float(SETTINGS[custom_setting_keys.SCENE_BUILD_BUDGET]) / 1000.0
+        )
+
+        # Create a scene.
+        scene_composer.SCENE_COMPOSER = SceneComposer(
+            window = self.__context,
+            view_width = int(SETTINGS[Keys.VIEW_WIDTH]),
+            view_height = int(SETTINGS[Keys.VIEW_HEIGHT])
+        )
+        scene_composer.SCENE_COMPOSER.load_scene(config_file_path = scene_src)
+
+    def tick(self) -> bool:
+        """
+        Performs a single physics tick.
+        Returns False if the tick was spent switching to the next scene, True otherwise.
+        """
+
+        return self.__simulation.step()
+
+    def run(self, ticks: int) -> HeadlessRunReport:
+        """
+        Performs [ticks] physics ticks back to back and reports on their timing.
+        Steps spent switching scene are not counted as ticks, but their timing is still reported.
+        """
+
+        worst_tick_time: float = 0.0
+        performed_ticks: int = 0
+
+        start_time: float = time.perf_counter()
+        while performed_ticks < ticks:
+            tick_start_time: float = time.perf_counter()
+            if self.tick():
+                performed_ticks += 1
+            worst_tick_time = max(worst_tick_time, time.perf_counter() - tick_start_time)
+        elapsed: float = time.perf_counter() - start_time
+
+        return HeadlessRunReport(
+            ticks = ticks,
+            elapsed = elapsed,
+            worst_tick_time = worst_tick_time
+        )
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Runs the game simulation headless, as fast as possible.")
+    parser.add_argument("--scene", default = "scenes/0_0_0.json", help = "scene file to load, relative to the assets directory")
+    parser.add_argument("--ticks", type = int, default = None, help = "number of physics ticks to run, defaults to 10000 or to the whole replay length")
+    parser.add_argument("--replay", default = None, help = "input recording to replay, overrides the scene")
+    parser.add_argument("--profile-allocations", type = int, default = 0, help = "number of top allocating call sites, node types and types to report, allocations are not profiled if 0")
+    args: argparse.Namespace = parser.parse_args()
+
+    input_replayer: InputReplayer | None = InputReplayer(file_path = args.replay) if args.replay is not None else None
+    allocation_profiler: AllocationProfiler | None = AllocationProfiler() if args.profile_allocations > 0 else None
+    ticks: int = args.ticks if args.ticks is not None else input_replayer.ticks if input_replayer is not None else 10000
+
+    print(HeadlessFishGame(
+        scene_src = args.scene,
+        input_replayer = input_replayer,
+        allocation_profiler = allocation_profiler
+    ).run(ticks = ticks))
+
+    if allocation_profiler is not None:
+        print(allocation_profiler.get_report(top = args.profile_allocations))
@@ -0,0 +1,60 @@
+import argparse
+import json
+import os
+from typing import Any
+import pyglet
+
+from asset_bundle import ASSETS_DIR
+from scene_template import HittableTemplate
+from scene_template import merge_hittables
+
+# Hittables (walls and waters) files, relative to the assets dir.
+HITTABLES_DIRS: tuple[str, ...] = (
+    "wallmaps",
+    "watermaps"
+)
+
+def optimize(source: str, assets_dir: str = ASSETS_DIR) -> tuple[int, int]:
+    """
+    Merges all touching hittables in the provided hittables file (relative to [assets_dir]) and writes them back, in the same format the scene editor stores them in.
+    Returns the number of hittables before and after merging.
+    """
+
+    hittables: tuple[HittableTemplate, ...] = HittableTemplate.from_hittables_file(source = source, merge = False)
+    merged: tuple[HittableTemplate, ...] = merge_hittables(hittables = hittables)
+
+    if len(merged) >= len(hittables):
+        return (len(hittables), len(merged))
+
+    # Group hittables by tags and sensority, just like amonite.utils.hittables_loader.HittablesLoader.store().
+    elements: dict[tuple[tuple[str, ...], bool], dict[str, Any]] = {}
+    for hittable in merged:
+        element: dict[str, Any] = elements.setdefault((hittable.tags, hittable.sensor), {
+            "tags": list(hittable.tags),
+            "sensor": hittable.sensor,
+            "positions": [],
+            "sizes": []
+        })
+        element["positions"].append(f"{hittable.x},{hittable.y}")
+        element["sizes"].append(f"{hittable.width},{hittable.height}")
+
+    with open(file = f"{assets_dir}/{source}", mode = "w", encoding = "UTF8") as dest_file:
+        dest_file.write(json.dumps({"elements": list(elements.values())}, indent = 4))
+
+    return (len(hittables), len(merged))
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Merges touching walls and waters in all hittables files, in place.")
+    parser.add_argument("--assets", default = ASSETS_DIR, help = "assets directory")
+    args: argparse.Namespace = parser.parse_args()
+
+    # Hittables files are read relative to the assets dir.
+    pyglet.resource.path = [args.assets]
+
+    for hittables_dir in HITTABLES_DIRS:
+        for file_name in sorted(os.listdir(f"{args.assets}/{hittables_dir}")):
+            if not file_name.endswith(".json"):
+                continue
+
+            before, after = optimize(source = f"{hittables_dir}/{file_name}", assets_dir = args.assets)
+            print(f"{hittables_dir}/{file_name}: {before} -> {after} hittables")
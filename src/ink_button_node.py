@@ -5,13 +5,15 @@ import pyglet
 import amonite.controllers as controllers
 from amonite.node import PositionNode
 from amonite.sprite_node import SpriteNode
-from amonite.animation import Animation
 from amonite.collision.collision_node import CollisionNode
 from amonite.collision.collision_node import CollisionType
 from amonite.collision.collision_shape import CollisionRect
 from amonite.collision.collision_node import CollisionMethod
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import collision_tags
+from utils.utils import move_to_batch
+from utils.utils import pause_animations
 
 class Direction(str, Enum):
     UP = "up"
@@ -73,8 +75,11 @@ class InkButtonNode(PositionNode):
         ################################
         # Sprite.
         ################################
+        self.__button_up_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/buttons/button_up.json").content
+        self.__button_down_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/buttons/button_down.json").content
+
         self.sprite: SpriteNode = SpriteNode(
-            resource = Animation(source = "sprites/buttons/button_up.json").content,
+            resource = self.__button_up_img,
             y_sort = False,
             batch = batch
         )
@@ -108,11 +113,40 @@ class InkButtonNode(PositionNode):
         ################################
         ################################
 
-    def __on_sense(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
+    def reset(
+        self,
+        x: float,
+        y: float,
+        allow_turning_off: bool = True,
+        on_triggered_on: Callable | None = None,
+        on_triggered_off: Callable | None = None
+    ) -> None:
+        """
+        Turns the button off at the provided position and registers its sensor again, as if just created.
+        The button anchor is kept as it is.
+        """
+
+        self.__on_triggered_on = on_triggered_on
+        self.__on_triggered_off = on_triggered_off
+        self.__allow_turning_off = allow_turning_off
+        self.__on = False
+
+        self.sprite.set_image(self.__button_up_img)
+
+        self.set_position((x, y))
+        controllers.COLLISION_CONTROLLER.add_collider(self.__sensor)
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        move_to_batch(self, batch = batch)
+
+    def set_paused(self, paused: bool) -> None:
+        pause_animations(self, paused = paused)
+
+    def __on_sense(self, tags: int, collider: CollisionNode, entered: bool) -> None:
         if entered:
             if not self.__on:
                 self.__on = True
-                self.sprite.set_image(Animation(source = "sprites/buttons/button_down.json").content)
+                self.sprite.set_image(self.__button_down_img)
 
                 if self.__on_triggered_on is not None:
                     self.__on_triggered_on()
@@ -121,7 +155,7 @@ class InkButtonNode(PositionNode):
             # Only trigger off if allowed.
             if self.__on and self.__allow_turning_off:
                 self.__on = False
-                self.sprite.set_image(Animation(source = "sprites/buttons/button_up.json").content)
+                self.sprite.set_image(self.__button_up_img)
 
                 if self.__on_triggered_off is not None:
                     self.__on_triggered_off()
@@ -0,0 +1,290 @@
+import struct
+from typing import BinaryIO
+
+from amonite.input_controller import ControllerButton
+from amonite.input_controller import ControllerStick
+from amonite.input_controller import ControllerTrigger
+from amonite.input_controller import InputController
+
+# File layout:
+# header: magic, version, physics rate, scene source length and scene source (UTF-8).
+# body: sequence of runs, each made of a tick count, a payload length and the payload shared by all ticks in the run.
+# payload: pressed, just pressed and just released keys count, all their key symbols, controllers count and, for each controller,
+# held, just pressed and just released buttons bitmasks, sticks axes and triggers values.
+MAGIC: bytes = b"FGIR"
+VERSION: int = 1
+
+HEADER_FORMAT: struct.Struct = struct.Struct("<4sBdH")
+RUN_FORMAT: struct.Struct = struct.Struct("<IH")
+KEYS_COUNT_FORMAT: struct.Struct = struct.Struct("<BBB")
+CONTROLLERS_COUNT_FORMAT: struct.Struct = struct.Struct("<B")
+CONTROLLER_FORMAT: struct.Struct = struct.Struct("<HHH4d2d")
+
+# Only buttons, sticks and triggers known to the game are recorded, so that they can be stored by index.
+BUTTONS: tuple[str, ...] = tuple(button.value for button in ControllerButton)
+STICKS: tuple[str, ...] = tuple(stick.value for stick in ControllerStick)
+TRIGGERS: tuple[str, ...] = tuple(trigger.value for trigger in ControllerTrigger)
+
+class InputRecordingError(Exception):
+    pass
+
+class InputState:
+    """
+    Snapshot of all inputs read by the game during a single tick.
+    """
+
+    __slots__ = (
+        "keys",
+        "key_presses",
+        "key_releases",
+        "buttons",
+        "button_presses",
+        "button_releases",
+        "sticks",
+        "triggers"
+    )
+
+    def __init__(
+        self,
+        keys: list[int],
+        key_presses: list[int],
+        key_releases: list[int],
+        buttons: list[int],
+        button_presses: list[int],
+        button_releases: list[int],
+        sticks: list[tuple[float, float, float, float]],
+        triggers: list[tuple[float, float]]
+    ) -> None:
+        # Keyboard: symbols of all active keys.
+        self.keys: list[int] = keys
+        self.key_presses: list[int] = key_presses
+        self.key_releases: list[int] = key_releases
+
+        # Controllers: bitmasks of active buttons, indexed by BUTTONS.
+        self.buttons: list[int] = buttons
+        self.button_presses: list[int] = button_presses
+        self.button_releases: list[int] = button_releases
+        self.sticks: list[tuple[float, float, float, float]] = sticks
+        self.triggers: list[tuple[float, float]] = triggers
+
+    @staticmethod
+    def from_input_controller(input_controller: InputController) -> "InputState":
+        return InputState(
+            keys = sorted(key for key, active in input_controller.keys.items() if active),
+            key_presses = sorted(key for key, active in input_controller.key_presses.items() if active),
+            key_releases = sorted(key for key, active in input_controller.key_releases.items() if active),
+            buttons = [InputState.__get_buttons_mask(buttons) for buttons in input_controller.buttons],
+            button_presses = [InputState.__get_buttons_mask(buttons) for buttons in input_controller.button_presses],
+            button_releases = [InputState.__get_buttons_mask(buttons) for buttons in input_controller.button_releases],
+            sticks = [(
+                *sticks.get(STICKS[0], (0.0, 0.0)),
+                *sticks.get(STICKS[1], (0.0, 0.0))
+            ) for sticks in input_controller.sticks],
+            triggers = [(
+                triggers.get(TRIGGERS[0], 0.0),
+                triggers.get(TRIGGERS[1], 0.0)
+            ) for triggers in input_controller.triggers]
+        )
+
+    @staticmethod
+    def __get_buttons_mask(buttons: dict[str, bool]) -> int:
+        mask: int = 0
+        for index, button in enumerate(BUTTONS):
+            if buttons.get(button, False):
+                mask |= 1 << index
+        return mask
+
+    @staticmethod
+    def __get_buttons(mask: int) -> dict[str, bool]:
+        return {button: True for index, button in enumerate(BUTTONS) if mask & (1 << index)}
+
+    def apply(self, input_controller: InputController) -> None:
+        """
+        Overwrites all inputs in the provided input controller with the ones in the snapshot.
+        """
+
+        input_controller.keys = {key: True for key in self.keys}
+        input_controller.key_presses = {key: True for key in self.key_presses}
+        input_controller.key_releases = {key: True for key in self.key_releases}
+
+        input_controller.buttons = [InputState.__get_buttons(mask) for mask in self.buttons]
+        input_controller.button_presses = [InputState.__get_buttons(mask) for mask in self.button_presses]
+        input_controller.button_releases = [InputState.__get_buttons(mask) for mask in self.button_releases]
+        input_controller.sticks = [{
+            STICKS[0]: (sticks[0], sticks[1]),
+            STICKS[1]: (sticks[2], sticks[3])
+        } for sticks in self.sticks]
+        input_controller.triggers = [{
+            TRIGGERS[0]: triggers[0],
+            TRIGGERS[1]: triggers[1]
+        } for triggers in self.triggers]
+
+        # Make sure live controller events always find their controller entries.
+        for _ in range(len(input_controller.controllers) - len(self.buttons)):
+            input_controller.buttons.append({})
+            input_controller.button_presses.append({})
+            input_controller.button_releases.append({})
+            input_controller.sticks.append({})
+            input_controller.triggers.append({})
+
+    def encode(self) -> bytes:
+        payload: bytearray = bytearray(KEYS_COUNT_FORMAT.pack(len(self.keys), len(self.key_presses), len(self.key_releases)))
+        keys: list[int] = [*self.keys, *self.key_presses, *self.key_releases]
+        payload += struct.pack(f"<{len(keys)}I", *keys)
+
+        payload += CONTROLLERS_COUNT_FORMAT.pack(len(self.buttons))
+        for index in range(len(self.buttons)):
+            payload += CONTROLLER_FORMAT.pack(
+                self.buttons[index],
+                self.button_presses[index],
+                self.button_releases[index],
+                *self.sticks[index],
+                *self.triggers[index]
+            )
+
+        return bytes(payload)
+
+    @staticmethod
+    def decode(payload: bytes) -> "InputState":
+        offset: int = 0
+
+        keys_count, presses_count, releases_count = KEYS_COUNT_FORMAT.unpack_from(payload, offset)
+        offset += KEYS_COUNT_FORMAT.size
+        keys_total: int = keys_count + presses_count + releases_count
+        keys: tuple[int, ...] = struct.unpack_from(f"<{keys_total}I", payload, offset)
+        offset += keys_total * 4
+
+        (controllers_count,) = CONTROLLERS_COUNT_FORMAT.unpack_from(payload, offset)
+        offset += CONTROLLERS_COUNT_FORMAT.size
+
+        state: InputState = InputState(
+            keys = list(keys[:keys_count]),
+            key_presses = list(keys[keys_count:keys_count + presses_count]),
+            key_releases = list(keys[keys_count + presses_count:]),
+            buttons = [],
+            button_presses = [],
+            button_releases = [],
+            sticks = [],
+            triggers = []
+        )
+
+        for _ in range(controllers_count):
+            controller: tuple = CONTROLLER_FORMAT.unpack_from(payload, offset)
+            offset += CONTROLLER_FORMAT.size
+
+            state.buttons.append(controller[0])
+            state.button_presses.append(controller[1])
+            state.button_releases.append(controller[2])
+            state.sticks.append(controller[3:7])
+            state.triggers.append(controller[7:9])
+
+        return state
+
+class InputRecorder:
+    """
+    Records all inputs, one snapshot per physics tick, to a binary file.
+    Consecutive identical snapshots are stored only once, along with their count.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        physics_hz: float,
+        scene_src: str
+    ) -> None:
+        self.__file: BinaryIO = open(file = file_path, mode = "wb")
+
+        encoded_scene_src: bytes = scene_src.encode("UTF-8")
+        self.__file.write(HEADER_FORMAT.pack(MAGIC, VERSION, physics_hz, len(encoded_scene_src)))
+        self.__file.write(encoded_scene_src)
+
+        self.ticks: int = 0
+
+        # Current run of identical snapshots.
+        self.__run_payload: bytes | None = None
+        self.__run_length: int = 0
+
+    def record(self, input_controller: InputController) -> None:
+        """
+        Records all current inputs as a single tick.
+        """
+
+        payload: bytes = InputState.from_input_controller(input_controller = input_controller).encode()
+
+        if payload != self.__run_payload:
+            self.__flush_run()
+            self.__run_payload = payload
+
+        self.__run_length += 1
+        self.ticks += 1
+
+    def __flush_run(self) -> None:
+        if self.__run_payload is None or self.__run_length <= 0:
+            return
+
+        self.__file.write(RUN_FORMAT.pack(self.__run_length, len(self.__run_payload)))
+        self.__file.write(self.__run_payload)
+        self.__run_length = 0
+
+    def close(self) -> None:
+        if self.__file.closed:
+            return
+
+        self.__flush_run()
+        self.__file.close()
+
+class InputReplayer:
+    """
+    Replays all inputs from a binary file, one snapshot per physics tick.
+    No input at all is read after the end of the recording.
+    """
+
+    def __init__(
+        self,
+        file_path: str
+    ) -> None:
+        with open(file = file_path, mode = "rb") as content:
+            data: bytes = content.read()
+
+        magic, version, physics_hz, scene_src_length = HEADER_FORMAT.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise InputRecordingError(f"{file_path} is not a version {VERSION} input recording")
+
+        offset: int = HEADER_FORMAT.size
+        self.physics_hz: float = physics_hz
+        self.scene_src: str = data[offset:offset + scene_src_length].decode("UTF-8")
+        offset += scene_src_length
+
+        # All runs of identical snapshots.
+        self.__runs: list[tuple[int, InputState]] = []
+        while offset < len(data):
+            run_length, payload_length = RUN_FORMAT.unpack_from(data, offset)
+            offset += RUN_FORMAT.size
+            self.__runs.append((run_length, InputState.decode(data[offset:offset + payload_length])))
+            offset += payload_length
+
+        self.ticks: int = sum(run_length for run_length, _ in self.__runs)
+
+        self.__empty_state: InputState = InputState([], [], [], [], [], [], [], [])
+        self.__run_index: int = 0
+        self.__run_tick: int = 0
+
+    def is_finished(self) -> bool:
+        return self.__run_index >= len(self.__runs)
+
+    def apply(self, input_controller: InputController) -> None:
+        """
+        Overwrites all inputs in the provided input controller with the ones recorded for the next tick.
+        """
+
+        if self.is_finished():
+            self.__empty_state.apply(input_controller = input_controller)
+            return
+
+        run_length, state = self.__runs[self.__run_index]
+        state.apply(input_controller = input_controller)
+
+        self.__run_tick += 1
+        if self.__run_tick >= run_length:
+            self.__run_index += 1
+            self.__run_tick = 0
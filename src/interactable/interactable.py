@@ -13,6 +13,19 @@ class Interactable:
         self.__one_shot: bool = one_shot
         self.__state_changed: bool = False
 
+    def reset(
+        self,
+        start_state: bool = False,
+        one_shot: bool = True
+    ) -> None:
+        """
+        Restores the initial interacting state.
+        """
+
+        self.on = start_state
+        self.__one_shot = one_shot
+        self.__state_changed = False
+
     def interact(
         self,
         tags: list[str]
@@ -4,15 +4,18 @@ import pyglet.math as pm
 import amonite.controllers as controllers
 from amonite.node import PositionNode
 from amonite.sprite_node import SpriteNode
-from amonite.animation import Animation
 from amonite.collision.collision_node import CollisionNode
 from amonite.collision.collision_node import CollisionType
 from amonite.collision.collision_shape import CollisionShape
 from amonite.collision.collision_shape import CollisionRect
 from amonite.collision.collision_node import CollisionMethod
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import collision_tags
 from interactable.interactable import Interactable
+from prompt_pool import PROMPT_POOL
+from utils.utils import move_to_batch
+from utils.utils import reset_collider
 
 class Interactor(PositionNode):
     def __init__(
@@ -31,6 +34,7 @@ class Interactor(PositionNode):
         self.__interactables: list[Interactable] = []
         self.__button_offset: pm.Vec2 = pm.Vec2(0.0, 32.0)
 
+        self.__button_signal_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/button_icon/button_icon.json").content
         self.__button_signal: SpriteNode | None = None
 
         self.__interact_sensor: CollisionNode = CollisionNode(
@@ -57,19 +61,12 @@ class Interactor(PositionNode):
     def update(self, dt: float) -> None:
         super().update(dt = dt)
 
-        position: tuple[float, float] = self.get_position()
+        self.toggle_button_signal()
 
         if self.__button_signal is not None:
-            self.__button_signal.set_position(
-                position = (
-                    position[0] + self.__button_offset.x,
-                    position[1] + self.__button_offset.y
-                )
-            )
+            self.__button_signal.set_position(position = self.__get_button_position())
 
-        self.toggle_button_signal()
-
-    def on_interactable_found(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
+    def on_interactable_found(self, tags: int, collider: CollisionNode, entered: bool) -> None:
         if collider.owner is not None and isinstance(collider.owner, Interactable) and collider.owner.is_active():
             if entered and self.__button_signal is None:
                 self.__interactables.append(collider.owner)
@@ -78,12 +75,13 @@ class Interactor(PositionNode):
 
     def toggle_button_signal(self) -> None:
         if len(self.__interactables) > 0 and self.__button_signal is None:
-            self.__button_signal = self.__build_button_signal()
-            self.add_component(self.__button_signal)
+            self.__button_signal = PROMPT_POOL.acquire(
+                image = self.__button_signal_img,
+                position = self.__get_button_position(),
+                batch = self.__batch
+            )
         elif len(self.__interactables) <= 0 and self.__button_signal is not None:
-            # TODO Amonite's PositionNode should expose a "remove_component" mehtod.
-            self.components.remove(self.__button_signal)
-            self.__button_signal.delete()
+            PROMPT_POOL.release(self.__button_signal, batch = self.__batch)
             self.__button_signal = None
 
     def interact(
@@ -103,12 +101,45 @@ class Interactor(PositionNode):
             if not interactable.is_active():
                 self.__interactables.remove(interactable)
 
-    def __build_button_signal(self) -> SpriteNode:
+    def reset(self) -> None:
+        """
+        Forgets all perceived interactables and registers the interaction sensor again, as if just created.
+        """
+
+        if self.__button_signal is not None:
+            PROMPT_POOL.release(self.__button_signal, batch = self.__batch)
+            self.__button_signal = None
+
+        self.__interactables.clear()
+
+        reset_collider(self.__interact_sensor)
+        controllers.COLLISION_CONTROLLER.add_collider(self.__interact_sensor)
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        """
+        Moves the interaction sensor to the provided batch, along with all prompts shown from now on.
+        Any prompt shown in the previous batch is handed back, so that it's shown again in the new one on the next update.
+        """
+
+        if self.__button_signal is not None:
+            PROMPT_POOL.release(self.__button_signal, batch = self.__batch)
+            self.__button_signal = None
+
+        self.__batch = batch
+
+        move_to_batch(self, batch = batch)
+
+    def delete(self) -> None:
+        # The button signal is owned by the prompt pool, so just hand it back.
+        if self.__button_signal is not None:
+            PROMPT_POOL.release(self.__button_signal, batch = self.__batch)
+            self.__button_signal = None
+
+        super().delete()
+
+    def __get_button_position(self) -> tuple[float, float]:
         position: tuple[float, float] = self.get_position()
-        return SpriteNode(
-            resource = Animation(source = "sprites/button_icon/button_icon.json").content,
-            x = position[0] + self.__button_offset.x,
-            y = position[1] + self.__button_offset.y,
-            y_sort = False,
-            batch = self.__batch
+        return (
+            position[0] + self.__button_offset.x,
+            position[1] + self.__button_offset.y
         )
\ No newline at end of file
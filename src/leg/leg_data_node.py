@@ -11,13 +11,19 @@ from amonite.animation import Animation
 from amonite.collision.collision_node import CollisionNode
 from amonite.collision.collision_node import CollisionType
 from amonite.collision.collision_shape import CollisionRect
-from amonite.collision.collision_node import CollisionMethod
 from amonite.settings import GLOBALS
 from amonite.settings import Keys
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import collision_tags
 from constants import uniques
 from grabbable.grabber import Grabber
+from probe_sensor_node import ProbeSensorNode
+from probe_sensor_node import SensorProbe
+from render_interpolation import RENDER_INTERPOLATOR
+from utils.utils import move_to_batch
+from utils.utils import pause_animations
+from utils.utils import reset_collider
 
 class LegDataNode(PositionNode):
     """
@@ -32,9 +38,11 @@ class LegDataNode(PositionNode):
         "move_vec",
         "max_move_speed",
         "move_accel",
+        "move_step",
         "gravity_vec",
         "max_gravity_speed",
         "gravity_accel",
+        "gravity_step",
         "__ground_collision_ids",
         "__roof_collision_ids",
         "__water_collision_ids",
@@ -44,9 +52,7 @@ class LegDataNode(PositionNode):
         "__on_door",
         "sprite",
         "__collider",
-        "__water_sensor",
-        "__ground_sensor",
-        "__roof_sensor",
+        "__sensor",
     )
     move_water_dampening: float = 0.5
     move_land_dampening: float = 1.0
@@ -56,6 +62,8 @@ class LegDataNode(PositionNode):
     jump_land_dampening: float = 1.0
     jump_land_grab_dampening: float = 0.85
     max_jump_force: float = 500.0
+    # Physics rate jumps were tuned at: launch speeds are calibrated so that jumps reach the same height they used to reach at this rate.
+    jump_tuning_hz: float = 60.0
 
     def __init__(
         self,
@@ -91,6 +99,8 @@ class LegDataNode(PositionNode):
         self.move_vec: pm.Vec2 = pm.Vec2(0.0, 0.0)
         self.max_move_speed: float = 80.0
         self.move_accel: float = 400.0
+        # Walk speed change over the current tick, only applied once (see move()).
+        self.move_step: pm.Vec2 = pm.Vec2(0.0, 0.0)
         ################################
         ################################
 
@@ -100,6 +110,8 @@ class LegDataNode(PositionNode):
         ################################
         self.gravity_vec: pm.Vec2 = pm.Vec2(0.0, 0.0)
         self.gravity_accel: pm.Vec2 = pm.Vec2(0.0, -1200.0)
+        # Gravity speed change over the current tick, including jump launches (see launch()).
+        self.gravity_step: pm.Vec2 = pm.Vec2(0.0, 0.0)
         ################################
         ################################
 
@@ -122,12 +134,13 @@ class LegDataNode(PositionNode):
         # Sprite.
         ################################
         self.sprite: SpriteNode = SpriteNode(
-            resource = Animation(source = "sprites/leg/leg_idle.json").content,
+            resource = ANIMATION_REGISTRY.fetch(source = "sprites/leg/leg_idle.json").content,
             y_sort = False,
             on_animation_end = on_sprite_animation_end,
             batch = batch
         )
         self.add_component(self.sprite)
+        RENDER_INTERPOLATOR.register(self.sprite)
         ################################
         ################################
 
@@ -157,75 +170,63 @@ class LegDataNode(PositionNode):
             ),
             on_triggered = self.on_collision
         )
-        self.__water_sensor: CollisionNode = CollisionNode(
-            collision_type = CollisionType.DYNAMIC,
-            collision_method = CollisionMethod.PASSIVE,
-            sensor = True,
-            active_tags = [
-                collision_tags.WATER
-            ],
-            passive_tags = [
-            ],
-            shape = CollisionRect(
-                anchor_x = 6,
-                anchor_y = 16,
-                width = 12,
-                height = 28,
-                batch = batch
-            ),
-            on_triggered = self.on_water_collision
-        )
-        self.__ground_sensor: CollisionNode = CollisionNode(
-            collision_type = CollisionType.DYNAMIC,
-            collision_method = CollisionMethod.PASSIVE,
-            sensor = True,
-            active_tags = [
-                collision_tags.PLAYER_COLLISION,
-            ],
-            passive_tags = [],
-            shape = CollisionRect(
-                anchor_x = 6,
-                anchor_y = 17,
-                width = 12,
-                height = 2,
-                batch = batch
-            ),
-            on_triggered = self.on_ground_collision
-        )
-        self.__roof_sensor: CollisionNode = CollisionNode(
-            collision_type = CollisionType.DYNAMIC,
-            collision_method = CollisionMethod.PASSIVE,
-            sensor = True,
-            active_tags = [
-                collision_tags.PLAYER_COLLISION
-            ],
-            passive_tags = [],
-            shape = CollisionRect(
-                anchor_x = 6,
-                anchor_y = -11,
-                width = 12,
-                height = 2,
-                batch = batch
-            ),
-            on_triggered = self.on_roof_collision
+        # Water, ground and roof sensors are all checked in a single query.
+        self.__sensor: ProbeSensorNode = ProbeSensorNode(
+            probes = [
+                SensorProbe(
+                    active_tags = [
+                        collision_tags.WATER
+                    ],
+                    shape = CollisionRect(
+                        anchor_x = 6,
+                        anchor_y = 16,
+                        width = 12,
+                        height = 28,
+                        batch = batch
+                    ),
+                    on_triggered = self.on_water_collision
+                ),
+                SensorProbe(
+                    active_tags = [
+                        collision_tags.PLAYER_COLLISION,
+                    ],
+                    shape = CollisionRect(
+                        anchor_x = 6,
+                        anchor_y = 17,
+                        width = 12,
+                        height = 2,
+                        batch = batch
+                    ),
+                    on_triggered = self.on_ground_collision
+                ),
+                SensorProbe(
+                    active_tags = [
+                        collision_tags.PLAYER_COLLISION
+                    ],
+                    shape = CollisionRect(
+                        anchor_x = 6,
+                        anchor_y = -11,
+                        width = 12,
+                        height = 2,
+                        batch = batch
+                    ),
+                    on_triggered = self.on_roof_collision
+                )
+            ]
         )
-        self.add_component(self.__water_sensor)
-        self.add_component(self.__ground_sensor)
-        self.add_component(self.__roof_sensor)
+        self.add_component(self.__sensor)
         controllers.COLLISION_CONTROLLER.add_collider(self.__collider)
-        controllers.COLLISION_CONTROLLER.add_collider(self.__water_sensor)
-        controllers.COLLISION_CONTROLLER.add_collider(self.__ground_sensor)
-        controllers.COLLISION_CONTROLLER.add_collider(self.__roof_sensor)
+        controllers.COLLISION_CONTROLLER.add_collider(self.__sensor)
         ################################
         ################################
 
-    def on_collision(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
+    def on_collision(self, tags: int, collider: CollisionNode, entered: bool) -> None:
         # Check for collisions with next level door.
-        if collision_tags.LEVEL_DOOR in tags:
+        if tags & collision_tags.LEVEL_DOOR_BIT:
             self.__on_door = entered
             return
 
-    def on_water_collision(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
+    def on_water_collision(self, tags: int, collider: CollisionNode, entered: bool) -> None:
         if entered:
             # Entering water: set the water flag, reset gravity in order to get the water resistance effect and disable grabber, so that no object can be grabbed while in water.
             self.in_water = True
@@ -239,7 +240,7 @@ class LegDataNode(PositionNode):
             self.gravity_vec *= 1.0 + self.jump_water_dampening
             self.__grabber.turn_on()
 
-    def on_ground_collision(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
+    def on_ground_collision(self, tags: int, collider: CollisionNode, entered: bool) -> None:
         collider_id: int = id(collider)
         if entered:
             self.__ground_collision_ids.add(collider_id)
@@ -256,7 +257,7 @@ class LegDataNode(PositionNode):
         if self.grounded and self.gravity_vec.y < 0.0:
             self.gravity_vec *= 0.0
 
-    def on_roof_collision(self, tags: list[str], collider: CollisionNode, entered: bool) -> None:
+    def on_roof_collision(self, tags: int, collider: CollisionNode, entered: bool) -> None:
         collider_id: int = id(collider)
         if entered:
             self.__roof_collision_ids.add(collider_id)
@@ -315,7 +316,53 @@ class LegDataNode(PositionNode):
         # Flip sprite if moving to the left.
         self.sprite.set_scale(x_scale = self.__hor_facing)
 
+    def reset(self, x: float, y: float) -> None:
+        """
+        Restores the initial state at the provided position and registers all colliders again, as if just created.
+        """
+
+        self.__hor_facing = 1
+        self.jump_force = 0.0
+
+        self.move_vec = pm.Vec2(0.0, 0.0)
+        self.move_step = pm.Vec2(0.0, 0.0)
+        self.gravity_vec = pm.Vec2(0.0, 0.0)
+        self.gravity_step = pm.Vec2(0.0, 0.0)
+
+        self.__ground_collision_ids.clear()
+        self.__roof_collision_ids.clear()
+        self.__water_collision_ids.clear()
+        self.grounded = False
+        self.roofed = False
+        self.in_water = False
+        self.__on_door = False
+
+        self.set_position((x, y))
+        self.sprite.set_scale(x_scale = self.__hor_facing)
+        RENDER_INTERPOLATOR.register(self.sprite)
+
+        # Register all colliders in the same order as on creation, since it drives collision resolution order.
+        self.__grabber.reset()
+        reset_collider(self.__collider, position = (x, y))
+        self.__sensor.reset()
+        controllers.COLLISION_CONTROLLER.add_collider(self.__collider)
+        controllers.COLLISION_CONTROLLER.add_collider(self.__sensor)
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        """
+        Moves the sprite and all colliders to the provided batch, along with all prompts shown from now on.
+        """
+
+        self.__batch = batch
+        self.__grabber.set_batch(batch = batch)
+        move_to_batch(self, batch = batch)
+        move_to_batch(self.__collider, batch = batch)
+
+    def set_paused(self, paused: bool) -> None:
+        pause_animations(self, paused = paused)
+
     def delete(self) -> None:
+        RENDER_INTERPOLATOR.unregister(self.sprite)
         self.__collider.delete()
         super().delete()
 
@@ -326,6 +373,7 @@ class LegDataNode(PositionNode):
         target_speed: float = 0.0
         target_heading: float = self.move_vec.heading()
 
+        previous_move_vec: pm.Vec2 = self.move_vec
         current_speed: float = self.move_vec.length()
 
         if move_vec.length() > 0.0:
@@ -344,10 +392,15 @@ class LegDataNode(PositionNode):
             angle = target_heading
         )
 
+        self.move_step = self.move_vec - previous_move_vec
+
     def compute_gravity_speed(self, dt: float) -> None:
         if self.grounded:
+            self.gravity_step = pm.Vec2(0.0, 0.0)
             return
 
+        previous_gravity_vec: pm.Vec2 = self.gravity_vec
+
         # Accelerate when not grounded.
         self.gravity_vec += self.gravity_accel * self.get_gravity_dampening() * dt
 
@@ -356,12 +409,30 @@ class LegDataNode(PositionNode):
             angle = self.gravity_vec.heading()
         )
 
+        self.gravity_step = self.gravity_vec - previous_gravity_vec
+
+    def launch(self, speed: float, dt: float) -> None:
+        """
+        Sets the vertical speed to [speed] at the start of the current tick, then applies gravity over the tick.
+        The actual launch speed is calibrated so that the jump reaches the same height it used to reach at [jump_tuning_hz].
+        """
+
+        gravity: float = -self.gravity_accel.y * self.get_gravity_dampening()
+
+        # Jumps used to move with the speed at the end of each tick, which adds half a tick of launch speed to their height:
+        # v² / 2g + v * dt / 2 = v'² / 2g
+        launch_speed: float = math.sqrt(speed * speed + gravity * speed / self.jump_tuning_hz)
+
+        self.gravity_step = self.gravity_accel * self.get_gravity_dampening() * dt
+        self.gravity_vec = pm.Vec2(0.0, launch_speed) + self.gravity_step
+
     def move(self, dt: float) -> None:
         # Apply movement after collision.
         self.set_position(self.__collider.get_position())
 
-        # Compute and apply velocity for the next step.
-        self.set_velocity(velocity = self.move_vec + self.gravity_vec)
+        # Compute and apply velocity for the next step, using the average walk and gravity speeds over the tick.
+        self.set_velocity(velocity = self.move_vec - self.move_step * 0.5 + self.gravity_vec - self.gravity_step * 0.5)
+        self.move_step = pm.Vec2(0.0, 0.0)
 
     def set_velocity(self, velocity: pyglet.math.Vec2) -> None:
         # Apply the computed velocity to all colliders.
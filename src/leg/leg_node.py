@@ -2,6 +2,7 @@ from leg.states.leg_state import LegState
 import pyglet
 
 from amonite.node import PositionNode
+from amonite.state_machine import State
 from amonite.state_machine import StateMachine
 
 from character_node import CharacterNode
@@ -50,6 +51,42 @@ class LegNode(CharacterNode):
             }
         )
 
+    def reset(
+        self,
+        x: float,
+        y: float,
+        enabled: bool = True
+    ) -> None:
+        """
+        Restores the leg to its initial state at the provided position, as if just created.
+        """
+
+        # End the current state first, so that it can clean up after itself, then start over from the initial one.
+        current_state: State | None = self.__state_machine.get_current_state()
+        if current_state is not None:
+            current_state.end()
+
+        self.__data.reset(x = x, y = y)
+        self.set_position((x, y))
+
+        if enabled:
+            self.enable()
+        else:
+            self.disable()
+
+        self.__state_machine.current_key = None
+        self.__state_machine.set_state(LegStates.IDLE)
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        self.__data.set_batch(batch = batch)
+
+    def set_paused(self, paused: bool) -> None:
+        """
+        Pauses or resumes all sprite animations, so that no state is changed by animation ends while paused.
+        """
+
+        self.__data.set_paused(paused = paused)
+
     def toggle(self):
         super().toggle()
 
@@ -97,5 +134,5 @@ class LegNode(CharacterNode):
     def on_sprite_animation_end(self) -> None:
         self.__state_machine.on_animation_end()
 
-    def on_collision(self, tags: list[str], collider_id: int, entered: bool) -> None:
+    def on_collision(self, tags: int, collider_id: int, entered: bool) -> None:
         self.__state_machine.on_collision(tags = tags, enter = entered)
\ No newline at end of file
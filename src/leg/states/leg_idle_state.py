@@ -8,6 +8,7 @@ import amonite.controllers as controllers
 from amonite.input_controller import ControllerButton
 from amonite.input_controller import ControllerStick
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import custom_setting_keys
 from constants import uniques
 from leg.leg_data_node import LegDataNode
@@ -25,7 +26,7 @@ class LegIdleState(LegState):
             input_enabled = input_enabled
         )
 
-        self.__animation: Animation = Animation(source = "sprites/leg/leg_idle.json")
+        self.__animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/leg/leg_idle.json")
 
         # Inputs.
         self.__move: bool = False
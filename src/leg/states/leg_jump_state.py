@@ -8,6 +8,7 @@ from amonite.animation import Animation
 import amonite.controllers as controllers
 from amonite.input_controller import ControllerStick
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import custom_setting_keys
 from constants import uniques
 from leg.leg_data_node import LegDataNode
@@ -26,7 +27,7 @@ class LegJumpState(LegState):
         )
 
         # Animation.
-        self.__animation: Animation = Animation(source = "sprites/leg/leg_jump.json")
+        self.__animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/leg/leg_jump.json")
 
         # Input.
         self.__move_vec: pyglet.math.Vec2 = pyglet.math.Vec2()
@@ -92,7 +93,7 @@ class LegJumpState(LegState):
         # Overwrite gravity speed on startup.
         if self.__startup:
             self.__startup = False
-            self.actor.gravity_vec = pm.Vec2(0.0, self.__jump_force)
+            self.actor.launch(speed = self.__jump_force, dt = dt)
 
         # Move the player.
         self.actor.move(dt = dt)
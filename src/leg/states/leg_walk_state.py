@@ -7,6 +7,7 @@ from amonite.settings import Keys
 from amonite.animation import Animation
 import amonite.controllers as controllers
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import custom_setting_keys
 from constants import uniques
 from leg.leg_data_node import LegDataNode
@@ -25,7 +26,7 @@ class LegWalkState(LegState):
         )
 
         # Animation.
-        self.__animation: Animation = Animation(source = "sprites/leg/leg_walk.json")
+        self.__animation: Animation = ANIMATION_REGISTRY.fetch(source = "sprites/leg/leg_walk.json")
 
         # Input.
         self.__move_vec: pyglet.math.Vec2 = pyglet.math.Vec2()
@@ -9,11 +9,24 @@ from amonite.settings import SETTINGS
 from amonite.settings import Keys
 from amonite.settings import load_settings
 
+from allocation_profiler import AllocationProfiler
+from asset_bundle import ASSET_BUNDLE
+from asset_manifest import FONTS
+from asset_preloader import ASSET_PRELOADER
 from constants import uniques
-from global_input_node import GlobalInputNode
+import frame_profiler
+from frame_profiler import FRAME_PROFILER
+from frame_profiler import FrameProfilerOverlay
+from constants import custom_setting_keys
+from input_recording import InputRecorder
+from input_recording import InputReplayer
+from physics_scheduler import PhysicsScheduler
+from render_interpolation import RENDER_INTERPOLATOR
 import scene_composer
 from scene_composer import SceneComposer
 from scene_composer import SCENE_COMPOSER
+from simulation import Simulation
+from sprite_atlas import SPRITE_ATLAS
 from utils import utils
 
 
@@ -21,24 +34,25 @@ class FishGame:
     def __init__(self) -> None:
         # Set resources path.
         pyglet.resource.path = [f"{os.path.dirname(__file__)}/../assets"]
-        pyglet.resource.reindex()
+
+        # Read all assets from the compiled bundle if any, from loose files otherwise.
+        if not ASSET_BUNDLE.mount():
+            pyglet.resource.reindex()
 
         pyglet.options.dpi_scaling = "scaled"
 
         # Load font files.
-        pyglet.font.add_file(f"{pyglet.resource.path[0]}/fonts/I-pixel-u.ttf")
-        pyglet.font.add_file(f"{pyglet.resource.path[0]}/fonts/rughai.ttf")
+        for font in FONTS:
+            ASSET_PRELOADER.load_font(source = font)
 
         # Load settings from file.
         load_settings(f"{pyglet.resource.path[0]}/settings.json")
 
         # Create a window.
         self.__window: pyglet.window.BaseWindow = self.__create_window()
-        self.__fps_display = pyglet.window.FPSDisplay(
-            window = self.__window,
-            color = (0x00, 0x00, 0x00, 0xFF),
-            samples = 16
-        )
+
+        # Sprites are read from the prebuilt atlas, if any.
+        SPRITE_ATLAS.install()
 
         # Controllers.
         controllers.create_controllers(window = self.__window)
@@ -64,25 +78,70 @@ class FishGame:
             program = upscaler_program
         )
 
-        # Create a scene.
-        scene_composer.SCENE_COMPOSER = SceneComposer(
-            window = self.__window,
-            view_width = int(SETTINGS[Keys.VIEW_WIDTH]),
-            view_height = int(SETTINGS[Keys.VIEW_HEIGHT])
+        # Profiler overlay, only shown in debug mode.
+        self.__profiler_overlay: FrameProfilerOverlay = FrameProfilerOverlay(
+            profiler = FRAME_PROFILER,
+            x = 2 * GLOBALS[Keys.SCALING],
+            y = 2 * GLOBALS[Keys.SCALING],
+            scaling = int(GLOBALS[Keys.SCALING]),
+            graph_max_time = 2.0 / float(SETTINGS[custom_setting_keys.RENDER_HZ])
         )
-        scene_composer.SCENE_COMPOSER.load_scene(config_file_path = "scenes/0_0_0.json")
 
-        self.__global_input_node: GlobalInputNode = GlobalInputNode()
+        # Physics scheduler stats, only shown in debug mode.
+        self.__phys_stats_label: pyglet.text.Label = pyglet.text.Label(
+            text = "",
+            font_name = str(SETTINGS[Keys.FONT_NAME]),
+            font_size = 6 * GLOBALS[Keys.SCALING],
+            x = 2 * GLOBALS[Keys.SCALING],
+            y = int((SETTINGS[Keys.VIEW_HEIGHT] - 2) * GLOBALS[Keys.SCALING]),
+            anchor_y = "top",
+            color = (0x00, 0x00, 0x00, 0xFF)
+        )
 
 
         ########################
         # Physics timestep.
         ########################
-        self.phys_accumulated_time: float = 0.0
-        self.phys_timestep: float = 1.0 / float((SETTINGS[Keys.TARGET_FPS]))
+        # Replays only reproduce exactly at the physics rate they were recorded at.
+        input_replayer: InputReplayer | None = InputReplayer(file_path = str(SETTINGS[custom_setting_keys.REPLAY_INPUT])) if SETTINGS[custom_setting_keys.REPLAY_INPUT] else None
+        if input_replayer is not None:
+            SETTINGS[custom_setting_keys.PHYSICS_HZ] = input_replayer.physics_hz
+
+        # The simulation must be created before any scene is loaded.
+        self.phys_timestep: float = 1.0 / float((SETTINGS[custom_setting_keys.PHYSICS_HZ]))
+        self.__simulation: Simulation = Simulation(
+            timestep = self.phys_timestep,
+            input_replayer = input_replayer,
+            allocation_profiler = AllocationProfiler() if int(SETTINGS[custom_setting_keys.PROFILE_ALLOCATIONS]) > 0 else None,
+            scene_build_budget = float(SETTINGS[custom_setting_keys.SCENE_BUILD_BUDGET]) / 1000.0
+        )
+        self.__phys_scheduler: PhysicsScheduler = PhysicsScheduler(
+            timestep = self.phys_timestep,
+            step = self.__physics_step,
+            max_substeps = int(SETTINGS[custom_setting_keys.MAX_PHYSICS_SUBSTEPS]),
+            policy = str(SETTINGS[custom_setting_keys.PHYSICS_CATCH_UP_POLICY])
+        )
         ########################
         ########################
 
+        # Replays start from the scene they were recorded in.
+        scene_src: str = input_replayer.scene_src if input_replayer is not None else "scenes/0_0_0.json"
+
+        if SETTINGS[custom_setting_keys.RECORD_INPUT]:
+            self.__simulation.input_recorder = InputRecorder(
+                file_path = str(SETTINGS[custom_setting_keys.RECORD_INPUT]),
+                physics_hz = float(SETTINGS[custom_setting_keys.PHYSICS_HZ]),
+                scene_src = scene_src
+            )
+
+        # Create a scene.
+        scene_composer.SCENE_COMPOSER = SceneComposer(
+            window = self.__window,
+            view_width = int(SETTINGS[Keys.VIEW_WIDTH]),
+            view_height = int(SETTINGS[Keys.VIEW_HEIGHT])
+        )
+        scene_composer.SCENE_COMPOSER.load_scene(config_file_path = scene_src)
+
     def __create_window(self) -> pyglet.window.BaseWindow:
         window = pyglet.window.Window(
             width = int(SETTINGS[Keys.WINDOW_WIDTH]) if not SETTINGS[Keys.FULLSCREEN] else None,
@@ -118,22 +177,36 @@ class FishGame:
             z_far = 3000
         )
 
-        # Benchmark measures render time.
-        self.__window.clear()
-
         # Upscaler handles maintaining the wanted output resolution.
-        with self.__upscaler:
+        with FRAME_PROFILER.section(frame_profiler.DRAW):
+            self.__window.clear()
+            self.__upscaler.begin()
+
             if uniques.ACTIVE_SCENE is not None:
-                uniques.ACTIVE_SCENE.draw()
+                # Render moving sprites and camera in between the last two physics states, based on the time left in the accumulator.
+                with RENDER_INTERPOLATOR.interpolate(alpha = self.__phys_scheduler.accumulated_time / self.phys_timestep):
+                    uniques.ACTIVE_SCENE.draw()
 
-            if SETTINGS[Keys.DEBUG]:
-                self.__fps_display.draw()
+        # Debug overlays are not profiled.
+        if SETTINGS[Keys.DEBUG]:
+            self.__profiler_overlay.draw()
+            self.__phys_stats_label.text = self.__phys_scheduler.get_stats_text()
+            self.__phys_stats_label.draw()
+
+        with FRAME_PROFILER.section(frame_profiler.UPSCALE):
+            self.__upscaler.end()
+
+        FRAME_PROFILER.end_frame()
+
+    def __physics_step(self) -> bool:
+        # Keep track of the previous physics state for render interpolation.
+        RENDER_INTERPOLATOR.store_previous()
+
+        return self.__simulation.step()
 
     def update(self, dt: float) -> None:
         # upscaler_program["dt"] = dt
 
-        self.phys_accumulated_time += dt
-
         # InputController makes sure every input is handled correctly.
         # with controllers.INPUT_CONTROLLER:
         #     if uniques.ACTIVE_SCENE is not None:
@@ -142,25 +215,19 @@ class FishGame:
         # # Compute collisions through collision manager.
         # controllers.COLLISION_CONTROLLER.update(dt = dt)
 
-        while self.phys_accumulated_time >= self.phys_timestep:
-            # Check for scene change.
-            if uniques.NEXT_SCENE_SRC is not None:
-                if uniques.NEXT_SCENE_SRC != uniques.ACTIVE_SCENE_SRC:
-                    scene_composer.SCENE_COMPOSER.load_scene(config_file_path = uniques.NEXT_SCENE_SRC)
-                continue
+        self.__phys_scheduler.advance(dt = dt)
 
-            # InputController makes sure every input is handled correctly.
-            with controllers.INPUT_CONTROLLER:
-                if uniques.ACTIVE_SCENE is not None:
-                    uniques.ACTIVE_SCENE.update(dt = self.phys_timestep)
-                self.__global_input_node.update(dt = self.phys_timestep)
+    def run(self) -> None:
+        # Physics and rendering are scheduled independently: render interpolation makes up for any difference in rate.
+        # Physics is polled at twice its rate, so that ticks are never performed later than half a timestep.
+        # Updates run on real time, so they're scheduled on the app clock rather than the simulation one.
+        pyglet.app.event_loop.clock.schedule_interval(self.update, 1.0 / (2.0 * float(SETTINGS[custom_setting_keys.PHYSICS_HZ])))
+        pyglet.app.run(interval = 1.0 / float(SETTINGS[custom_setting_keys.RENDER_HZ]))
 
-            # Compute collisions through collision manager.
-            controllers.COLLISION_CONTROLLER.update(dt = self.phys_timestep)
-            self.phys_accumulated_time -= self.phys_timestep
+        if self.__simulation.input_recorder is not None:
+            self.__simulation.input_recorder.close()
 
-    def run(self) -> None:
-        pyglet.clock.schedule_interval(self.update, 1.0 / (2.0 * float(SETTINGS[Keys.TARGET_FPS])))
-        pyglet.app.run(interval =  1.0 / float(SETTINGS[Keys.TARGET_FPS]))
+        if self.__simulation.allocation_profiler is not None:
+            print(self.__simulation.allocation_profiler.get_report(top = int(SETTINGS[custom_setting_keys.PROFILE_ALLOCATIONS])))
 
 FishGame().run()
\ No newline at end of file
@@ -0,0 +1,93 @@
+from typing import Callable
+
+# Catch up policies.
+# Discards any accumulated time left over after the maximum number of substeps: the game skips ahead.
+CATCH_UP_DROP: str = "drop"
+# Keeps up to a whole frame worth of accumulated time for later frames: the game slows down until it catches up.
+CATCH_UP_SLOW: str = "slow"
+
+class PhysicsScheduler:
+    """
+    Fixed timestep scheduler for physics ticks.
+    Consumes real elapsed time in fixed steps, performing at most [max_substeps] ticks per frame, so that long hitches (e.g. scene loads or GC pauses) never spiral into endless catch up ticks.
+    """
+
+    def __init__(
+        self,
+        timestep: float,
+        step: Callable[[], bool],
+        max_substeps: int = 5,
+        policy: str = CATCH_UP_DROP
+    ) -> None:
+        """
+        [step] is called once per tick and should return False if the tick consumed no time (e.g. it was spent switching scene).
+        """
+
+        assert max_substeps > 0, "At least one substep per frame is needed"
+        assert policy in (CATCH_UP_DROP, CATCH_UP_SLOW), f"Unknown catch up policy: {policy}"
+
+        self.timestep: float = timestep
+        self.max_substeps: int = max_substeps
+        self.policy: str = policy
+        self.__step: Callable[[], bool] = step
+
+        self.accumulated_time: float = 0.0
+
+        # Counters.
+        # Total number of ticks performed.
+        self.ticks: int = 0
+        # Number of ticks never performed because of the maximum substeps per frame.
+        self.dropped_ticks: int = 0
+        # Number of ticks performed as catch up in frames which already performed one.
+        self.late_ticks: int = 0
+        # Number of ticks performed by the last frame.
+        self.frame_substeps: int = 0
+
+    def advance(self, dt: float) -> None:
+        """
+        Accumulates [dt] seconds of real time and performs all due ticks, up to the maximum substeps per frame.
+        """
+
+        self.accumulated_time += dt
+        self.frame_substeps = 0
+
+        while self.accumulated_time >= self.timestep:
+            if self.frame_substeps >= self.max_substeps:
+                self.__catch_up()
+                break
+
+            self.frame_substeps += 1
+
+            # Scene changes take up a whole substep without consuming any accumulated time.
+            if not self.__step():
+                continue
+
+            self.accumulated_time -= self.timestep
+            self.ticks += 1
+
+            if self.frame_substeps > 1:
+                self.late_ticks += 1
+
+    def __catch_up(self) -> None:
+        """
+        Applies the catch up policy to the time left over after the maximum number of substeps.
+        """
+
+        # Slow policy keeps at most a whole frame worth of ticks for later.
+        kept_ticks: int = self.max_substeps if self.policy == CATCH_UP_SLOW else 0
+
+        due_ticks: int = int(self.accumulated_time // self.timestep)
+        if due_ticks <= kept_ticks:
+            return
+
+        self.dropped_ticks += due_ticks - kept_ticks
+        self.accumulated_time -= (due_ticks - kept_ticks) * self.timestep
+
+    def reset_counters(self) -> None:
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self.late_ticks = 0
+        self.frame_substeps = 0
+
+    def get_stats_text(self) -> str:
+        return f"ticks: {self.ticks} dropped: {self.dropped_ticks} late: {self.late_ticks} substeps: {self.frame_substeps}/{self.max_substeps}"
@@ -4,14 +4,16 @@ import pyglet
 import amonite.controllers as controllers
 from amonite.node import PositionNode
 from amonite.sprite_node import SpriteNode
-from amonite.animation import Animation
 from amonite.collision.collision_node import CollisionNode
 from amonite.collision.collision_node import CollisionType
 from amonite.collision.collision_shape import CollisionRect
 from amonite.collision.collision_node import CollisionMethod
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import collision_tags
 from interactable.interactable import Interactable
+from utils.utils import move_to_batch
+from utils.utils import pause_animations
 
 class PressButtonNode(PositionNode, Interactable):
     def __init__(
@@ -41,8 +43,11 @@ class PressButtonNode(PositionNode, Interactable):
         ################################
         # Sprite.
         ################################
+        self.__button_up_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/buttons/button_up.json").content
+        self.__button_down_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = "sprites/buttons/button_down.json").content
+
         self.sprite: SpriteNode = SpriteNode(
-            resource = Animation(source = "sprites/buttons/button_up.json").content,
+            resource = self.__button_up_img,
             y_sort = False,
             batch = batch
         )
@@ -75,6 +80,37 @@ class PressButtonNode(PositionNode, Interactable):
         ################################
         ################################
 
+    def reset(
+        self,
+        x: float,
+        y: float,
+        allow_turning_off: bool = True,
+        on_triggered_on: Callable | None = None,
+        on_triggered_off: Callable | None = None
+    ) -> None:
+        """
+        Turns the button off at the provided position and registers its trigger again, as if just created.
+        """
+
+        Interactable.reset(
+            self,
+            one_shot = not allow_turning_off
+        )
+
+        self.__on_triggered_on = on_triggered_on
+        self.__on_triggered_off = on_triggered_off
+
+        self.sprite.set_image(self.__button_up_img)
+
+        self.set_position((x, y))
+        controllers.COLLISION_CONTROLLER.add_collider(self.__interact_trigger)
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        move_to_batch(self, batch = batch)
+
+    def set_paused(self, paused: bool) -> None:
+        pause_animations(self, paused = paused)
+
     def interact(
         self,
         tags: list[str]
@@ -82,12 +118,12 @@ class PressButtonNode(PositionNode, Interactable):
         super().interact(tags = tags)
 
         if self.on:
-            self.sprite.set_image(Animation(source = "sprites/buttons/button_down.json").content)
+            self.sprite.set_image(self.__button_down_img)
 
             if self.__on_triggered_on is not None:
                 self.__on_triggered_on()
         else:
-            self.sprite.set_image(Animation(source = "sprites/buttons/button_up.json").content)
+            self.sprite.set_image(self.__button_up_img)
 
             if self.__on_triggered_off is not None:
                 self.__on_triggered_off()
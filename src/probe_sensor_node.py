@@ -0,0 +1,156 @@
+from typing import Any
+from typing import Callable
+
+from amonite.collision.collision_node import CollisionMethod
+from amonite.collision.collision_node import CollisionNode
+from amonite.collision.collision_node import CollisionType
+from amonite.collision.collision_shape import CollisionRect
+from amonite.utils.utils import CollisionHit
+
+from constants import collision_tags
+from constants.collision_tags import TagMask
+
+class SensorProbe:
+    """
+    Single probe of a probe sensor: a rect with its own tags and collision callback, behaving just like a standalone passive sensor.
+    """
+
+    __slots__ = (
+        "active_tags",
+        "mask",
+        "shape",
+        "on_triggered",
+        "collisions",
+        "in_collisions",
+        "out_collisions"
+    )
+
+    def __init__(
+        self,
+        active_tags: list[str],
+        shape: CollisionRect,
+        on_triggered: Callable[[int, Any, bool], None] | None = None
+    ) -> None:
+        self.active_tags: list[str] = active_tags
+        self.mask: TagMask = collision_tags.get_mask(tags = active_tags)
+        self.shape: CollisionRect = shape
+        self.on_triggered: Callable[[int, Any, bool], None] | None = on_triggered
+
+        self.collisions: set[CollisionNode] = set()
+        self.in_collisions: set[CollisionNode] = set()
+        self.out_collisions: set[CollisionNode] = set()
+
+class ProbeSensorNode(CollisionNode):
+    """
+    Dynamic passive sensor made of multiple probes (e.g. a character's ground, roof and water sensors), checked against each static collider in a single query.
+    Each probe gets its own enter and exit callbacks, in the same order separate sensors would, so that replacing them with probes changes no behavior.
+    Other colliders get enter and exit callbacks once for all probes, with all probes' tags.
+    """
+
+    def __init__(
+        self,
+        probes: list[SensorProbe],
+        x: float = 0,
+        y: float = 0
+    ) -> None:
+        assert len(probes) > 0
+
+        # The sensor's own shape covers all probes, so that it's only checked against static colliders near any of them.
+        left: float = min(-probe.shape.anchor_x for probe in probes)
+        bottom: float = min(-probe.shape.anchor_y for probe in probes)
+        right: float = max(-probe.shape.anchor_x + probe.shape.width for probe in probes)
+        top: float = max(-probe.shape.anchor_y + probe.shape.height for probe in probes)
+
+        super().__init__(
+            x = x,
+            y = y,
+            collision_type = CollisionType.DYNAMIC,
+            collision_method = CollisionMethod.PASSIVE,
+            sensor = True,
+            active_tags = list(dict.fromkeys(tag for probe in probes for tag in probe.active_tags)),
+            passive_tags = [],
+            shape = CollisionRect(
+                anchor_x = int(-left),
+                anchor_y = int(-bottom),
+                width = int(right - left),
+                height = int(top - bottom)
+            ),
+            on_triggered = self.__on_triggered
+        )
+
+        self.__probes: list[SensorProbe] = probes
+
+        for probe in self.__probes:
+            self.add_component(probe.shape)
+
+    def collide(self, other) -> CollisionHit | None:
+        assert isinstance(other, CollisionNode)
+
+        other_mask: TagMask = collision_tags.get_mask(tags = other.passive_tags)
+
+        colliding: bool = False
+        for probe in self.__probes:
+            # Make sure there's at least one matching tag.
+            if not probe.mask & other_mask:
+                colliding |= other in probe.collisions
+                continue
+
+            collision_hit: CollisionHit | None = probe.shape.swept_collide(other.shape)
+
+            if other not in probe.collisions and collision_hit is not None:
+                probe.collisions.add(other)
+                probe.in_collisions.add(other)
+                self.in_collisions.add(other)
+            elif other in probe.collisions and collision_hit is None:
+                probe.collisions.remove(other)
+                probe.out_collisions.add(other)
+                self.out_collisions.add(other)
+
+            colliding |= other in probe.collisions
+
+        if colliding:
+            self.collisions.add(other)
+        else:
+            self.collisions.discard(other)
+
+        # Passive colliders never stop their owner's movement.
+        return None
+
+    def reset(self) -> None:
+        """
+        Stops the sensor and forgets all its and its probes' ongoing collisions, so that it can be reused as if it was just created.
+        """
+
+        self.set_velocity((0.0, 0.0))
+
+        for collider in (self, *self.__probes):
+            collider.collisions.clear()
+            collider.in_collisions.clear()
+            collider.out_collisions.clear()
+
+    def delete(self) -> None:
+        for probe in self.__probes:
+            probe.shape.delete()
+
+        super().delete()
+
+    def __on_triggered(self, tags: int, other: CollisionNode, entered: bool) -> None:
+        # Triggered by the collision controller for colliders just entered or exited: dispatch all probes' events at once, on the first call, probe by probe.
+        if other in self.in_collisions or other in self.out_collisions:
+            for probe in self.__probes:
+                for out_other in probe.out_collisions:
+                    if probe.on_triggered is not None:
+                        probe.on_triggered(collision_tags.get_mask(tags = out_other.passive_tags), out_other, False)
+                for in_other in probe.in_collisions:
+                    if probe.on_triggered is not None:
+                        probe.on_triggered(collision_tags.get_mask(tags = in_other.passive_tags), in_other, True)
+
+                probe.in_collisions.clear()
+                probe.out_collisions.clear()
+            return
+
+        # Triggered by the collision controller for a collider removed while colliding: all probes colliding with it exit.
+        if not entered:
+            for probe in self.__probes:
+                if other in probe.collisions and probe.on_triggered is not None:
+                    probe.on_triggered(tags, other, False)
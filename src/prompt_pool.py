@@ -0,0 +1,79 @@
+import pyglet
+
+from amonite.sprite_node import SpriteNode
+
+class PromptPool:
+    """
+    Pool of prompt sprites (e.g. interaction and grab button icons), shared by all prompting nodes.
+    Sprites are only created when no hidden one is available in the requested batch: after that they're just shown, moved and hidden.
+    """
+
+    def __init__(self) -> None:
+        # Hidden sprites, by batch.
+        self.__free: dict[pyglet.graphics.Batch | None, list[SpriteNode]] = {}
+
+        # All sprites ever created, hidden or not.
+        self.__sprites: list[SpriteNode] = []
+
+    def acquire(
+        self,
+        image: pyglet.image.AbstractImage | pyglet.image.Animation,
+        position: tuple[float, float],
+        batch: pyglet.graphics.Batch | None = None
+    ) -> SpriteNode:
+        """
+        Shows a prompt sprite with the provided image at the provided position and returns it.
+        The returned sprite should be handed back through release() once done, never deleted.
+        """
+
+        free: list[SpriteNode] = self.__free.setdefault(batch, [])
+
+        prompt: SpriteNode
+        if len(free) > 0:
+            prompt = free.pop()
+
+            # Setting an image restarts its animation, so only do it when actually needed.
+            if prompt.get_image() is not image:
+                prompt.set_image(image)
+        else:
+            prompt = SpriteNode(
+                resource = image,
+                y_sort = False,
+                batch = batch
+            )
+            self.__sprites.append(prompt)
+
+        prompt.set_position(position = position)
+        prompt.sprite.paused = False
+        prompt.sprite.visible = True
+
+        return prompt
+
+    def release(
+        self,
+        prompt: SpriteNode,
+        batch: pyglet.graphics.Batch | None = None
+    ) -> None:
+        """
+        Hides the provided prompt sprite and makes it available for reuse in the provided batch.
+        """
+
+        prompt.sprite.visible = False
+        prompt.sprite.paused = True
+        self.__free.setdefault(batch, []).append(prompt)
+
+    def clear(self) -> None:
+        """
+        Deletes all prompt sprites. Should be called whenever the batches they're drawn in are discarded (e.g. on scene change).
+        """
+
+        for prompt in self.__sprites:
+            prompt.delete()
+
+        self.__sprites.clear()
+        self.__free.clear()
+
+    def __len__(self) -> int:
+        return len(self.__sprites)
+
+PROMPT_POOL: PromptPool = PromptPool()
@@ -3,13 +3,15 @@ import pyglet
 import amonite.controllers as controllers
 from amonite.node import PositionNode
 from amonite.sprite_node import SpriteNode
-from amonite.animation import Animation
 from amonite.collision.collision_node import CollisionNode
 from amonite.collision.collision_node import CollisionType
 from amonite.collision.collision_shape import CollisionRect
 from amonite.collision.collision_node import CollisionMethod
 
+from animation_registry import ANIMATION_REGISTRY
 from constants import collision_tags
+from utils.utils import move_to_batch
+from utils.utils import pause_animations
 
 sprite_on_file: str = "sprites/platforms/platform_active.json"
 sprite_off_file: str = "sprites/platforms/platform_inactive.json"
@@ -42,8 +44,13 @@ class RedPlatformNode(PositionNode):
         ################################
         # Sprite.
         ################################
+        self.__sprite_on_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = sprite_on_file).content
+        self.__sprite_off_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = sprite_off_file).content
+        self.__sprite_on_to_off_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = sprite_on_to_off_file).content
+        self.__sprite_off_to_on_img: pyglet.image.Animation = ANIMATION_REGISTRY.fetch(source = sprite_off_to_on_file).content
+
         self.sprite: SpriteNode = SpriteNode(
-            resource = Animation(source = sprite_on_file if starts_on else sprite_off_file).content,
+            resource = self.__sprite_on_img if starts_on else self.__sprite_off_img,
             y_sort = False,
             on_animation_end = self.__on_sprite_animation_end,
             batch = batch
@@ -78,6 +85,33 @@ class RedPlatformNode(PositionNode):
         ################################
         ################################
 
+    def reset(
+        self,
+        x: float,
+        y: float,
+        starts_on: bool = False
+    ) -> None:
+        """
+        Restores the initial state at the provided position, as if just created.
+        """
+
+        self.__on = starts_on
+        self.__switching = False
+
+        self.sprite.set_image(self.__sprite_on_img if starts_on else self.__sprite_off_img)
+
+        self.set_position((x, y))
+
+        # Only activate the collider if starting on.
+        if starts_on:
+            controllers.COLLISION_CONTROLLER.add_collider(self.__collider)
+
+    def set_batch(self, batch: pyglet.graphics.Batch) -> None:
+        move_to_batch(self, batch = batch)
+
+    def set_paused(self, paused: bool) -> None:
+        pause_animations(self, paused = paused)
+
     def update(self, dt: float) -> None:
         return super().update(dt)
 
@@ -88,10 +122,10 @@ class RedPlatformNode(PositionNode):
         self.__switching = False
 
         if self.__on:
-            self.sprite.set_image(Animation(source = sprite_on_file).content)
+            self.sprite.set_image(self.__sprite_on_img)
             controllers.COLLISION_CONTROLLER.add_collider(self.__collider)
         else:
-            self.sprite.set_image(Animation(source = sprite_off_file).content)
+            self.sprite.set_image(self.__sprite_off_img)
             controllers.COLLISION_CONTROLLER.remove_collider(self.__collider)
 
     def trigger_on(self) -> None:
@@ -100,7 +134,7 @@ class RedPlatformNode(PositionNode):
 
         self.__switching = True
         self.__on = True
-        self.sprite.set_image(Animation(source = sprite_on_to_off_file).content)
+        self.sprite.set_image(self.__sprite_on_to_off_img)
 
     def trigger_off(self) -> None:
         if not self.__on:
@@ -108,9 +142,9 @@ class RedPlatformNode(PositionNode):
 
         self.__switching = True
         self.__on = False
-        self.sprite.set_image(Animation(source = sprite_off_to_on_file).content)
+        self.sprite.set_image(self.__sprite_off_to_on_img)
 
     def switch(self) -> None:
         self.__switching = True
         self.__on = not self.__on
-        self.sprite.set_image(Animation(source = sprite_on_to_off_file if self.__on else sprite_off_to_on_file).content)
\ No newline at end of file
+        self.sprite.set_image(self.__sprite_on_to_off_img if self.__on else self.__sprite_off_to_on_img)
\ No newline at end of file
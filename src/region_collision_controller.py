@@ -0,0 +1,272 @@
+from amonite.collision.collision_controller import CollisionController
+from amonite.collision.collision_controller import VELOCITY_TOLERANCE
+from amonite.collision.collision_node import CollisionMethod
+from amonite.collision.collision_node import CollisionNode
+from amonite.collision.collision_node import CollisionType
+from amonite.collision.collision_shape import CollisionRect
+from amonite.utils.utils import CollisionHit
+
+from constants import collision_tags
+from constants.collision_tags import TagMask
+from static_grid import StaticGrid
+
+# Distance (in pixels) static colliders are looked up beyond each actor's swept bounds, so that touching colliders are never missed.
+QUERY_MARGIN: float = 1.0
+
+class RegionCollisionController(CollisionController):
+    """
+    Collision controller which can deactivate colliders without unregistering them (e.g. colliders in scene regions far from any character).
+    Inactive colliders are kept registered, so that their owners can keep adding and removing them as usual, but are never checked for collisions.
+    Active static colliders are indexed in a uniform grid, so that each dynamic collider is only checked against fixed static ones (see set_fixed()) near its path.
+    Collision tags are turned to bitmasks on registration, so that pairs of colliders with no common tag are skipped before any shape test and collision callbacks get tag masks.
+    """
+
+    def __init__(self, cell_size: int = 64) -> None:
+        super().__init__()
+
+        # All registered colliders, in registration order, whether active or not.
+        self.__registered: list[CollisionNode] = []
+
+        # All registered dynamic colliders, in registration order.
+        self.__dynamic: list[CollisionNode] = []
+
+        # Active and passive tag masks of all registered colliders.
+        self.__masks: dict[CollisionNode, tuple[TagMask, TagMask]] = {}
+
+        # Colliders which should not be checked for collisions, even if registered.
+        self.__inactive: set[CollisionNode] = set()
+
+        # Active colliders, by type, in registration order.
+        self.__active_dynamic: list[CollisionNode] = []
+        self.__active_static: list[CollisionNode] = []
+
+        # Static colliders known never to move (e.g. walls and waters).
+        self.__fixed: set[CollisionNode] = set()
+
+        # Index of all active static colliders, only built again when any of them is removed or fixed.
+        self.__grid: StaticGrid = StaticGrid(cell_size = cell_size)
+        self.__grid_outdated: bool = True
+
+    def add_collider(self, collider: CollisionNode) -> None:
+        self.__registered.append(collider)
+        self.__masks[collider] = (
+            collision_tags.get_mask(tags = collider.active_tags),
+            collision_tags.get_mask(tags = collider.passive_tags)
+        )
+
+        if collider.type == CollisionType.DYNAMIC:
+            self.__dynamic.append(collider)
+
+        if collider not in self.__inactive:
+            self.__activate(collider = collider)
+
+    def remove_collider(self, collider: CollisionNode) -> None:
+        passive_mask: TagMask = self.__get_masks(collider = collider)[1]
+
+        if collider in self.__registered:
+            self.__registered.remove(collider)
+
+            # The same collider may be registered more than once.
+            if collider not in self.__registered:
+                del self.__masks[collider]
+
+        if collider in self.__dynamic:
+            self.__dynamic.remove(collider)
+
+        # Just like the base controller, only active colliders trigger exit collisions.
+        if collider in self.__active_dynamic:
+            self.__active_dynamic.remove(collider)
+        elif collider in self.__active_static:
+            self.__active_static.remove(collider)
+            self.__grid_outdated = True
+        else:
+            return
+
+        # Trigger exit collisions on all dynamic colliders still colliding with the removed one.
+        for other in self.__active_dynamic:
+            if collider in other.collisions and other.on_triggered is not None:
+                other.on_triggered(passive_mask, collider, False)
+
+    def clear(self) -> None:
+        self.__registered.clear()
+        self.__masks.clear()
+        self.__dynamic.clear()
+        self.__active_dynamic.clear()
+        self.__active_static.clear()
+        self.__fixed.clear()
+        self.__grid_outdated = True
+
+    def get_dynamic_colliders(self) -> list[CollisionNode]:
+        """
+        Returns all registered dynamic colliders, whether active or not.
+        """
+
+        return self.__dynamic
+
+    def set_fixed(self, colliders: set[CollisionNode]) -> None:
+        """
+        Marks all provided colliders as never moving, so that they're only checked against dynamic colliders near them.
+        All other static colliders are checked against every dynamic collider, since they may move (e.g. sensors following characters).
+        """
+
+        self.__fixed = colliders
+        self.__grid_outdated = True
+
+    def set_inactive(self, colliders: set[CollisionNode]) -> None:
+        """
+        Deactivates all provided colliders and activates all others.
+        Active colliders are checked in the same order they were registered in, regardless of how many times they were deactivated, so that collisions are resolved the same way.
+        No exit collision is triggered for deactivated colliders.
+        """
+
+        self.__inactive = colliders
+
+        self.__active_dynamic.clear()
+        self.__active_static.clear()
+        self.__grid_outdated = True
+
+        for collider in self.__registered:
+            if collider not in colliders:
+                self.__activate(collider = collider)
+
+    def update(self, dt: float) -> None:
+        # Same as the base controller, only looking up static colliders through the grid.
+        for actor in self.__active_dynamic:
+            velocity: tuple[float, float] = actor.get_velocity()
+            actor.set_velocity((velocity[0] * dt, velocity[1] * dt))
+
+        for actor in self.__active_dynamic:
+            active_mask: TagMask = self.__get_masks(collider = actor)[0]
+
+            # Trigger all collisions from the previous step.
+            for other in actor.out_collisions:
+                if actor.on_triggered is not None:
+                    actor.on_triggered(self.__get_masks(collider = other)[1], other, False)
+                if other.on_triggered is not None:
+                    other.on_triggered(active_mask, actor, False)
+            for other in actor.in_collisions:
+                if actor.on_triggered is not None:
+                    actor.on_triggered(self.__get_masks(collider = other)[1], other, True)
+                if other.on_triggered is not None:
+                    other.on_triggered(active_mask, actor, True)
+
+            # Clear all collisions after they've been triggered.
+            actor.in_collisions.clear()
+            actor.out_collisions.clear()
+
+            # Check for new collisions.
+            self.__handle_actor_collisions(actor = actor)
+
+    def __get_masks(self, collider: CollisionNode) -> tuple[TagMask, TagMask]:
+        """
+        Returns the active and passive tag masks of the provided collider, even if not registered (e.g. removed while colliding).
+        """
+
+        masks: tuple[TagMask, TagMask] | None = self.__masks.get(collider)
+
+        if masks is None:
+            masks = (
+                collision_tags.get_mask(tags = collider.active_tags),
+                collision_tags.get_mask(tags = collider.passive_tags)
+            )
+
+        return masks
+
+    def __activate(self, collider: CollisionNode) -> None:
+        if collider.type == CollisionType.DYNAMIC:
+            self.__active_dynamic.append(collider)
+        elif collider.type == CollisionType.STATIC:
+            self.__active_static.append(collider)
+
+            # New static colliders come last, so they can just be appended to an up to date grid.
+            if not self.__grid_outdated:
+                self.__grid.add(collider = collider, fixed = collider in self.__fixed)
+
+    def __get_candidates(self, actor: CollisionNode) -> list[CollisionNode]:
+        """
+        Returns all active static colliders the provided actor may collide with over its whole path, in registration order.
+        Static colliders the actor is currently colliding with are always included, so that exit collisions are still detected.
+        Colliders sharing no tag with the actor are never returned, since they can't collide with it.
+        """
+
+        if self.__grid_outdated:
+            self.__grid.build(colliders = self.__active_static, fixed = self.__fixed)
+            self.__grid_outdated = False
+
+        active_mask: TagMask = self.__masks[actor][0]
+
+        # Colliders with no known bounds are checked against all static colliders.
+        if not isinstance(actor.shape, CollisionRect):
+            return [other for other in self.__active_static if active_mask & self.__masks[other][1]]
+
+        bounds: tuple[float, float, float, float] = actor.shape.get_collision_bounds()
+        velocity_x: float = actor.velocity_x
+        velocity_y: float = actor.velocity_y
+
+        candidates: list[CollisionNode] = [other for other in self.__grid.query(bounds = (
+            bounds[0] + min(velocity_x, 0.0) - QUERY_MARGIN,
+            bounds[1] + min(velocity_y, 0.0) - QUERY_MARGIN,
+            bounds[2] + abs(velocity_x) + QUERY_MARGIN * 2,
+            bounds[3] + abs(velocity_y) + QUERY_MARGIN * 2
+        )) if active_mask & self.__masks[other][1]]
+
+        missing: list[CollisionNode] = [other for other in actor.collisions if other.type == CollisionType.STATIC and other not in candidates]
+        if len(missing) > 0:
+            active: set[CollisionNode] = set(self.__active_static)
+            candidates.extend(other for other in missing if other in active)
+            candidates.sort(key = self.__active_static.index)
+
+        return candidates
+
+    def __handle_actor_collisions(self, actor: CollisionNode) -> None:
+        """
+        Computes all collisions on the provided actor.
+        Sliding never takes the actor out of its initial path, so static colliders are only looked up once.
+        """
+
+        candidates: list[CollisionNode] = self.__get_candidates(actor = actor)
+
+        if actor.method == CollisionMethod.PASSIVE:
+            for other in candidates:
+                if actor == other:
+                    continue
+
+                actor.collide(other)
+            return
+
+        # Solve collision and iterate until velocity is exhausted.
+        while abs(actor.velocity_x) > VELOCITY_TOLERANCE or abs(actor.velocity_y) > VELOCITY_TOLERANCE:
+            nearest_collision: CollisionHit | None = None
+
+            for other in candidates:
+                if actor == other:
+                    continue
+
+                collision_hit: CollisionHit | None = actor.collide(other)
+
+                # Only save collision if it actually happened.
+                if not other.sensor and collision_hit is not None and collision_hit.time < 1.0:
+                    if nearest_collision is None or collision_hit.time < nearest_collision.time:
+                        nearest_collision = collision_hit
+
+            actor_position: tuple[float, float] = actor.get_position()
+
+            if nearest_collision is not None:
+                # Move to the collision point.
+                actor.set_position((
+                    actor_position[0] + actor.velocity_x * nearest_collision.time,
+                    actor_position[1] + actor.velocity_y * nearest_collision.time
+                ))
+
+                # Compute sliding reaction.
+                x_result: float = (actor.velocity_x * abs(nearest_collision.normal.y)) * (1.0 - nearest_collision.time)
+                y_result: float = (actor.velocity_y * abs(nearest_collision.normal.x)) * (1.0 - nearest_collision.time)
+
+                # Set the resulting velocity for the next iteration.
+                actor.set_velocity((x_result, y_result))
+            else:
+                actor.set_position((
+                    actor_position[0] + actor.velocity_x,
+                    actor_position[1] + actor.velocity_y
+                ))
+                actor.set_velocity((0.0, 0.0))
@@ -0,0 +1,119 @@
+from amonite.camera import Camera
+from amonite.sprite_node import SpriteNode
+
+class RenderInterpolator:
+    """
+    Interpolates rendered positions of moving sprites and of the active scene camera between the previous and the current physics states.
+    Allows rendering at any rate, independently of the physics rate, with no judder.
+    """
+
+    def __init__(self) -> None:
+        # All moving sprites, mapped to their position at the start of the current physics tick.
+        self.__sprites: dict[SpriteNode, tuple[float, float, float] | None] = {}
+
+        self.__camera: Camera | None = None
+        self.__camera_position: tuple[float, float] | None = None
+
+    def register(self, sprite: SpriteNode) -> None:
+        """
+        Starts interpolating the provided sprite, from the next physics tick on.
+        """
+
+        self.__sprites[sprite] = None
+
+    def unregister(self, sprite: SpriteNode) -> None:
+        self.__sprites.pop(sprite, None)
+
+    def set_camera(self, camera: Camera | None) -> None:
+        """
+        Starts interpolating the provided camera, from the next physics tick on. Should be called whenever the active scene is changed.
+        """
+
+        self.__camera = camera
+        self.__camera_position = None
+
+    def clear(self) -> None:
+        """
+        Stops interpolating all sprites and camera.
+        """
+
+        self.__sprites.clear()
+        self.__camera = None
+        self.__camera_position = None
+
+    def store_previous(self) -> None:
+        """
+        Stores the current sprites and camera positions as previous state. Should be called right before every physics tick.
+        """
+
+        for sprite in self.__sprites:
+            self.__sprites[sprite] = sprite.sprite.position
+
+        self.__camera_position = self.__camera.position if self.__camera is not None else None
+
+    def interpolate(self, alpha: float) -> "RenderInterpolation":
+        """
+        Returns a context in which all sprites and camera are placed [alpha] (0 to 1) of the way between their previous and current positions.
+        Current positions are restored on exit, so that physics never sees interpolated positions.
+        """
+
+        return RenderInterpolation(
+            sprites = self.__sprites,
+            camera = self.__camera,
+            camera_position = self.__camera_position,
+            alpha = min(max(alpha, 0.0), 1.0)
+        )
+
+class RenderInterpolation:
+    """
+    Context manager applying render interpolation for a single frame.
+    """
+
+    def __init__(
+        self,
+        sprites: dict[SpriteNode, tuple[float, float, float] | None],
+        camera: Camera | None,
+        camera_position: tuple[float, float] | None,
+        alpha: float
+    ) -> None:
+        self.__sprites: dict[SpriteNode, tuple[float, float, float] | None] = sprites
+        self.__camera: Camera | None = camera
+        self.__camera_position: tuple[float, float] | None = camera_position
+        self.__alpha: float = alpha
+
+        # Current (physics) positions, restored on exit.
+        self.__current_positions: list[tuple[SpriteNode, tuple[float, float, float]]] = []
+        self.__current_camera_position: tuple[float, float] | None = None
+
+    def __lerp(self, previous: float, current: float) -> float:
+        return previous + (current - previous) * self.__alpha
+
+    def __enter__(self) -> None:
+        for sprite, previous in self.__sprites.items():
+            # Sprites registered during the last tick have no previous position yet.
+            if previous is None:
+                continue
+
+            current: tuple[float, float, float] = sprite.sprite.position
+            self.__current_positions.append((sprite, current))
+            sprite.sprite.position = (
+                self.__lerp(previous[0], current[0]),
+                self.__lerp(previous[1], current[1]),
+                current[2]
+            )
+
+        if self.__camera is not None and self.__camera_position is not None:
+            self.__current_camera_position = self.__camera.position
+            self.__camera.position = (
+                self.__lerp(self.__camera_position[0], self.__current_camera_position[0]),
+                self.__lerp(self.__camera_position[1], self.__current_camera_position[1])
+            )
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        for sprite, current in self.__current_positions:
+            sprite.sprite.position = current
+
+        if self.__camera is not None and self.__current_camera_position is not None:
+            self.__camera.position = self.__current_camera_position
+
+RENDER_INTERPOLATOR: RenderInterpolator = RenderInterpolator()
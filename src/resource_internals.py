@@ -0,0 +1,80 @@
+import pyglet
+
+# pyglet version the private pyglet.resource internals used here are known to match, same as in requirements.txt.
+# Check all functions below whenever pyglet is upgraded.
+PYGLET_VERSION: str = "2.1.6"
+
+# Private attributes of pyglet.resource's default loader used here.
+LOADER_INTERNALS: tuple[str, ...] = (
+    "_index",
+    "_ensure_index",
+    "_cached_images",
+    "_get_texture_atlas_bin"
+)
+
+def is_supported() -> bool:
+    """
+    Tells whether pyglet.resource's default loader still has all private internals used here.
+    If not, no asset bundle, sprite atlas or preloaded texture is handed to pyglet.resource, which just loads loose files lazily as usual.
+    """
+
+    return all(hasattr(pyglet.resource._default_loader, internal) for internal in LOADER_INTERNALS)
+
+def check() -> bool:
+    """
+    Same as is_supported(), but prints a warning if not supported.
+    """
+
+    if is_supported():
+        return True
+
+    print(f"pyglet {pyglet.version} lacks the pyglet.resource internals used for asset bundles and preloading (last checked with pyglet {PYGLET_VERSION}), assets are loaded lazily instead")
+
+    return False
+
+def set_location(name: str, location: pyglet.resource.Location) -> None:
+    """
+    Makes pyglet.resource read the provided file name (relative to the assets dir) from the provided location, in place of any file indexed so far.
+    """
+
+    if not is_supported():
+        return
+
+    loader: pyglet.resource.Loader = pyglet.resource._default_loader
+    loader._ensure_index()
+    loader._index[name] = location
+
+# pyglet.image is only referenced in quoted annotations, since importing it needs a GL context, which atlas_builder.py runs without.
+def get_cached_image(name: str) -> "pyglet.image.AbstractImage | None":
+    """
+    Returns the image pyglet.resource already loaded for the provided name (relative to the assets dir), if any.
+    """
+
+    if not is_supported():
+        return None
+
+    return pyglet.resource._default_loader._cached_images.get(name)
+
+def cache_image(name: str, image: "pyglet.image.AbstractImage") -> None:
+    """
+    Registers the provided image with pyglet.resource, so that all its loads of the provided name (relative to the assets dir) return it.
+    pyglet.resource only keeps a weak reference to it, so the caller must keep it alive for as long as it's needed.
+    """
+
+    if not is_supported():
+        return
+
+    pyglet.resource._default_loader._cached_images[name] = image
+
+def allocate_texture(image_data: "pyglet.image.ImageData", border: int) -> "pyglet.image.AbstractImage":
+    """
+    Uploads the provided image data to a texture, in the same texture atlases pyglet.resource would use when lazily loading it.
+    Must be called on the main thread.
+    """
+
+    if not is_supported():
+        return image_data.get_texture()
+
+    texture_bin: pyglet.image.atlas.TextureBin | None = pyglet.resource._default_loader._get_texture_atlas_bin(image_data.width, image_data.height, border)
+
+    return texture_bin.add(image_data, border) if texture_bin is not None else image_data.get_texture()
@@ -0,0 +1,637 @@
+import argparse
+import os
+import struct
+import sys
+from typing import Any
+from typing import Iterator
+import pyglet
+
+from asset_bundle import ASSET_BUNDLE
+from asset_bundle import ASSETS_DIR
+from asset_manifest import TILESETS_PATH
+from scene_template import ButtonTemplate
+from scene_template import DoorTemplate
+from scene_template import EntityTemplate
+from scene_template import EntityType
+from scene_template import HittableTemplate
+from scene_template import InkButtonTemplate
+from scene_template import RedPlatformTemplate
+from scene_template import SceneTemplate
+from scene_template import TilemapTemplate
+from scene_template import TriggerTemplate
+
+# File layout (little endian):
+# header: magic and version.
+# sources: all files the scene was compiled from, used to tell whether it's outdated.
+# scene: title, tilemap (size, tilesets and int16 tile indexes of each layer), waters, walls and children, in this order.
+# Strings are stored as their UTF-8 length (uint16) followed by their content.
+# Version 2 stores merged hittables.
+MAGIC: bytes = b"FGSC"
+VERSION: int = 2
+
+HEADER_FORMAT: struct.Struct = struct.Struct("<4sB")
+
+# Scene files and their compiled counterparts, relative to the assets dir.
+SCENES_DIR: str = "scenes"
+COMPILED_SCENES_DIR: str = "compiled_scenes"
+
+# Scene children types by their name in scene files.
+ENTITY_TYPES: dict[str, EntityType] = {
+    "fish_node": EntityType.FISH,
+    "leg_node": EntityType.LEG,
+    "door": EntityType.DOOR,
+    "ink_button_node": EntityType.INK_BUTTON,
+    "press_button_node": EntityType.PRESS_BUTTON,
+    "red_platform_node": EntityType.RED_PLATFORM
+}
+
+# Actions triggers can perform on each scene child type.
+TRIGGER_ACTIONS: dict[EntityType, tuple[str, ...]] = {
+    EntityType.FISH: ("toggle", "enable", "disable"),
+    EntityType.LEG: ("toggle", "enable", "disable"),
+    EntityType.DOOR: (),
+    EntityType.INK_BUTTON: (),
+    EntityType.PRESS_BUTTON: (),
+    EntityType.RED_PLATFORM: ("trigger_on", "trigger_off", "switch")
+}
+
+# Values allowed for ink buttons' anchor, same as ink_button_node.Direction.
+BUTTON_ANCHORS: tuple[str, ...] = ("up", "down", "left", "right")
+
+class SceneCompileError(Exception):
+    def __init__(self, scene_src: str, errors: list[str]) -> None:
+        super().__init__("\n".join(f"{scene_src}: {error}" for error in errors))
+
+        self.errors: list[str] = errors
+
+def get_compiled_src(scene_src: str) -> str:
+    """
+    Returns the path of the compiled version of the provided scene file, relative to the assets dir.
+    """
+
+    return f"{COMPILED_SCENES_DIR}/{os.path.splitext(os.path.basename(scene_src))[0]}.bin"
+
+class SceneCompiler:
+    """
+    Validates a scene file, along with all files it references, and turns it into a scene template.
+    All errors are collected, so that a single run reports all of them.
+    """
+
+    def __init__(self, scene_src: str) -> None:
+        self.scene_src: str = scene_src
+        self.errors: list[str] = []
+
+    def compile(self) -> SceneTemplate:
+        """
+        Returns the template of the scene file.
+        Raises a SceneCompileError listing all errors found, if any.
+        """
+
+        if not ASSET_BUNDLE.exists(source = self.scene_src):
+            raise SceneCompileError(scene_src = self.scene_src, errors = ["scene file not found"])
+
+        config_data: Any = ASSET_BUNDLE.read_json(source = self.scene_src)
+        if not isinstance(config_data, dict):
+            raise SceneCompileError(scene_src = self.scene_src, errors = ["scene file is not a JSON object"])
+
+        title: str = self.__get(config_data, "title", str, "scene")
+        tilemap_src: str = self.__get(config_data, "tilemap", str, "scene")
+        waters_src: str | None = self.__get(config_data, "waters", str, "scene", None)
+        walls_src: str | None = self.__get(config_data, "walls", str, "scene", None)
+        children_data: list[Any] = self.__get(config_data, "children", list, "scene")
+        self.__check_keys(config_data, ("title", "tilemap", "waters", "walls", "children"), "scene")
+
+        sources: list[str] = [self.scene_src]
+        for source in (tilemap_src, waters_src, walls_src):
+            if source is None:
+                continue
+
+            if not ASSET_BUNDLE.exists(source = source):
+                self.errors.append(f"referenced file {source} not found")
+            sources.append(source)
+
+        children: tuple[EntityTemplate, ...] = self.__compile_children(children_data = children_data)
+
+        if len(self.errors) > 0:
+            raise SceneCompileError(scene_src = self.scene_src, errors = self.errors)
+
+        return SceneTemplate(
+            src = self.scene_src,
+            title = title,
+            tilemap = TilemapTemplate.from_tmx_file(source = tilemap_src, tilesets_path = TILESETS_PATH),
+            children = children,
+            waters = HittableTemplate.from_hittables_file(source = waters_src) if waters_src is not None else (),
+            walls = HittableTemplate.from_hittables_file(source = walls_src) if walls_src is not None else (),
+            sources = tuple(sources)
+        )
+
+    def __compile_children(self, children_data: list[Any]) -> tuple[EntityTemplate, ...]:
+        # Resolve all children identifiers first, so that triggers can target children defined after them.
+        indexes: dict[tuple[str, int], int] = {}
+        types: list[EntityType | None] = []
+        for index, child_data in enumerate(children_data):
+            context: str = f"child {index}"
+            if not isinstance(child_data, dict):
+                self.errors.append(f"{context}: not a JSON object")
+                types.append(None)
+                continue
+
+            name: str = self.__get(child_data, "name", str, context)
+            child_id: int = self.__get(child_data, "id", int, context)
+
+            entity_type: EntityType | None = ENTITY_TYPES.get(name)
+            if entity_type is None and name is not None:
+                self.errors.append(f"{context}: unknown name \"{name}\"")
+            types.append(entity_type)
+
+            if (name, child_id) in indexes:
+                self.errors.append(f"{context}: duplicate id {child_id} for {name}")
+            indexes[(name, child_id)] = index
+
+        children: list[EntityTemplate] = []
+        for child_data, entity_type in zip(children_data, types):
+            if entity_type is None:
+                continue
+
+            context: str = f"{child_data['name']} {child_data.get('id')}"
+            child_id: int = child_data.get("id")
+            x: float = self.__get(child_data, "x", float, context)
+            y: float = self.__get(child_data, "y", float, context)
+
+            match entity_type:
+                case EntityType.FISH | EntityType.LEG:
+                    self.__check_keys(child_data, ("name", "id", "x", "y"), context)
+                    children.append(EntityTemplate(
+                        type = entity_type,
+                        id = child_id,
+                        x = x,
+                        y = y
+                    ))
+                case EntityType.DOOR:
+                    self.__check_keys(child_data, ("name", "id", "x", "y", "width", "height", "anchor_x", "anchor_y", "destination"), context)
+                    destination: str | None = self.__get(child_data, "destination", str, context, None)
+                    if destination is not None and not ASSET_BUNDLE.exists(source = f"{SCENES_DIR}/{destination}.json"):
+                        self.errors.append(f"{context}: destination scene {destination} not found")
+
+                    children.append(DoorTemplate(
+                        id = child_id,
+                        x = x,
+                        y = y,
+                        width = self.__get(child_data, "width", int, context, 0),
+                        height = self.__get(child_data, "height", int, context, 0),
+                        anchor_x = self.__get(child_data, "anchor_x", int, context, 0),
+                        anchor_y = self.__get(child_data, "anchor_y", int, context, 0),
+                        destination = destination
+                    ))
+                case EntityType.INK_BUTTON:
+                    self.__check_keys(child_data, ("name", "id", "x", "y", "button_anchor", "allow_turning_off", "on_triggered_on", "on_triggered_off"), context)
+                    button_anchor: str = self.__get(child_data, "button_anchor", str, context, "down")
+                    if button_anchor not in BUTTON_ANCHORS:
+                        self.errors.append(f"{context}: unknown button_anchor \"{button_anchor}\"")
+
+                    children.append(InkButtonTemplate(
+                        id = child_id,
+                        x = x,
+                        y = y,
+                        button_anchor = button_anchor,
+                        allow_turning_off = self.__get(child_data, "allow_turning_off", bool, context, True),
+                        on_triggered_on = self.__compile_triggers(child_data, "on_triggered_on", context, indexes, types),
+                        on_triggered_off = self.__compile_triggers(child_data, "on_triggered_off", context, indexes, types)
+                    ))
+                case EntityType.PRESS_BUTTON:
+                    self.__check_keys(child_data, ("name", "id", "x", "y", "allow_turning_off", "on_triggered_on", "on_triggered_off"), context)
+                    children.append(ButtonTemplate(
+                        type = entity_type,
+                        id = child_id,
+                        x = x,
+                        y = y,
+                        allow_turning_off = self.__get(child_data, "allow_turning_off", bool, context, True),
+                        on_triggered_on = self.__compile_triggers(child_data, "on_triggered_on", context, indexes, types),
+                        on_triggered_off = self.__compile_triggers(child_data, "on_triggered_off", context, indexes, types)
+                    ))
+                case EntityType.RED_PLATFORM:
+                    self.__check_keys(child_data, ("name", "id", "x", "y", "starts_on"), context)
+                    children.append(RedPlatformTemplate(
+                        id = child_id,
+                        x = x,
+                        y = y,
+                        starts_on = self.__get(child_data, "starts_on", bool, context, False)
+                    ))
+
+        # Trigger indexes only match children if all of them were compiled.
+        if len(children) == len(children_data):
+            self.__check_trigger_cycles(children = children)
+
+        return tuple(children)
+
+    def __check_trigger_cycles(self, children: list[EntityTemplate]) -> None:
+        """
+        Makes sure no child can end up triggering itself, either directly or through other children.
+        """
+
+        # Targets of all triggers of each child.
+        targets: list[list[int]] = [
+            [trigger.target for trigger in (*child.on_triggered_on, *child.on_triggered_off)] if isinstance(child, ButtonTemplate) else []
+            for child in children
+        ]
+
+        # Depth first visit, where 1 marks children being visited and 2 children done visiting.
+        states: list[int] = [0] * len(children)
+        for root in range(len(children)):
+            if states[root] != 0:
+                continue
+
+            path: list[int] = [root]
+            stack: list[Iterator[int]] = [iter(targets[root])]
+            states[root] = 1
+            while len(stack) > 0:
+                target: int | None = next(stack[-1], None)
+
+                if target is None:
+                    states[path.pop()] = 2
+                    stack.pop()
+                    continue
+
+                if states[target] == 1:
+                    cycle: list[int] = [*path[path.index(target):], target]
+                    self.errors.append(f"trigger cycle: {' -> '.join(f'{children[index].type.name.lower()} {children[index].id}' for index in cycle)}")
+                    continue
+
+                if states[target] == 0:
+                    states[target] = 1
+                    path.append(target)
+                    stack.append(iter(targets[target]))
+
+    def __compile_triggers(
+        self,
+        child_data: dict[str, Any],
+        key: str,
+        context: str,
+        indexes: dict[tuple[str, int], int],
+        types: list[EntityType | None]
+    ) -> tuple[TriggerTemplate, ...]:
+        triggers_data: list[Any] = self.__get(child_data, key, list, context, [])
+
+        triggers: list[TriggerTemplate] = []
+        for trigger_index, trigger_data in enumerate(triggers_data):
+            trigger_context: str = f"{context} {key}[{trigger_index}]"
+            if not isinstance(trigger_data, dict):
+                self.errors.append(f"{trigger_context}: not a JSON object")
+                continue
+
+            self.__check_keys(trigger_data, ("action", "name", "id"), trigger_context)
+            action: str = self.__get(trigger_data, "action", str, trigger_context)
+            target_id: tuple[str, int] = (self.__get(trigger_data, "name", str, trigger_context), self.__get(trigger_data, "id", int, trigger_context))
+
+            target: int | None = indexes.get(target_id)
+            if target is None:
+                self.errors.append(f"{trigger_context}: target {target_id[0]} {target_id[1]} not found")
+                continue
+
+            target_type: EntityType | None = types[target]
+            if target_type is not None and action not in TRIGGER_ACTIONS[target_type]:
+                self.errors.append(f"{trigger_context}: {target_id[0]} has no action \"{action}\"")
+                continue
+
+            triggers.append(TriggerTemplate(
+                action = action,
+                target = target
+            ))
+
+        return tuple(triggers)
+
+    def __get(
+        self,
+        data: dict[str, Any],
+        key: str,
+        value_type: type,
+        context: str,
+        *default: Any
+    ) -> Any:
+        """
+        Returns the value of [key] in [data], making sure it's of the provided type.
+        [key] is mandatory unless a default value is provided.
+        """
+
+        if key not in data or data[key] is None:
+            if len(default) <= 0:
+                self.errors.append(f"{context}: missing \"{key}\"")
+            return default[0] if len(default) > 0 else None
+
+        value: Any = data[key]
+
+        # JSON has no distinction between ints and floats, but bools are ints in python.
+        valid: bool = isinstance(value, value_type) and not (value_type is not bool and isinstance(value, bool))
+        if value_type is float:
+            valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+
+        if not valid:
+            self.errors.append(f"{context}: \"{key}\" should be {'number' if value_type is float else value_type.__name__}, not {type(value).__name__}")
+            return default[0] if len(default) > 0 else None
+
+        return float(value) if value_type is float else value
+
+    def __check_keys(self, data: dict[str, Any], keys: tuple[str, ...], context: str) -> None:
+        for key in data.keys():
+            if key not in keys:
+                self.errors.append(f"{context}: unknown key \"{key}\"")
+
+################################
+# Binary format.
+################################
+class BinaryWriter:
+    def __init__(self) -> None:
+        self.__chunks: list[bytes] = []
+
+    def pack(self, format: str, *values: Any) -> None:
+        self.__chunks.append(struct.pack(f"<{format}", *values))
+
+    def string(self, value: str) -> None:
+        encoded: bytes = value.encode("UTF-8")
+        self.pack("H", len(encoded))
+        self.__chunks.append(encoded)
+
+    def get_bytes(self) -> bytes:
+        return b"".join(self.__chunks)
+
+class BinaryReader:
+    def __init__(self, data: memoryview | bytes, offset: int = 0) -> None:
+        self.__data: memoryview | bytes = data
+        self.__offset: int = offset
+
+    def unpack(self, format: str) -> tuple[Any, ...]:
+        values: tuple[Any, ...] = struct.unpack_from(f"<{format}", self.__data, self.__offset)
+        self.__offset += struct.calcsize(f"<{format}")
+        return values
+
+    def string(self) -> str:
+        length: int = self.unpack("H")[0]
+        value: str = str(self.__data[self.__offset:self.__offset + length], encoding = "UTF-8")
+        self.__offset += length
+        return value
+
+def write_scene(template: SceneTemplate) -> bytes:
+    """
+    Returns the compiled form of the provided scene template.
+    """
+
+    writer: BinaryWriter = BinaryWriter()
+    writer.pack("4sB", MAGIC, VERSION)
+
+    writer.pack("H", len(template.sources))
+    for source in template.sources:
+        writer.string(source)
+
+    writer.string(template.src)
+    writer.string(template.title)
+
+    tilemap: TilemapTemplate = template.tilemap
+    writer.pack("HHHH", tilemap.map_width, tilemap.map_height, tilemap.tile_width, tilemap.tile_height)
+    writer.pack("H", len(tilemap.tilesets))
+    for tileset in tilemap.tilesets:
+        writer.string(tileset)
+    writer.pack("H", len(tilemap.layers))
+    for layer_name, layer_content in tilemap.layers:
+        writer.string(layer_name)
+        writer.pack(f"{len(layer_content)}h", *layer_content)
+
+    for hittables in (template.waters, template.walls):
+        writer.pack("I", len(hittables))
+        for hittable in hittables:
+            writer.pack("iiii?B", hittable.x, hittable.y, hittable.width, hittable.height, hittable.sensor, len(hittable.tags))
+            for tag in hittable.tags:
+                writer.string(tag)
+
+    writer.pack("H", len(template.children))
+    for child in template.children:
+        writer.pack("BHff", child.type, child.id, child.x, child.y)
+
+        if isinstance(child, DoorTemplate):
+            writer.pack("iiii", child.width, child.height, child.anchor_x, child.anchor_y)
+            writer.string(child.destination if child.destination is not None else "")
+        elif isinstance(child, ButtonTemplate):
+            if isinstance(child, InkButtonTemplate):
+                writer.string(child.button_anchor)
+            writer.pack("?", child.allow_turning_off)
+            for triggers in (child.on_triggered_on, child.on_triggered_off):
+                writer.pack("H", len(triggers))
+                for trigger in triggers:
+                    writer.string(trigger.action)
+                    writer.pack("H", trigger.target)
+        elif isinstance(child, RedPlatformTemplate):
+            writer.pack("?", child.starts_on)
+
+    return writer.get_bytes()
+
+def read_triggers(reader: BinaryReader) -> tuple[TriggerTemplate, ...]:
+    triggers: list[TriggerTemplate] = []
+    for _ in range(reader.unpack("H")[0]):
+        action: str = reader.string()
+        triggers.append(TriggerTemplate(
+            action = action,
+            target = reader.unpack("H")[0]
+        ))
+
+    return tuple(triggers)
+
+def read_scene(data: memoryview | bytes) -> SceneTemplate:
+    """
+    Reads the scene template stored in the provided compiled scene.
+    """
+
+    magic, version = HEADER_FORMAT.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise SceneCompileError(scene_src = "compiled scene", errors = [f"not a version {VERSION} compiled scene"])
+
+    reader: BinaryReader = BinaryReader(data = data, offset = HEADER_FORMAT.size)
+
+    sources: tuple[str, ...] = tuple(reader.string() for _ in range(reader.unpack("H")[0]))
+
+    src: str = reader.string()
+    title: str = reader.string()
+
+    map_width, map_height, tile_width, tile_height = reader.unpack("HHHH")
+    tilesets: tuple[str, ...] = tuple(reader.string() for _ in range(reader.unpack("H")[0]))
+    layers: list[tuple[str, tuple[int, ...]]] = []
+    for _ in range(reader.unpack("H")[0]):
+        layer_name: str = reader.string()
+        layers.append((layer_name, reader.unpack(f"{map_width * map_height}h")))
+
+    hittables: list[tuple[HittableTemplate, ...]] = []
+    for _ in range(2):
+        hittables_list: list[HittableTemplate] = []
+        for _ in range(reader.unpack("I")[0]):
+            x, y, width, height, sensor, tags_count = reader.unpack("iiii?B")
+            hittables_list.append(HittableTemplate(
+                x = x,
+                y = y,
+                width = width,
+                height = height,
+                sensor = sensor,
+                tags = tuple(reader.string() for _ in range(tags_count))
+            ))
+        hittables.append(tuple(hittables_list))
+
+    children: list[EntityTemplate] = []
+    for _ in range(reader.unpack("H")[0]):
+        entity_type, child_id, x, y = reader.unpack("BHff")
+
+        match EntityType(entity_type):
+            case EntityType.DOOR:
+                width, height, anchor_x, anchor_y = reader.unpack("iiii")
+                destination: str = reader.string()
+                children.append(DoorTemplate(
+                    id = child_id,
+                    x = x,
+                    y = y,
+                    width = width,
+                    height = height,
+                    anchor_x = anchor_x,
+                    anchor_y = anchor_y,
+                    destination = destination if destination != "" else None
+                ))
+            case EntityType.INK_BUTTON | EntityType.PRESS_BUTTON:
+                button_anchor: str = reader.string() if entity_type == EntityType.INK_BUTTON else ""
+                allow_turning_off: bool = reader.unpack("?")[0]
+                on_triggered_on: tuple[TriggerTemplate, ...] = read_triggers(reader = reader)
+                on_triggered_off: tuple[TriggerTemplate, ...] = read_triggers(reader = reader)
+
+                if entity_type == EntityType.INK_BUTTON:
+                    children.append(InkButtonTemplate(
+                        id = child_id,
+                        x = x,
+                        y = y,
+                        button_anchor = button_anchor,
+                        allow_turning_off = allow_turning_off,
+                        on_triggered_on = on_triggered_on,
+                        on_triggered_off = on_triggered_off
+                    ))
+                else:
+                    children.append(ButtonTemplate(
+                        type = EntityType.PRESS_BUTTON,
+                        id = child_id,
+                        x = x,
+                        y = y,
+                        allow_turning_off = allow_turning_off,
+                        on_triggered_on = on_triggered_on,
+                        on_triggered_off = on_triggered_off
+                    ))
+            case EntityType.RED_PLATFORM:
+                children.append(RedPlatformTemplate(
+                    id = child_id,
+                    x = x,
+                    y = y,
+                    starts_on = reader.unpack("?")[0]
+                ))
+            case _:
+                children.append(EntityTemplate(
+                    type = EntityType(entity_type),
+                    id = child_id,
+                    x = x,
+                    y = y
+                ))
+
+    return SceneTemplate(
+        src = src,
+        title = title,
+        tilemap = TilemapTemplate(
+            map_width = map_width,
+            map_height = map_height,
+            tile_width = tile_width,
+            tile_height = tile_height,
+            tilesets = tilesets,
+            layers = tuple(layers)
+        ),
+        children = tuple(children),
+        waters = hittables[0],
+        walls = hittables[1],
+        sources = sources
+    )
+################################
+################################
+
+def is_outdated(compiled_src: str, sources: tuple[str, ...]) -> bool:
+    """
+    Tells whether any of the provided source files was modified after the provided compiled scene.
+    Bundled files are compared by the modification time they had when bundled, so that loose files edited later on always win.
+    """
+
+    compiled_time: float = ASSET_BUNDLE.get_mtime(source = compiled_src)
+
+    return any(
+        ASSET_BUNDLE.get_mtime(source = source) > compiled_time
+        for source in sources
+        if ASSET_BUNDLE.exists(source = source)
+    )
+
+def is_current(data: memoryview | bytes) -> bool:
+    """
+    Tells whether the provided compiled scene was compiled by the current version of the compiler, so that older ones are just compiled again.
+    """
+
+    if len(data) < HEADER_FORMAT.size:
+        return False
+
+    magic, version = HEADER_FORMAT.unpack_from(data, 0)
+
+    return magic == MAGIC and version == VERSION
+
+def load_scene_template(scene_src: str) -> SceneTemplate:
+    """
+    Returns the template of the provided scene file.
+    Reads its compiled version if up to date, otherwise compiles the scene file on the fly.
+    """
+
+    compiled_src: str = get_compiled_src(scene_src = scene_src)
+
+    data: memoryview | bytes | None = ASSET_BUNDLE.read(source = compiled_src) if ASSET_BUNDLE.exists(source = compiled_src) else None
+
+    if data is not None and is_current(data = data):
+        template: SceneTemplate = read_scene(data = data)
+
+        if template.src == scene_src and not is_outdated(compiled_src = compiled_src, sources = template.sources):
+            return template
+
+    return SceneCompiler(scene_src = scene_src).compile()
+
+def build(assets_dir: str = ASSETS_DIR) -> list[SceneCompileError]:
+    """
+    Compiles all scene files in [assets_dir] and writes their compiled versions.
+    Returns all errors found, in which case the offending scenes are not written.
+    """
+
+    os.makedirs(f"{assets_dir}/{COMPILED_SCENES_DIR}", exist_ok = True)
+
+    errors: list[SceneCompileError] = []
+    for file_name in sorted(os.listdir(f"{assets_dir}/{SCENES_DIR}")):
+        if not file_name.endswith(".json"):
+            continue
+
+        scene_src: str = f"{SCENES_DIR}/{file_name}"
+        try:
+            template: SceneTemplate = SceneCompiler(scene_src = scene_src).compile()
+        except SceneCompileError as error:
+            errors.append(error)
+            continue
+
+        with open(file = f"{assets_dir}/{get_compiled_src(scene_src = scene_src)}", mode = "wb") as compiled:
+            compiled.write(write_scene(template = template))
+
+    return errors
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Validates and compiles all scene files.")
+    parser.add_argument("--assets", default = ASSETS_DIR, help = "assets directory")
+    args: argparse.Namespace = parser.parse_args()
+
+    # Scenes reference all other assets relative to the assets dir.
+    pyglet.resource.path = [args.assets]
+
+    compile_errors: list[SceneCompileError] = build(assets_dir = args.assets)
+    for compile_error in compile_errors:
+        print(compile_error)
+
+    if len(compile_errors) > 0:
+        sys.exit(1)
+
+    print(f"Compiled all scenes into {args.assets}/{COMPILED_SCENES_DIR}")
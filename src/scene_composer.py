@@ -1,31 +1,62 @@
 
-import json
+from collections import deque
+import time
 from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterator
 import pyglet
 from pyglet.graphics import Batch
 from pyglet.window import BaseWindow
 
 import amonite.controllers as controllers
 from amonite.animation import Animation
+from amonite.camera import Camera
 from amonite.sprite_node import SpriteNode
 from amonite.scene_node import Bounds
 from amonite.node import Node
+from amonite.collision.collision_controller import CollisionController
+from amonite.collision.collision_node import CollisionNode
 from amonite.shapes.rect_node import RectNode
 from amonite.scene_node import SceneNode
 from amonite.tilemap_node import TilemapNode
+from amonite.tilemap_node import Tileset
 from amonite.utils.hittables_loader import HittableNode
-from amonite.utils.hittables_loader import HittablesLoader
 from amonite.settings import SETTINGS
 
+from animation_registry import ANIMATION_REGISTRY
+from character_node import CharacterNode
+from asset_loaders import build_hittable
+from asset_loaders import build_tilemap_region
+from asset_loaders import build_tileset
+from asset_loaders import get_tilemap_bounds
+from asset_preloader import ASSET_PRELOADER
 from constants import custom_setting_keys
 from constants import uniques
+from entity_pool import EntityPool
 from fish.fish_node import FishNode
 from ink_button_node import Direction, InkButtonNode
 from leg.leg_node import LegNode
 from press_button_node import PressButtonNode
+from prompt_pool import PROMPT_POOL
+from region_collision_controller import RegionCollisionController
 from red_platform_node import RedPlatformNode
 from mid_camera_node import MidCameraNode
 from door.door_node import DoorNode
+from render_interpolation import RENDER_INTERPOLATOR
+from scene_regions import SceneRegions
+from scene_template import ButtonTemplate
+from scene_template import DoorTemplate
+from scene_template import EntityTemplate
+from scene_template import EntityType
+from scene_template import InkButtonTemplate
+from scene_template import RedPlatformTemplate
+from scene_template import SceneTemplate
+from trigger_graph import TriggerGraph
+from world_manager import WORLD_MANAGER
+
+# Maximum number of tiles created by a single scene build step.
+TILEMAP_STEP_TILES: int = 16
 
 class WaterHittableNode(HittableNode):
     def __init__(
@@ -79,10 +110,42 @@ class WaterHittableNode(HittableNode):
             batch = batch
         )
 
+class SceneBuild:
+    """
+    Scene being built a step at a time, while the active one keeps running.
+    All its colliders are staged in its own collision controller, which only becomes active once the scene is swapped in.
+    """
+
+    __slots__ = (
+        "template",
+        "scene",
+        "camera",
+        "collision_controller",
+        "tilemaps",
+        "children",
+        "waters",
+        "walls"
+    )
+
+    def __init__(self, template: SceneTemplate) -> None:
+        self.template: SceneTemplate = template
+        self.scene: SceneNode | None = None
+        self.camera: Camera | None = None
+        self.collision_controller: RegionCollisionController = RegionCollisionController(cell_size = int(SETTINGS[custom_setting_keys.COLLISION_CELL_SIZE]))
+
+        self.tilemaps: list[TilemapNode] = []
+        self.children: list[Node] = []
+        self.waters: list[HittableNode] = []
+        self.walls: list[HittableNode] = []
+
+    def get_nodes(self) -> list[Node]:
+        return [*self.tilemaps, *self.children, *self.waters, *self.walls]
+
 class SceneComposer():
     """
     Handles scene composition via file.
     Creates a new scene by reading a config file.
+    Scenes are built a step at a time (see advance()), so that building and tearing them down never stalls a whole frame.
     """
 
     def __init__(
@@ -95,231 +158,552 @@ class SceneComposer():
         self.__view_width: int = view_width
         self.__view_height: int = view_height
 
-        self.children: dict[tuple[str, int], Node] = {}
+        # Scene children, in the same order as in the scene template.
+        self.children: list[Node] = []
         self.scene: SceneNode
 
+        # Camera of the active scene, handed to the render interpolator whenever the scene becomes active.
+        self.__camera: Camera | None = None
+
+        # Scene children factories, by type.
+        self.__factories: dict[EntityType, Callable[[Any, Batch], Node]] = {
+            EntityType.FISH: self.__create_fish,
+            EntityType.LEG: self.__create_leg,
+            EntityType.DOOR: self.__create_door,
+            EntityType.INK_BUTTON: self.__create_ink_button,
+            EntityType.PRESS_BUTTON: self.__create_press_button,
+            EntityType.RED_PLATFORM: self.__create_red_platform
+        }
+
+        # Scene children resetters, by type: each one restores a pooled child to the initial state defined by the provided template.
+        self.__resetters: dict[EntityType, Callable[[Any, Any], None]] = {
+            EntityType.FISH: self.__reset_fish,
+            EntityType.LEG: self.__reset_leg,
+            EntityType.DOOR: self.__reset_door,
+            EntityType.INK_BUTTON: self.__reset_ink_button,
+            EntityType.PRESS_BUTTON: self.__reset_press_button,
+            EntityType.RED_PLATFORM: self.__reset_red_platform
+        }
+
+        # Children released by previous scenes and scene resets, reused by the following ones instead of creating new ones whenever possible.
+        self.__pool: EntityPool = EntityPool()
+
+        # Triggers of the active scene's children, compiled along with them.
+        self.__triggers: TriggerGraph = TriggerGraph()
+
+        # Template of the active scene.
+        self.__template: SceneTemplate | None = None
+
+        # Static content of the active scene, kept across resets.
+        self.__tilemaps: list[TilemapNode] = []
+        self.__waters: list[HittableNode] = []
+        self.__walls: list[HittableNode] = []
+
+        # Camera nodes of the active scene, rebuilt along with children.
+        self.__cameras: list[MidCameraNode] = []
+
+        # Regions of the active scene, holding all its static children, rebuilt along with children.
+        self.__regions: SceneRegions | None = None
+
+        # Scene being built, along with its remaining build steps.
+        self.__build: SceneBuild | None = None
+        self.__build_steps: Iterator[None] | None = None
+
+        # Nodes of discarded scenes still to be deleted, along with the scene they belong to.
+        # A None node stands for the scene itself, which is deleted after all its listed nodes.
+        self.__teardown: deque[tuple[SceneNode, Node | None]] = deque()
+
     def load_scene(self, config_file_path: str) -> None:
         """
         Loads all scene data from the provided scene config file.
         Destroys the currently active scene in the process.
+        The whole scene is built and swapped in at once: use build_scene() in order to spread the work over multiple calls.
         """
 
-        # Delete any previous active scene.
-        if uniques.ACTIVE_SCENE is not None:
-            controllers.COLLISION_CONTROLLER.clear()
-            uniques.ACTIVE_SCENE.delete()
-            uniques.ACTIVE_SCENE = None
+        self.begin_scene(config_file_path = config_file_path)
+        self.advance()
 
-        # Store the currently open scene file.
-        uniques.ACTIVE_SCENE_SRC = config_file_path
+    def build_scene(self, config_file_path: str, budget: float | None = None) -> None:
+        """
+        Keeps building the scene defined by the provided scene config file for [budget] seconds, starting to build it if not already doing so.
+        The scene is swapped in as soon as it's complete, so this should be called repeatedly until the new scene is active.
+        """
+
+        if self.__build is None or self.__build.template.src != config_file_path:
+            self.begin_scene(config_file_path = config_file_path)
+
+        self.advance(budget = budget)
+
+    def begin_scene(self, config_file_path: str) -> None:
+        """
+        Starts building the scene defined by the provided scene config file, discarding any other scene being built.
+        Nothing is built until advance() is called.
+        """
+
+        if self.__build is not None:
+            self.__discard(scene = self.__build.scene, nodes = self.__build.get_nodes())
+
+        self.__build = SceneBuild(template = ASSET_PRELOADER.get_template(scene_src = config_file_path))
+        self.__build_steps = self.__get_build_steps(build = self.__build)
+
+    def is_busy(self) -> bool:
+        """
+        Tells whether any scene is being built or torn down.
+        """
+
+        return self.__build_steps is not None or len(self.__teardown) > 0
+
+    def advance(self, budget: float | None = None) -> None:
+        """
+        Performs pending scene build steps, then pending teardown steps, until [budget] seconds are spent.
+        All pending steps are performed if no budget is provided.
+        The scene being built is swapped in as soon as its last step is done.
+        """
+
+        end_time: float | None = time.perf_counter() + budget if budget is not None else None
+
+        while self.__build_steps is not None and (end_time is None or time.perf_counter() < end_time):
+            self.__step_build()
+
+        while len(self.__teardown) > 0 and (end_time is None or time.perf_counter() < end_time):
+            self.__step_teardown()
 
-        # Read config file and setup the scene.
-        with open(file = f"{pyglet.resource.path[0]}/{config_file_path}", mode = "r", encoding = "UTF-8") as content:
-            config_data = json.load(content)
+    def dispatch_triggers(self) -> None:
+        """
+        Performs all actions triggered by the active scene's children since the last call.
+        Should be called once at the end of each physics tick.
+        """
+
+        self.__triggers.dispatch()
+
+    def reset_scene(self) -> None:
+        """
+        Restores the active scene to its initial state, by only resetting its children to the in memory scene template.
+        Children are reset in place instead of being created again, so that no sprite, collider or state machine is reallocated.
+        Tilemaps, walls and waters are static, so they're kept as they are, and nothing is read from disk.
+        Nodes spawned by children during play (e.g. shot inks) are deleted by the children themselves when reset.
+        """
+
+        # Fall back to a full load if there's no active scene to reset.
+        if uniques.ACTIVE_SCENE is None or self.__template is None or self.__template.src != uniques.ACTIVE_SCENE_SRC:
+            if uniques.ACTIVE_SCENE_SRC is not None:
+                self.load_scene(config_file_path = uniques.ACTIVE_SCENE_SRC)
+            return
+
+        RENDER_INTERPOLATOR.clear()
+        RENDER_INTERPOLATOR.set_camera(camera = self.__camera)
+
+        # Release all children for reuse and delete the camera node following them.
+        for child, entity in zip(self.children, self.__template.children):
+            self.scene.remove_child(child)
+            self.__pool.release(kind = self.__get_pool_kind(entity), child = child)
 
-        # Store all keys for faster access.
-        config_keys: list[str] = list(config_data.keys())
+        for camera in self.__cameras:
+            self.scene.remove_child(camera)
+            camera.delete()
+
+        # Activate all static children again, so that they're reset just like on a full load.
+        if self.__regions is not None:
+            self.scene.remove_child(self.__regions)
+            self.__regions.clear()
+            self.__regions = None
+
+        controllers.COLLISION_CONTROLLER.clear()
+
+        # Resetting children adds their colliders back.
+        self.children = [self.__create_child(child, batch = self.scene.world_batch) for child in self.__template.children]
+
+        self.__triggers.compile(template = self.__template, children = self.children)
+
+        # Add hittables' colliders back, after children's ones.
+        for hittable in [*self.__waters, *self.__walls]:
+            for component in hittable.components:
+                if isinstance(component, CollisionNode):
+                    controllers.COLLISION_CONTROLLER.add_collider(component)
+
+        self.__add_dynamic_children()
+
+    def __get_build_steps(self, build: SceneBuild) -> Iterator[None]:
+        """
+        Builds the provided scene, yielding after each step.
+        Each step is small enough (e.g. a single child, or a few tilemap rows) to fit a fraction of a frame.
+        """
 
-        # Make sure all mandatory fields are present in the config file.
-        assert "title" in config_keys and "children" in config_keys
+        template: SceneTemplate = build.template
 
-        # Read scene title.
-        title: str = config_data["title"]
+        # Track animations fetched by the new scene only.
+        ANIMATION_REGISTRY.clear_fetched()
+
+        # Upload all textures decoded in the background, so that building the scene finds them already loaded.
+        ASSET_PRELOADER.upload(scene_src = template.src)
 
         ################################
         # Create scene.
         ################################
-        self.scene = SceneNode(
+        scene: SceneNode = SceneNode(
             window = self.__window,
             view_width = self.__view_width,
             view_height = self.__view_height,
             curtain_z = 300.0,
-            title = title,
+            title = template.title,
         )
+        build.scene = scene
+
+        # The scene camera is created along with the scene and never exposed afterwards, so keep a reference to it right away.
+        build.camera = scene._SceneNode__camera
+        yield
         ################################
         ################################
 
         ################################
-        # Read tilemap.
+        # Build tilemap.
         ################################
-        tilemaps: list[TilemapNode] = TilemapNode.from_tmx_file(
-            source = config_data["tilemap"],
-            tilesets_path = "tilesets/",
-            batch = self.scene.world_batch
-        )
-        tile_size: int = tilemaps[0].get_tile_size()[0]
-        tilemap_width: int = tilemaps[0].map_width
-        tilemap_height: int = tilemaps[0].map_height
-        cam_bounds: Bounds = tilemaps[0].bounds
+        tileset: Tileset = build_tileset(template = template.tilemap)
+        yield
+
+        # Layers are split into regions, so that no single step creates too many tile sprites.
+        columns: int = min(template.tilemap.map_width, TILEMAP_STEP_TILES)
+        rows: int = max(1, TILEMAP_STEP_TILES // columns)
+        for layer_index in range(len(template.tilemap.layers)):
+            for first_row in range(0, template.tilemap.map_height, rows):
+                for first_column in range(0, template.tilemap.map_width, columns):
+                    tilemap: TilemapNode | None = build_tilemap_region(
+                        template = template.tilemap,
+                        tileset = tileset,
+                        layer_index = layer_index,
+                        first_row = first_row,
+                        rows = rows,
+                        first_column = first_column,
+                        columns = columns,
+                        batch = scene.world_batch
+                    )
+
+                    if tilemap is not None:
+                        build.tilemaps.append(tilemap)
+                        scene.add_child(tilemap)
+                        yield
         ################################
         ################################
 
         ################################
-        # Read children.
+        # Build children.
         ################################
-        children_data: list[dict[str, Any]] = config_data["children"]
-        self.children = {
-            (child["name"], child["id"]): self.__map_child(child)
-            for child in children_data
-        }
+        for child in template.children:
+            build.children.append(self.__create_child(child, batch = scene.world_batch))
+            yield
         ################################
         ################################
 
         ################################
-        # Read hittables.
+        # Build hittables.
         ################################
-        __waters: list[WaterHittableNode] = []
-        if config_data["waters"] is not None:
-            __waters = list(
-                map(
-                    lambda hittable: WaterHittableNode.from_hittable(
-                        hittable = hittable,
-                        z = -200,
-                        batch = self.scene.world_batch
-                    ),
-                    HittablesLoader.fetch(
-                        source = config_data["waters"],
-                        batch = self.scene.world_batch
-                    )
-                )
-            )
-        __walls: list[HittableNode] = []
-        if config_data["walls"] is not None:
-            __walls = HittablesLoader.fetch(
-                source = config_data["walls"],
-                batch = self.scene.world_batch
-            )
+        for water in template.waters:
+            build.waters.append(build_hittable(
+                template = water,
+                hittable_type = WaterHittableNode,
+                z = -200,
+                batch = scene.world_batch
+            ))
+            yield
+
+        for wall in template.walls:
+            build.walls.append(build_hittable(
+                template = wall,
+                batch = scene.world_batch
+            ))
+            yield
         ################################
         ################################
 
-        self.scene.add_children(tilemaps)
-        self.scene.add_children([*self.children.values()])
-        self.scene.add_children(__waters)
-        self.scene.add_children(__walls)
-
         # Set scene cam bounds.
-        self.scene.set_cam_bounds(bounds = cam_bounds)
+        scene.set_cam_bounds(bounds = get_tilemap_bounds(template = template.tilemap))
 
-        # Add a mid camera node between the two characters if defined in the current scene.
-        if uniques.LEG is not None and uniques.FISH is not None:
-            self.scene.add_child(
-                MidCameraNode(
-                    targets = [
-                        uniques.LEG,
-                        uniques.FISH
-                    ]
-                ),
-                cam_target = True
-            )
+    def __step_build(self) -> None:
+        """
+        Performs the next build step, swapping the built scene in if it was the last one.
+        """
+
+        assert self.__build is not None and self.__build_steps is not None
 
+        # Stage all colliders created by the step in the built scene's own controller.
+        active_collision_controller: CollisionController = controllers.COLLISION_CONTROLLER
+        controllers.COLLISION_CONTROLLER = self.__build.collision_controller
+        try:
+            next(self.__build_steps)
+        except StopIteration:
+            controllers.COLLISION_CONTROLLER = active_collision_controller
+            self.__swap()
+        else:
+            controllers.COLLISION_CONTROLLER = active_collision_controller
+
+    def __swap(self) -> None:
+        """
+        Replaces the active scene with the built one.
+        """
+
+        build: SceneBuild | None = self.__build
+        assert build is not None and build.scene is not None
+
+        # Previous characters and interactive children are released right away, since they may still reference the active scene and characters.
+        # They're reused by the next scene build, while all the rest is static, so it's just torn down a step at a time later on.
+        if uniques.ACTIVE_SCENE is not None:
+            assert self.__template is not None
+
+            for child, entity in zip(self.children, self.__template.children):
+                self.scene.remove_child(child)
+                self.__pool.release(kind = self.__get_pool_kind(entity), child = child)
+
+            for camera in self.__cameras:
+                self.scene.remove_child(camera)
+                camera.delete()
+
+            # Show all released children again, since regions hide their sprites while inactive.
+            if self.__regions is not None:
+                self.scene.remove_child(self.__regions)
+                self.__regions.clear()
+                self.__regions.delete()
+                self.__regions = None
+
+            self.__discard(scene = self.scene, nodes = [*self.__tilemaps, *self.__waters, *self.__walls])
+
+            # Prompt sprites live in the previous scene's batches, so they can't be reused.
+            PROMPT_POOL.clear()
+
+        # Activate all staged colliders at once, dropping all previous ones.
+        controllers.COLLISION_CONTROLLER = build.collision_controller
+
+        self.scene = build.scene
+        self.__camera = build.camera
+        self.__template = build.template
+        self.__tilemaps = build.tilemaps
+        self.children = build.children
+        self.__waters = build.waters
+        self.__walls = build.walls
+        self.__build = None
+        self.__build_steps = None
+
+        self.__triggers.compile(template = self.__template, children = self.children)
+
+        self.__add_dynamic_children()
+
+        # Interpolate the new scene's camera from now on.
+        RENDER_INTERPOLATOR.set_camera(camera = self.__camera)
+
+        # Free all animations the new scene does not use.
+        ANIMATION_REGISTRY.evict_unused()
+
+        # Store the currently open scene file.
+        uniques.ACTIVE_SCENE_SRC = self.__template.src
         uniques.ACTIVE_SCENE = self.scene
         uniques.NEXT_SCENE_SRC = None
 
-    def __trigger_child(self, action: str, target_child_id: tuple[str, int]) -> None:
+        # Keep all rooms reachable from the new one parsed, and drop the least recently used ones if over budget.
+        WORLD_MANAGER.enter(
+            scene_src = self.__template.src,
+            budget = int(SETTINGS[custom_setting_keys.WORLD_MEMORY_BUDGET]) * 1024
+        )
+
+    def __discard(self, scene: SceneNode | None, nodes: list[Node]) -> None:
         """
-        Triggers the child with the provided id.
+        Schedules the provided nodes, then the provided scene, for teardown.
         """
 
-        # Make sure the target child exists.
-        if not target_child_id in self.children.keys():
+        if scene is None:
             return
 
-        # Retrieve target child from its identifier.
-        target_child: Node = self.children[target_child_id]
+        self.__teardown.extend((scene, node) for node in nodes)
+        self.__teardown.append((scene, None))
+
+    def __step_teardown(self) -> None:
+        scene, node = self.__teardown.popleft()
 
-        # Make sure the target child exposes the method specified by [action].
-        if not hasattr(target_child, action):
+        if node is None:
+            # Delete all that's left of the scene (e.g. its curtain and any node added at runtime).
+            scene.delete()
             return
 
-        # Call the method on the target child.
-        getattr(target_child, action)()
+        scene.remove_child(node)
+        node.delete()
 
-    def __on_child_triggered(self, data: list[dict[str, Any]] | None) -> None:
+    def __add_dynamic_children(self) -> None:
         """
-        Handles reactions to children being triggered on or off.
+        Adds all characters, scene regions (holding all other children and hittables) and the camera node to the scene, in this order.
         """
 
-        # Just return if no data is provided.
-        if data is None:
-            return
+        # Characters are looked up among children, so that none is left over from a previous scene.
+        uniques.FISH = next((child for child in self.children if isinstance(child, FishNode)), None)
+        uniques.LEG = next((child for child in self.children if isinstance(child, LegNode)), None)
+
+        # Add a mid camera node between the two characters if defined in the current scene.
+        self.__cameras = []
+        if uniques.LEG is not None and uniques.FISH is not None:
+            self.__cameras.append(MidCameraNode(
+                targets = [
+                    uniques.LEG,
+                    uniques.FISH
+                ]
+            ))
+
+        # All children but characters are static, so they're partitioned into regions which are only active near characters and cameras.
+        self.__regions = SceneRegions(
+            region_size = int(SETTINGS[custom_setting_keys.REGION_SIZE]),
+            view_width = self.__view_width,
+            view_height = self.__view_height,
+            margin = int(SETTINGS[custom_setting_keys.REGION_MARGIN]),
+            focus = [*self.__cameras]
+        )
+        for child in [*self.children, *self.__waters, *self.__walls]:
+            if not isinstance(child, CharacterNode):
+                self.__regions.add(child)
+
+        # Static children never move either, so their colliders can be indexed once and for all.
+        if isinstance(controllers.COLLISION_CONTROLLER, RegionCollisionController):
+            controllers.COLLISION_CONTROLLER.set_fixed({
+                component
+                for child in [*self.children, *self.__waters, *self.__walls]
+                if not isinstance(child, CharacterNode)
+                for component in child.components
+                if isinstance(component, CollisionNode)
+            })
+
+        self.scene.add_children([child for child in self.children if isinstance(child, CharacterNode)])
+        self.scene.add_child(self.__regions)
+
+        for camera in self.__cameras:
+            self.scene.add_child(
+                camera,
+                cam_target = True
+            )
+
+    def __get_pool_kind(self, entity: EntityTemplate) -> Hashable:
+        """
+        Returns the kind of pooled children the provided entity can reuse.
+        Collider shapes can't be changed once created, so entities with different shapes can't share children.
+        """
+
+        if isinstance(entity, DoorTemplate):
+            return (entity.type, entity.width, entity.height, entity.anchor_x, entity.anchor_y)
+
+        if isinstance(entity, InkButtonTemplate):
+            return (entity.type, entity.button_anchor)
 
-        for element in data:
-            # Make sure the proper action structure is ensured.
-            if list(element.keys()) != ["action", "name", "id"]:
-                continue
-
-            # Extract target identifier.
-            target_id: tuple[str, int] = (element["name"], element["id"])
-
-            self.__trigger_child(element["action"], target_id)
-
-    def __map_child(self, child_data: dict[str, Any]) -> Node:
-        assert "name" in child_data.keys()
-
-        # Read on trigger data.
-        on_trigger_on_data: list[dict[str, Any]] | None = child_data["on_triggered_on"] if "on_triggered_on" in child_data.keys() else None
-        on_trigger_off_data: list[dict[str, Any]] | None = child_data["on_triggered_off"] if "on_triggered_off" in child_data.keys() else None
-
-        match child_data["name"]:
-            case "fish_node":
-                uniques.FISH = FishNode(
-                    x = child_data["x"],
-                    y = child_data["y"],
-                    enabled = not SETTINGS[custom_setting_keys.SINGLE_PLAYER],
-                    batch = self.scene.world_batch
-                )
-                return uniques.FISH
-            case "leg_node":
-                uniques.LEG = LegNode(
-                    x = child_data["x"],
-                    y = child_data["y"],
-                    enabled = True,
-                    batch = self.scene.world_batch
-                )
-                return uniques.LEG
-            case "door":
-                return DoorNode(
-                    x = child_data["x"],
-                    y = child_data["y"],
-                    width = child_data["width"] if "width" in child_data else 0,
-                    height = child_data["height"] if "height" in child_data else 0,
-                    anchor_x = child_data["anchor_x"] if "anchor_x" in child_data else 0,
-                    anchor_y = child_data["anchor_y"] if "anchor_y" in child_data else 0,
-                    destination = child_data["destination"] if "destination" in child_data else None,
-                    # Set room to the specified destination one.
-                    on_triggered = lambda tags, collider, entered: print("nano"),
-                    batch = self.scene.world_batch
-                )
-            case "ink_button_node":
-                return InkButtonNode(
-                    x = child_data["x"],
-                    y = child_data["y"],
-                    button_anchor = next((direction for direction in Direction if direction.value == child_data["button_anchor"]), Direction.DONW),
-                    allow_turning_off = child_data["allow_turning_off"] if "allow_turning_off" in child_data else True,
-                    on_triggered_on = lambda : self.__on_child_triggered(data = on_trigger_on_data),
-                    on_triggered_off = lambda : self.__on_child_triggered(data = on_trigger_off_data),
-                    batch = self.scene.world_batch
-                )
-            case "press_button_node":
-                return PressButtonNode(
-                    x = child_data["x"],
-                    y = child_data["y"],
-                    allow_turning_off = child_data["allow_turning_off"] if "allow_turning_off" in child_data else True,
-                    on_triggered_on = lambda : self.__on_child_triggered(data = on_trigger_on_data),
-                    on_triggered_off = lambda : self.__on_child_triggered(data = on_trigger_off_data),
-                    batch = self.scene.world_batch
-                )
-            case "red_platform_node":
-                return RedPlatformNode(
-                    x = child_data["x"],
-                    y = child_data["y"],
-                    starts_on = child_data["starts_on"] if "starts_on" in child_data else False,
-                    batch = self.scene.world_batch
-                )
-            case "tilemap":
-                return Node()
-            case _:
-                # TODO Return something visible so that the user notices something's wrong.
-                return Node()
+        return entity.type
+
+    def __create_child(self, entity: EntityTemplate, batch: Batch) -> Node:
+        """
+        Resets a pooled child of the right kind if any, otherwise creates a new one.
+        """
+
+        child: Node | None = self.__pool.acquire(kind = self.__get_pool_kind(entity), batch = batch)
+
+        if child is None:
+            return self.__factories[entity.type](entity, batch)
+
+        self.__resetters[entity.type](child, entity)
+
+        return child
+
+    def __create_fish(self, entity: EntityTemplate, batch: Batch) -> Node:
+        return FishNode(
+            x = entity.x,
+            y = entity.y,
+            enabled = not SETTINGS[custom_setting_keys.SINGLE_PLAYER],
+            batch = batch
+        )
+
+    def __create_leg(self, entity: EntityTemplate, batch: Batch) -> Node:
+        return LegNode(
+            x = entity.x,
+            y = entity.y,
+            enabled = True,
+            batch = batch
+        )
+
+    def __create_door(self, entity: DoorTemplate, batch: Batch) -> Node:
+        return DoorNode(
+            x = entity.x,
+            y = entity.y,
+            width = entity.width,
+            height = entity.height,
+            anchor_x = entity.anchor_x,
+            anchor_y = entity.anchor_y,
+            destination = entity.destination,
+            batch = batch
+        )
+
+    def __create_ink_button(self, entity: InkButtonTemplate, batch: Batch) -> Node:
+        return InkButtonNode(
+            x = entity.x,
+            y = entity.y,
+            button_anchor = Direction(entity.button_anchor),
+            allow_turning_off = entity.allow_turning_off,
+            on_triggered_on = lambda : self.__triggers.fire(source = entity, on = True),
+            on_triggered_off = lambda : self.__triggers.fire(source = entity, on = False),
+            batch = batch
+        )
+
+    def __create_press_button(self, entity: ButtonTemplate, batch: Batch) -> Node:
+        return PressButtonNode(
+            x = entity.x,
+            y = entity.y,
+            allow_turning_off = entity.allow_turning_off,
+            on_triggered_on = lambda : self.__triggers.fire(source = entity, on = True),
+            on_triggered_off = lambda : self.__triggers.fire(source = entity, on = False),
+            batch = batch
+        )
+
+    def __create_red_platform(self, entity: RedPlatformTemplate, batch: Batch) -> Node:
+        return RedPlatformNode(
+            x = entity.x,
+            y = entity.y,
+            starts_on = entity.starts_on,
+            batch = batch
+        )
+
+    def __reset_fish(self, child: FishNode, entity: EntityTemplate) -> None:
+        child.reset(
+            x = entity.x,
+            y = entity.y,
+            enabled = not SETTINGS[custom_setting_keys.SINGLE_PLAYER]
+        )
+
+    def __reset_leg(self, child: LegNode, entity: EntityTemplate) -> None:
+        child.reset(
+            x = entity.x,
+            y = entity.y,
+            enabled = True
+        )
+
+    def __reset_door(self, child: DoorNode, entity: DoorTemplate) -> None:
+        child.reset(
+            x = entity.x,
+            y = entity.y,
+            destination = entity.destination
+        )
+
+    def __reset_ink_button(self, child: InkButtonNode, entity: InkButtonTemplate) -> None:
+        child.reset(
+            x = entity.x,
+            y = entity.y,
+            allow_turning_off = entity.allow_turning_off,
+            on_triggered_on = lambda : self.__triggers.fire(source = entity, on = True),
+            on_triggered_off = lambda : self.__triggers.fire(source = entity, on = False)
+        )
+
+    def __reset_press_button(self, child: PressButtonNode, entity: ButtonTemplate) -> None:
+        child.reset(
+            x = entity.x,
+            y = entity.y,
+            allow_turning_off = entity.allow_turning_off,
+            on_triggered_on = lambda : self.__triggers.fire(source = entity, on = True),
+            on_triggered_off = lambda : self.__triggers.fire(source = entity, on = False)
+        )
+
+    def __reset_red_platform(self, child: RedPlatformNode, entity: RedPlatformTemplate) -> None:
+        child.reset(
+            x = entity.x,
+            y = entity.y,
+            starts_on = entity.starts_on
+        )
 
 SCENE_COMPOSER: SceneComposer | None = None
\ No newline at end of file
@@ -0,0 +1,195 @@
+import math
+
+import amonite.controllers as controllers
+from amonite.node import Node
+from amonite.node import PositionNode
+from amonite.sprite_node import SpriteNode
+from amonite.collision.collision_node import CollisionNode
+
+from region_collision_controller import RegionCollisionController
+
+def get_node_bounds(node: PositionNode) -> tuple[float, float, float, float]:
+    """
+    Returns the bounds of the provided node, defined as (x, y, width, height): the union of all its colliders' bounds, or just its position if it has none.
+    """
+
+    left: float = node.x
+    bottom: float = node.y
+    right: float = node.x
+    top: float = node.y
+
+    colliders_bounds: list[tuple[float, float, float, float]] = [
+        component.shape.get_collision_bounds() for component in node.components if isinstance(component, CollisionNode)
+    ]
+
+    if len(colliders_bounds) > 0:
+        left = min(bounds[0] for bounds in colliders_bounds)
+        bottom = min(bounds[1] for bounds in colliders_bounds)
+        right = max(bounds[0] + bounds[2] for bounds in colliders_bounds)
+        top = max(bounds[1] + bounds[3] for bounds in colliders_bounds)
+
+    return (left, bottom, right - left, top - bottom)
+
+class SceneRegions(Node):
+    """
+    Partitions static scene children (e.g. walls, waters, doors, buttons and platforms) into square regions.
+    Only children in regions near any moving collider (e.g. characters and ink) or any focus node (e.g. the camera target) are active: inactive children are not updated, their sprites are hidden and their colliders are not checked.
+    Sprite animations keep running, since some children rely on them ending (e.g. platforms switching on or off).
+    Should be added to the scene in place of all its children, which are then updated by it in the same order they were added in.
+    """
+
+    def __init__(
+        self,
+        region_size: int,
+        view_width: int,
+        view_height: int,
+        margin: int,
+        focus: list[PositionNode] | None = None
+    ) -> None:
+        """
+        [view_width], [view_height] and [margin] define the area around each focus point whose regions are active, so that all visible children are active.
+        """
+
+        super().__init__()
+
+        self.__region_size: int = region_size
+        self.__half_width: float = view_width / 2 + margin
+        self.__half_height: float = view_height / 2 + margin
+        self.__focus: list[PositionNode] = focus if focus is not None else []
+
+        # All partitioned children, in the order they were added in, along with their activation state.
+        self.__nodes: list[PositionNode] = []
+        self.__active: list[bool] = []
+
+        # All active children, in the order they were added in.
+        self.__active_nodes: list[PositionNode] = []
+
+        # Indexes of all children overlapping each region, by region coordinates.
+        self.__regions: dict[tuple[int, int], list[int]] = {}
+
+        # Regions found active by the last update, None if not updated yet.
+        self.__active_regions: set[tuple[int, int]] | None = None
+
+    def add(self, node: PositionNode) -> None:
+        """
+        Adds the provided child to all regions it overlaps.
+        The child is expected not to move, and to be active, just as if it was just created.
+        """
+
+        index: int = len(self.__nodes)
+        self.__nodes.append(node)
+        self.__active.append(True)
+        self.__active_nodes.append(node)
+
+        for region in self.__get_regions(get_node_bounds(node = node)):
+            self.__regions.setdefault(region, []).append(index)
+
+        # Make sure activation is computed again on the next update.
+        self.__active_regions = None
+
+    def update(self, dt: float) -> None:
+        super().update(dt = dt)
+
+        self.__update_regions()
+
+        for node in self.__active_nodes:
+            node.update(dt = dt)
+
+    def clear(self) -> None:
+        """
+        Activates all children again and forgets them.
+        """
+
+        for index, active in enumerate(self.__active):
+            if not active:
+                self.__set_active(index = index, active = True)
+
+        if isinstance(controllers.COLLISION_CONTROLLER, RegionCollisionController):
+            controllers.COLLISION_CONTROLLER.set_inactive(set())
+
+        self.__nodes.clear()
+        self.__active.clear()
+        self.__active_nodes.clear()
+        self.__regions.clear()
+        self.__active_regions = None
+
+    def delete(self) -> None:
+        # Children are owned by the scene composer, so just forget about them.
+        self.__nodes.clear()
+        self.__active.clear()
+        self.__active_nodes.clear()
+        self.__regions.clear()
+        self.__focus.clear()
+
+        super().delete()
+
+    def __get_regions(self, bounds: tuple[float, float, float, float]) -> list[tuple[int, int]]:
+        """
+        Returns the coordinates of all regions overlapping the provided bounds, defined as (x, y, width, height).
+        """
+
+        first_column: int = math.floor(bounds[0] / self.__region_size)
+        last_column: int = math.floor((bounds[0] + bounds[2]) / self.__region_size)
+        first_row: int = math.floor(bounds[1] / self.__region_size)
+        last_row: int = math.floor((bounds[1] + bounds[3]) / self.__region_size)
+
+        return [
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        ]
+
+    def __update_regions(self) -> None:
+        """
+        Activates all children in regions near any focus point and deactivates all others.
+        Nothing is done unless the set of active regions changed since the last update.
+        """
+
+        focus_points: list[tuple[float, float]] = [node.get_position() for node in self.__focus]
+        if isinstance(controllers.COLLISION_CONTROLLER, RegionCollisionController):
+            focus_points.extend(collider.get_position() for collider in controllers.COLLISION_CONTROLLER.get_dynamic_colliders())
+
+        active_regions: set[tuple[int, int]] = set()
+        for point in focus_points:
+            active_regions.update(self.__get_regions((
+                point[0] - self.__half_width,
+                point[1] - self.__half_height,
+                self.__half_width * 2,
+                self.__half_height * 2
+            )))
+
+        if active_regions == self.__active_regions:
+            return
+
+        self.__active_regions = active_regions
+
+        active_nodes: set[int] = set()
+        for region in active_regions:
+            active_nodes.update(self.__regions.get(region, ()))
+
+        inactive_colliders: set[CollisionNode] = set()
+        self.__active_nodes = []
+        for index, node in enumerate(self.__nodes):
+            active: bool = index in active_nodes
+
+            if active != self.__active[index]:
+                self.__set_active(index = index, active = active)
+
+            if active:
+                self.__active_nodes.append(node)
+            else:
+                inactive_colliders.update(component for component in node.components if isinstance(component, CollisionNode))
+
+        if isinstance(controllers.COLLISION_CONTROLLER, RegionCollisionController):
+            controllers.COLLISION_CONTROLLER.set_inactive(inactive_colliders)
+
+    def __set_active(self, index: int, active: bool) -> None:
+        """
+        Shows or hides all sprites of the child at the provided index.
+        """
+
+        self.__active[index] = active
+
+        for component in self.__nodes[index].components:
+            if isinstance(component, SpriteNode):
+                component.sprite.visible = active
@@ -0,0 +1,428 @@
+from enum import IntEnum
+from typing import Any
+import xml.etree.ElementTree as xml
+
+from asset_bundle import ASSET_BUNDLE
+
+class TilemapTemplate:
+    """
+    Parsed content of a TMX tilemap file.
+    """
+
+    __slots__ = (
+        "map_width",
+        "map_height",
+        "tile_width",
+        "tile_height",
+        "tilesets",
+        "layers"
+    )
+
+    def __init__(
+        self,
+        map_width: int,
+        map_height: int,
+        tile_width: int,
+        tile_height: int,
+        tilesets: tuple[str, ...],
+        layers: tuple[tuple[str, tuple[int, ...]], ...]
+    ) -> None:
+        self.map_width: int = map_width
+        self.map_height: int = map_height
+        self.tile_width: int = tile_width
+        self.tile_height: int = tile_height
+
+        # Tileset images, relative to the assets dir.
+        self.tilesets: tuple[str, ...] = tilesets
+
+        # Name and tile indexes (already zero based) of each layer, from bottom to top.
+        self.layers: tuple[tuple[str, tuple[int, ...]], ...] = layers
+
+    @staticmethod
+    def from_tmx_file(source: str, tilesets_path: str) -> "TilemapTemplate":
+        root: xml.Element = xml.fromstring(ASSET_BUNDLE.read_text(source = source))
+
+        layers: list[tuple[str, tuple[int, ...]]] = []
+        for layer in root.findall("layer"):
+            layer_data: xml.Element | None = layer.find("data")
+
+            if layer_data is None or layer_data.text is None:
+                # The provided file does not contain valid information.
+                raise ValueError("TMX layer data not found")
+
+            layers.append((
+                layer.attrib["name"],
+                tuple(int(i) - 1 for i in layer_data.text.replace("\n", "").split(","))
+            ))
+
+        return TilemapTemplate(
+            map_width = int(root.attrib["width"]),
+            map_height = int(root.attrib["height"]),
+            tile_width = int(root.attrib["tilewidth"]),
+            tile_height = int(root.attrib["tileheight"]),
+            tilesets = tuple(f"{tilesets_path}{tileset.attrib['source'].split('/')[-1].split('.')[0]}.png" for tileset in root.findall("tileset")),
+            layers = tuple(layers)
+        )
+
+class HittableTemplate:
+    """
+    Single hittable (wall or water) read from a hittables file.
+    """
+
+    __slots__ = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "sensor",
+        "tags"
+    )
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        sensor: bool,
+        tags: tuple[str, ...]
+    ) -> None:
+        self.x: int = x
+        self.y: int = y
+        self.width: int = width
+        self.height: int = height
+        self.sensor: bool = sensor
+        self.tags: tuple[str, ...] = tags
+
+    @staticmethod
+    def from_hittables_file(source: str, merge: bool = True) -> tuple["HittableTemplate", ...]:
+        """
+        Reads all hittables from the provided hittables (walls or waters) file.
+        Touching hittables are merged into as few as possible (see merge_hittables()), unless [merge] is unset.
+        """
+
+        # Return no hittables if the source file is not found.
+        if not ASSET_BUNDLE.exists(source = source):
+            return ()
+
+        data: dict[str, Any] = ASSET_BUNDLE.read_json(source = source)
+
+        # Just return if no data is read.
+        if len(data) <= 0:
+            return ()
+
+        hittables: list[HittableTemplate] = []
+        for element in data["elements"]:
+            positions: list[str] = element["positions"]
+            sizes: list[str] = element["sizes"]
+
+            assert len(positions) == len(sizes)
+
+            for position_string, size_string in zip(positions, sizes):
+                position: list[int] = [int(item) for item in position_string.split(",")]
+                size: list[int] = [int(item) for item in size_string.split(",")]
+
+                assert len(position) == 2 and len(size) == 2
+
+                hittables.append(HittableTemplate(
+                    x = position[0],
+                    y = position[1],
+                    width = size[0],
+                    height = size[1],
+                    sensor = element["sensor"] if "sensor" in element.keys() else False,
+                    tags = tuple(element["tags"])
+                ))
+
+        return merge_hittables(hittables = tuple(hittables)) if merge else tuple(hittables)
+
+def merge_hittables(hittables: tuple[HittableTemplate, ...]) -> tuple[HittableTemplate, ...]:
+    """
+    Combines all touching hittables with the same tags and sensority into as few rectangles as possible, covering exactly the same area without overlapping.
+    Each group of hittables is only replaced if that actually reduces its count, so that hittables which can't be merged are kept exactly as they are.
+    Groups are returned in the order they first appear in.
+    """
+
+    groups: dict[tuple[tuple[str, ...], bool], list[HittableTemplate]] = {}
+    for hittable in hittables:
+        groups.setdefault((hittable.tags, hittable.sensor), []).append(hittable)
+
+    merged: list[HittableTemplate] = []
+    for (tags, sensor), group in groups.items():
+        candidates: list[list[tuple[int, int, int, int]]] = [
+            merge_rects(rects = [(hittable.x, hittable.y, hittable.width, hittable.height) for hittable in group], vertical = vertical)
+            for vertical in (False, True)
+        ]
+        rects: list[tuple[int, int, int, int]] = min(candidates, key = len)
+
+        if len(rects) >= len(group):
+            merged.extend(group)
+            continue
+
+        merged.extend(
+            HittableTemplate(
+                x = rect[0],
+                y = rect[1],
+                width = rect[2],
+                height = rect[3],
+                sensor = sensor,
+                tags = tags
+            )
+            for rect in rects
+        )
+
+    return tuple(merged)
+
+def merge_rects(rects: list[tuple[int, int, int, int]], vertical: bool = False) -> list[tuple[int, int, int, int]]:
+    """
+    Splits the area covered by the provided rectangles, defined as (x, y, width, height), into maximal non overlapping rectangles.
+    Rectangles are first grown horizontally, then vertically, unless [vertical] is set, in which case the opposite is done.
+    """
+
+    # Compress coordinates, so that the covered area is described by a grid of cells as coarse as possible.
+    xs: list[int] = sorted({x for rect in rects for x in (rect[0], rect[0] + rect[2])})
+    ys: list[int] = sorted({y for rect in rects for y in (rect[1], rect[1] + rect[3])})
+    x_indexes: dict[int, int] = {x: index for index, x in enumerate(xs)}
+    y_indexes: dict[int, int] = {y: index for index, y in enumerate(ys)}
+
+    # Cells still to be covered, by row and column.
+    free: list[list[bool]] = [[False] * (len(xs) - 1) for _ in range(len(ys) - 1)]
+    for rect in rects:
+        for row in range(y_indexes[rect[1]], y_indexes[rect[1] + rect[3]]):
+            for column in range(x_indexes[rect[0]], x_indexes[rect[0] + rect[2]]):
+                free[row][column] = True
+
+    # Transposing the grid grows rectangles vertically first.
+    if vertical:
+        free = [list(column) for column in zip(*free)]
+
+    result: list[tuple[int, int, int, int]] = []
+    for first_row in range(len(free)):
+        for first_column in range(len(free[first_row])):
+            if not free[first_row][first_column]:
+                continue
+
+            last_column: int = first_column
+            while last_column + 1 < len(free[first_row]) and free[first_row][last_column + 1]:
+                last_column += 1
+
+            last_row: int = first_row
+            while last_row + 1 < len(free) and all(free[last_row + 1][first_column:last_column + 1]):
+                last_row += 1
+
+            for row in range(first_row, last_row + 1):
+                for column in range(first_column, last_column + 1):
+                    free[row][column] = False
+
+            if vertical:
+                result.append((xs[first_row], ys[first_column], xs[last_row + 1] - xs[first_row], ys[last_column + 1] - ys[first_column]))
+            else:
+                result.append((xs[first_column], ys[first_row], xs[last_column + 1] - xs[first_column], ys[last_row + 1] - ys[first_row]))
+
+    return result
+
+class EntityType(IntEnum):
+    """
+    Type of scene children, as stored in compiled scenes.
+    """
+
+    FISH = 0
+    LEG = 1
+    DOOR = 2
+    INK_BUTTON = 3
+    PRESS_BUTTON = 4
+    RED_PLATFORM = 5
+
+class TriggerTemplate:
+    """
+    Action performed on a scene child when another one is triggered.
+    """
+
+    __slots__ = (
+        "action",
+        "target"
+    )
+
+    def __init__(
+        self,
+        action: str,
+        target: int
+    ) -> None:
+        # Name of the method called on the target child.
+        self.action: str = action
+
+        # Index of the target child among all scene children.
+        self.target: int = target
+
+class EntityTemplate:
+    """
+    Single scene child, with all its properties already validated and defaulted.
+    Also used as is by entities with no properties other than position (e.g. characters).
+    """
+
+    __slots__ = (
+        "type",
+        "id",
+        "x",
+        "y"
+    )
+
+    def __init__(
+        self,
+        type: EntityType,
+        id: int,
+        x: float,
+        y: float
+    ) -> None:
+        self.type: EntityType = type
+        self.id: int = id
+        self.x: float = x
+        self.y: float = y
+
+class DoorTemplate(EntityTemplate):
+    __slots__ = (
+        "width",
+        "height",
+        "anchor_x",
+        "anchor_y",
+        "destination"
+    )
+
+    def __init__(
+        self,
+        id: int,
+        x: float,
+        y: float,
+        width: int,
+        height: int,
+        anchor_x: int,
+        anchor_y: int,
+        destination: str | None
+    ) -> None:
+        super().__init__(
+            type = EntityType.DOOR,
+            id = id,
+            x = x,
+            y = y
+        )
+
+        self.width: int = width
+        self.height: int = height
+        self.anchor_x: int = anchor_x
+        self.anchor_y: int = anchor_y
+
+        # Name of the scene the door leads to.
+        self.destination: str | None = destination
+
+class ButtonTemplate(EntityTemplate):
+    __slots__ = (
+        "allow_turning_off",
+        "on_triggered_on",
+        "on_triggered_off"
+    )
+
+    def __init__(
+        self,
+        type: EntityType,
+        id: int,
+        x: float,
+        y: float,
+        allow_turning_off: bool,
+        on_triggered_on: tuple[TriggerTemplate, ...],
+        on_triggered_off: tuple[TriggerTemplate, ...]
+    ) -> None:
+        super().__init__(
+            type = type,
+            id = id,
+            x = x,
+            y = y
+        )
+
+        self.allow_turning_off: bool = allow_turning_off
+        self.on_triggered_on: tuple[TriggerTemplate, ...] = on_triggered_on
+        self.on_triggered_off: tuple[TriggerTemplate, ...] = on_triggered_off
+
+class InkButtonTemplate(ButtonTemplate):
+    __slots__ = (
+        "button_anchor",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        x: float,
+        y: float,
+        button_anchor: str,
+        allow_turning_off: bool,
+        on_triggered_on: tuple[TriggerTemplate, ...],
+        on_triggered_off: tuple[TriggerTemplate, ...]
+    ) -> None:
+        super().__init__(
+            type = EntityType.INK_BUTTON,
+            id = id,
+            x = x,
+            y = y,
+            allow_turning_off = allow_turning_off,
+            on_triggered_on = on_triggered_on,
+            on_triggered_off = on_triggered_off
+        )
+
+        # Direction value.
+        self.button_anchor: str = button_anchor
+
+class RedPlatformTemplate(EntityTemplate):
+    __slots__ = (
+        "starts_on",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        x: float,
+        y: float,
+        starts_on: bool
+    ) -> None:
+        super().__init__(
+            type = EntityType.RED_PLATFORM,
+            id = id,
+            x = x,
+            y = y
+        )
+
+        self.starts_on: bool = starts_on
+
+class SceneTemplate:
+    """
+    Immutable, fully parsed and validated content of a scene file and all files it references (tilemap, walls and waters).
+    Scenes are built from templates, so that a scene can be rebuilt any number of times without reading or parsing anything again.
+    Templates are created by scene_compiler.py, either from compiled scenes or straight from scene files.
+    """
+
+    __slots__ = (
+        "src",
+        "title",
+        "tilemap",
+        "children",
+        "waters",
+        "walls",
+        "sources"
+    )
+
+    def __init__(
+        self,
+        src: str,
+        title: str,
+        tilemap: TilemapTemplate,
+        children: tuple[EntityTemplate, ...],
+        waters: tuple[HittableTemplate, ...],
+        walls: tuple[HittableTemplate, ...],
+        sources: tuple[str, ...]
+    ) -> None:
+        self.src: str = src
+        self.title: str = title
+        self.tilemap: TilemapTemplate = tilemap
+        self.children: tuple[EntityTemplate, ...] = children
+        self.waters: tuple[HittableTemplate, ...] = waters
+        self.walls: tuple[HittableTemplate, ...] = walls
+
+        # All asset files the template was read from.
+        self.sources: tuple[str, ...] = sources
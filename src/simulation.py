@@ -0,0 +1,120 @@
+import pyglet
+# The app event loop is bound to the default clock on creation, so make sure it's created before the default clock is replaced.
+import pyglet.app
+
+import amonite.controllers as controllers
+
+from allocation_profiler import AllocationProfiler
+from asset_preloader import ASSET_PRELOADER
+from constants import uniques
+import frame_profiler
+from frame_profiler import FRAME_PROFILER
+from global_input_node import GlobalInputNode
+from input_recording import InputRecorder
+from input_recording import InputReplayer
+import scene_composer
+
+class Simulation:
+    """
+    Fixed timestep game simulation.
+    Advances the whole game by a single physics tick at a time, regardless of any window, rendering or real time clock.
+    Should be created before any scene is loaded, since it replaces pyglet's default clock.
+    """
+
+    def __init__(
+        self,
+        timestep: float,
+        input_recorder: InputRecorder | None = None,
+        input_replayer: InputReplayer | None = None,
+        allocation_profiler: AllocationProfiler | None = None,
+        scene_build_budget: float | None = None
+    ) -> None:
+        """
+        [scene_build_budget] is the time (in seconds) spent building or tearing down scenes by each step, unlimited if None.
+        """
+
+        self.timestep: float = timestep
+        self.input_recorder: InputRecorder | None = input_recorder
+        self.input_replayer: InputReplayer | None = input_replayer
+        self.allocation_profiler: AllocationProfiler | None = allocation_profiler
+        self.scene_build_budget: float | None = scene_build_budget
+
+        # Simulated time, only advanced by physics ticks.
+        self.time: float = 0.0
+
+        # Make sure all scheduled functions (e.g. sprite animations) run on simulated time instead of real time, so that ticks are fully deterministic.
+        # Functions that need real time (e.g. app updates and redraws) should be scheduled on the app event loop clock.
+        self.__clock: pyglet.clock.Clock = pyglet.clock.Clock(time_function = self.get_time)
+        pyglet.clock.set_default(self.__clock)
+
+        self.__global_input_node: GlobalInputNode = GlobalInputNode()
+
+    def step(self) -> bool:
+        """
+        Performs a single physics tick.
+        Returns False if the tick was spent switching (or waiting to switch) to the next scene, True otherwise.
+        """
+
+        # Check for scene change.
+        if uniques.NEXT_SCENE_SRC is not None:
+            if uniques.NEXT_SCENE_SRC != uniques.ACTIVE_SCENE_SRC and scene_composer.SCENE_COMPOSER is not None:
+                # Keep the main loop running while the next scene's assets are decoded in the background.
+                # No tick is performed in the meantime, so that the scene change happens on the same tick regardless of decoding time.
+                # The scene is then built a slice at a time, still with no tick performed until it's swapped in.
+                if ASSET_PRELOADER.is_ready(scene_src = uniques.NEXT_SCENE_SRC):
+                    scene_composer.SCENE_COMPOSER.build_scene(
+                        config_file_path = uniques.NEXT_SCENE_SRC,
+                        budget = self.scene_build_budget
+                    )
+            else:
+                # Nothing to load: the request would otherwise be left pending forever.
+                uniques.NEXT_SCENE_SRC = None
+            return False
+
+        # Keep tearing down the previous scene, a slice at a time.
+        if scene_composer.SCENE_COMPOSER is not None and scene_composer.SCENE_COMPOSER.is_busy():
+            scene_composer.SCENE_COMPOSER.advance(budget = self.scene_build_budget)
+
+        if self.allocation_profiler is not None:
+            with self.allocation_profiler:
+                self.__tick()
+        else:
+            self.__tick()
+
+        return True
+
+    def __tick(self) -> None:
+        # InputController makes sure every input is handled correctly.
+        # Input presses only last for a single tick, even if the scene update raises.
+        with controllers.INPUT_CONTROLLER:
+            with FRAME_PROFILER.section(frame_profiler.INPUT):
+                # Replayed inputs overwrite any live input.
+                if self.input_replayer is not None:
+                    self.input_replayer.apply(input_controller = controllers.INPUT_CONTROLLER)
+
+                if self.input_recorder is not None:
+                    self.input_recorder.record(input_controller = controllers.INPUT_CONTROLLER)
+
+            if uniques.ACTIVE_SCENE is not None:
+                with FRAME_PROFILER.section(frame_profiler.SCENE):
+                    uniques.ACTIVE_SCENE.update(dt = self.timestep)
+
+            with FRAME_PROFILER.section(frame_profiler.GLOBAL_INPUT):
+                self.__global_input_node.update(dt = self.timestep)
+
+        # Compute collisions through collision manager.
+        with FRAME_PROFILER.section(frame_profiler.COLLISIONS):
+            controllers.COLLISION_CONTROLLER.update(dt = self.timestep)
+
+        # Perform all actions triggered during the tick at once, in firing order.
+        if scene_composer.SCENE_COMPOSER is not None:
+            with FRAME_PROFILER.section(frame_profiler.TRIGGERS):
+                scene_composer.SCENE_COMPOSER.dispatch_triggers()
+
+        self.time += self.timestep
+
+        # Run all functions scheduled up to the current simulated time.
+        self.__clock.tick()
+
+    def get_time(self) -> float:
+        return self.time
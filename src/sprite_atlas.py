@@ -0,0 +1,78 @@
+import os
+from typing import Any
+import pyglet
+
+from asset_bundle import ASSET_BUNDLE
+import resource_internals
+
+# Atlas index, as written by atlas_builder.py (relative to the assets dir).
+ATLAS_INDEX: str = "atlas/sprites.json"
+ATLAS_VERSION: int = 2
+
+class SpriteAtlas:
+    """
+    Runtime side of the build-time sprite atlas (see atlas_builder.py).
+    Each packed sprite sheet is registered with pyglet.resource as a region of its atlas page, so that every regular image load (e.g. by animations) transparently gets it from the atlas.
+    Sprites sharing a page share their texture too, so a whole scene draws with just a few texture binds.
+    Sprite sheets edited after the atlas was built are left out of it, so that they're loaded from their own files instead.
+    """
+
+    def __init__(self) -> None:
+        self.pages: list[pyglet.image.Texture] = []
+
+        # Atlas regions by original sprite sheet path.
+        # pyglet.resource only keeps weak references to its images, so they must be kept alive here.
+        self.regions: dict[str, pyglet.image.TextureRegion] = {}
+
+    def install(self, index_src: str = ATLAS_INDEX) -> bool:
+        """
+        Loads all atlas pages and registers all packed sprite sheets with pyglet.resource.
+        Returns False if no atlas was built, in which case all sprite sheets are just loaded from their own files.
+        Must be called after a GL context is created and before any sprite is loaded.
+        """
+
+        if not ASSET_BUNDLE.exists(source = index_src) or not resource_internals.is_supported():
+            return False
+
+        index: dict[str, Any] = ASSET_BUNDLE.read_json(source = index_src)
+
+        if index.get("version") != ATLAS_VERSION:
+            print(f"Ignoring outdated sprite atlas {index_src}, rebuild it with atlas_builder.py")
+            return False
+
+        self.pages = [pyglet.resource.texture(page) for page in index["pages"]]
+
+        outdated: list[str] = []
+        for source, region_data in index["images"].items():
+            if self.__is_outdated(source = source, region_data = region_data):
+                outdated.append(source)
+                continue
+
+            region: pyglet.image.TextureRegion = self.pages[region_data["page"]].get_region(
+                x = region_data["x"],
+                y = region_data["y"],
+                width = region_data["width"],
+                height = region_data["height"]
+            )
+            self.regions[source] = region
+            resource_internals.cache_image(name = source, image = region)
+
+        if len(outdated) > 0:
+            print(f"Ignoring {len(outdated)} sprite sheets edited after {index_src} was built, rebuild it with atlas_builder.py")
+
+        return True
+
+    def __is_outdated(self, source: str, region_data: dict[str, Any]) -> bool:
+        """
+        Tells whether the provided sprite sheet file was modified after being packed, based on its size and modification time when packed.
+        Sheets with no loose file (e.g. only shipped in the asset bundle) are never outdated.
+        """
+
+        file_path: str = f"{pyglet.resource.path[0]}/{source}"
+
+        if not os.path.exists(file_path):
+            return False
+
+        return os.path.getsize(file_path) != region_data["size"] or os.path.getmtime(file_path) > region_data["mtime"]
+
+SPRITE_ATLAS: SpriteAtlas = SpriteAtlas()
@@ -0,0 +1,84 @@
+import math
+
+from amonite.collision.collision_node import CollisionNode
+from amonite.collision.collision_shape import CollisionRect
+
+class StaticGrid:
+    """
+    Uniform grid index of static colliders, so that finding the ones near any area only costs time proportional to the colliders actually there.
+    Only fixed colliders (e.g. walls and waters) are actually placed in cells: all others (e.g. static sensors following characters) may move at any time, so they're always returned.
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        self.__cell_size: int = cell_size
+
+        # All indexed colliders, in the order they were indexed in.
+        self.__colliders: list[CollisionNode] = []
+
+        # Indexes of all colliders overlapping each cell, by cell coordinates.
+        self.__cells: dict[tuple[int, int], list[int]] = {}
+
+        # Indexes of all colliders which are not fixed or have no known bounds (e.g. non rect shapes), which are always returned.
+        self.__unbounded: list[int] = []
+
+    def build(self, colliders: list[CollisionNode], fixed: set[CollisionNode]) -> None:
+        """
+        Indexes all provided colliders, forgetting any other.
+        Only colliders in [fixed] are expected never to move.
+        """
+
+        self.clear()
+
+        for collider in colliders:
+            self.add(collider = collider, fixed = collider in fixed)
+
+    def add(self, collider: CollisionNode, fixed: bool) -> None:
+        """
+        Indexes the provided collider, after all others.
+        """
+
+        index: int = len(self.__colliders)
+        self.__colliders.append(collider)
+
+        if not fixed or not isinstance(collider.shape, CollisionRect):
+            self.__unbounded.append(index)
+            return
+
+        for cell in self.__get_cells(bounds = collider.shape.get_collision_bounds()):
+            self.__cells.setdefault(cell, []).append(index)
+
+    def query(self, bounds: tuple[float, float, float, float]) -> list[CollisionNode]:
+        """
+        Returns all indexed colliders which may overlap the provided bounds, defined as (x, y, width, height), in the order they were indexed in.
+        """
+
+        indexes: set[int] = set(self.__unbounded)
+
+        for cell in self.__get_cells(bounds = bounds):
+            indexes.update(self.__cells.get(cell, ()))
+
+        return [self.__colliders[index] for index in sorted(indexes)]
+
+    def clear(self) -> None:
+        self.__colliders.clear()
+        self.__cells.clear()
+        self.__unbounded.clear()
+
+    def __get_cells(self, bounds: tuple[float, float, float, float]) -> list[tuple[int, int]]:
+        """
+        Returns the coordinates of all cells overlapping the provided bounds, defined as (x, y, width, height).
+        """
+
+        first_column: int = math.floor(bounds[0] / self.__cell_size)
+        last_column: int = math.floor((bounds[0] + bounds[2]) / self.__cell_size)
+        first_row: int = math.floor(bounds[1] / self.__cell_size)
+        last_row: int = math.floor((bounds[1] + bounds[3]) / self.__cell_size)
+
+        return [
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.__colliders)
@@ -0,0 +1,80 @@
+from typing import Callable
+
+from amonite.node import Node
+
+from scene_template import ButtonTemplate
+from scene_template import EntityTemplate
+from scene_template import SceneTemplate
+from scene_template import TriggerTemplate
+
+class TriggerGraph:
+    """
+    Triggers of the active scene, compiled to the bound methods they call on their targets.
+    Fired triggers are queued and only dispatched once per physics tick, in the same order they were fired in, so that no target is touched while colliders are being checked.
+    """
+
+    def __init__(self) -> None:
+        # Actions called when each child is triggered on and off, by child template.
+        self.__actions: dict[EntityTemplate, tuple[tuple[Callable[[], None], ...], tuple[Callable[[], None], ...]]] = {}
+
+        # Actions fired since the last dispatch, in firing order.
+        self.__queue: list[tuple[Callable[[], None], ...]] = []
+
+    def compile(self, template: SceneTemplate, children: list[Node]) -> None:
+        """
+        Resolves all triggers of the provided scene template to the methods they call on the provided children, dropping any pending trigger.
+        [children] should be in the same order as in the scene template.
+        Triggers are validated by the scene compiler, so their targets and actions are known to exist.
+        """
+
+        assert len(children) == len(template.children)
+
+        self.clear()
+
+        for entity in template.children:
+            if not isinstance(entity, ButtonTemplate):
+                continue
+
+            self.__actions[entity] = (
+                self.__resolve(triggers = entity.on_triggered_on, children = children),
+                self.__resolve(triggers = entity.on_triggered_off, children = children)
+            )
+
+    def fire(self, source: EntityTemplate, on: bool) -> None:
+        """
+        Queues all actions triggered by the child defined by the provided template being triggered on or off.
+        """
+
+        actions: tuple[tuple[Callable[[], None], ...], tuple[Callable[[], None], ...]] | None = self.__actions.get(source)
+
+        if actions is None:
+            return
+
+        self.__queue.append(actions[0] if on else actions[1])
+
+    def dispatch(self) -> None:
+        """
+        Calls all queued actions, in firing order.
+        Triggers fired by the actions themselves are only dispatched on the next call, so that no chain of triggers can stall a tick.
+        """
+
+        if len(self.__queue) <= 0:
+            return
+
+        queue: list[tuple[Callable[[], None], ...]] = self.__queue
+        self.__queue = []
+
+        for actions in queue:
+            for action in actions:
+                action()
+
+    def clear(self) -> None:
+        """
+        Forgets all compiled triggers and drops any pending one.
+        """
+
+        self.__actions.clear()
+        self.__queue.clear()
+
+    def __resolve(self, triggers: tuple[TriggerTemplate, ...], children: list[Node]) -> tuple[Callable[[], None], ...]:
+        return tuple(getattr(children[trigger.target], trigger.action) for trigger in triggers)
@@ -1,6 +1,11 @@
 from io import TextIOWrapper
 import pyglet
 
+from amonite.node import Node
+from amonite.sprite_node import SpriteNode
+from amonite.collision.collision_node import CollisionNode
+from amonite.collision.collision_shape import CollisionShape
+
 
 def load_shader(
     vert_file_path: str | None = None,
@@ -27,4 +32,55 @@ def load_shader(
     vert_shader: pyglet.graphics.shader.Shader = pyglet.graphics.shader.Shader(vert_src, "vertex")
     frag_shader: pyglet.graphics.shader.Shader = pyglet.graphics.shader.Shader(frag_src, "fragment")
 
-    return pyglet.graphics.shader.ShaderProgram(vert_shader, frag_shader)
\ No newline at end of file
+    return pyglet.graphics.shader.ShaderProgram(vert_shader, frag_shader)
+
+def reset_collider(
+    collider: CollisionNode,
+    position: tuple[float, float] | None = None
+) -> None:
+    """
+    Stops the provided collider and forgets all its ongoing collisions, so that it can be reused as if it was just created.
+    The collider is also moved to [position], if provided.
+    """
+
+    if position is not None:
+        collider.set_position(position = position)
+
+    collider.set_velocity((0.0, 0.0))
+    collider.collisions.clear()
+    collider.in_collisions.clear()
+    collider.out_collisions.clear()
+
+def move_to_batch(
+    node: Node,
+    batch: pyglet.graphics.Batch
+) -> None:
+    """
+    Moves all sprites and collision debug shapes of the provided node and of all its components (recursively) to the provided batch.
+    """
+
+    if isinstance(node, SpriteNode):
+        node.sprite.batch = batch
+
+    if isinstance(node, CollisionShape) and node.render_shape is not None:
+        # amonite never exposes render shapes' pyglet shapes (e.g. RectNode.__shape), so reach them through their mangled names.
+        shape: pyglet.shapes.ShapeBase | None = getattr(node.render_shape, f"_{type(node.render_shape).__name__}__shape", None)
+        if shape is not None:
+            shape.batch = batch
+
+    for component in node.components:
+        move_to_batch(component, batch = batch)
+
+def pause_animations(
+    node: Node,
+    paused: bool
+) -> None:
+    """
+    Pauses or resumes the animations of all sprites of the provided node and of all its components (recursively).
+    """
+
+    if isinstance(node, SpriteNode) and isinstance(node.get_image(), pyglet.image.Animation):
+        node.sprite.paused = paused
+
+    for component in node.components:
+        pause_animations(component, paused = paused)
\ No newline at end of file
@@ -0,0 +1,217 @@
+from collections import OrderedDict
+import os
+
+from asset_bundle import ASSET_BUNDLE
+from asset_preloader import ASSET_PRELOADER
+from scene_compiler import SCENES_DIR
+from scene_compiler import write_scene
+from scene_template import DoorTemplate
+from scene_template import SceneTemplate
+
+# Offsets of all rooms adjacent to any room on the world grid.
+NEIGHBOR_OFFSETS: tuple[tuple[int, int, int], ...] = (
+    (-1, 0, 0),
+    (1, 0, 0),
+    (0, -1, 0),
+    (0, 1, 0),
+    (0, 0, -1),
+    (0, 0, 1)
+)
+
+def get_room_coords(scene_src: str) -> tuple[int, int, int] | None:
+    """
+    Returns the world grid coordinates of the provided scene, as encoded in its name (e.g. "scenes/0_0_1.json" is at (0, 0, 1)).
+    Returns None if the scene is not named after grid coordinates.
+    """
+
+    name: str = os.path.splitext(os.path.basename(scene_src))[0]
+    parts: list[str] = name.split("_")
+
+    if len(parts) != 3:
+        return None
+
+    try:
+        return (int(parts[0]), int(parts[1]), int(parts[2]))
+    except ValueError:
+        return None
+
+def get_room_src(coords: tuple[int, int, int]) -> str:
+    """
+    Returns the scene file of the room at the provided world grid coordinates.
+    """
+
+    return f"{SCENES_DIR}/{coords[0]}_{coords[1]}_{coords[2]}.json"
+
+class WorldManager:
+    """
+    Keeps the current room and all rooms adjacent to it (on the world grid or through doors) parsed and resident, so that moving to any of them never waits on disk.
+    All other rooms read so far are kept as well, within a memory budget, and evicted least recently used first, so that walking back and forth between rooms never reads them again.
+    Rooms are actually held by the asset preloader: this only decides which of them to request and which to evict.
+    Resident memory is estimated as the size of all rooms' compiled templates plus all images they need, decoded, which make up most of it.
+    """
+
+    def __init__(self) -> None:
+        # Resident rooms, from least to most recently entered or requested, along with the size in bytes of their compiled template (None if not parsed yet).
+        self.__rooms: OrderedDict[str, int | None] = OrderedDict()
+
+        # Decoded size in bytes of all images seen so far, by path.
+        self.__image_sizes: dict[str, int] = {}
+
+        # Current room, along with all rooms adjacent to it, which are never evicted.
+        self.__current: str | None = None
+        self.__neighbors: set[str] = set()
+
+    def enter(self, scene_src: str, budget: int) -> None:
+        """
+        Makes the provided room current, requesting all its neighbors and evicting rooms least recently used until [budget] bytes are resident.
+        The current room and its neighbors are always kept, even if they exceed the budget on their own.
+        Should be called whenever a room is swapped in.
+        """
+
+        self.__current = scene_src
+        ASSET_PRELOADER.request(scene_src = scene_src)
+        self.__touch(scene_src = scene_src)
+
+        self.__neighbors = set(self.get_neighbors(scene_src = scene_src))
+        for neighbor in self.__neighbors:
+            ASSET_PRELOADER.request(scene_src = neighbor)
+            self.__touch(scene_src = neighbor)
+
+        # The current room was entered last, so it's the most recently used one.
+        self.__rooms.move_to_end(scene_src)
+
+        self.evict(budget = budget)
+
+    def evict(self, budget: int) -> None:
+        """
+        Evicts rooms least recently used, other than the current one and its neighbors, until no more than [budget] bytes are resident.
+        """
+
+        # Forget rooms evicted or never kept by the preloader.
+        for scene_src in [scene_src for scene_src in self.__rooms.keys() if not ASSET_PRELOADER.is_resident(scene_src = scene_src)]:
+            del self.__rooms[scene_src]
+
+        size: int = self.get_size()
+
+        for scene_src in list(self.__rooms.keys()):
+            if size <= budget:
+                break
+
+            if scene_src == self.__current or scene_src in self.__neighbors:
+                continue
+
+            del self.__rooms[scene_src]
+            ASSET_PRELOADER.evict(scene_src = scene_src)
+
+            # Images shared with other resident rooms are kept, so the size has to be computed again.
+            size = self.get_size()
+
+    def get_size(self) -> int:
+        """
+        Returns the estimated memory in bytes taken by all resident rooms: their compiled templates, plus all images they need decoded, each counted once even if shared by multiple rooms.
+        Rooms and images still being read count as empty.
+        """
+
+        size: int = 0
+        images: set[str] = set()
+
+        for scene_src in list(self.__rooms.keys()):
+            size += self.__get_template_size(scene_src = scene_src)
+            images.update(ASSET_PRELOADER.get_images(scene_src = scene_src))
+
+        return size + sum(self.__get_image_size(image = image) for image in images)
+
+    def get_neighbors(self, scene_src: str) -> list[str]:
+        """
+        Returns all existing rooms adjacent to the provided one, either on the world grid or through any of its doors.
+        Doors are only known once the room is parsed.
+        """
+
+        neighbors: list[str] = []
+
+        coords: tuple[int, int, int] | None = get_room_coords(scene_src = scene_src)
+        if coords is not None:
+            for offset in NEIGHBOR_OFFSETS:
+                neighbor: str = get_room_src(coords = (coords[0] + offset[0], coords[1] + offset[1], coords[2] + offset[2]))
+
+                if ASSET_BUNDLE.exists(source = neighbor):
+                    neighbors.append(neighbor)
+
+        if ASSET_PRELOADER.is_parsed(scene_src = scene_src):
+            template: SceneTemplate = ASSET_PRELOADER.get_template(scene_src = scene_src)
+
+            for child in template.children:
+                if not isinstance(child, DoorTemplate) or not child.destination:
+                    continue
+
+                destination: str = f"{SCENES_DIR}/{child.destination}.json"
+                if destination != scene_src and destination not in neighbors and ASSET_BUNDLE.exists(source = destination):
+                    neighbors.append(destination)
+
+        return neighbors
+
+    def clear(self) -> None:
+        """
+        Evicts all resident rooms.
+        """
+
+        for scene_src in self.__rooms.keys():
+            ASSET_PRELOADER.evict(scene_src = scene_src)
+
+        self.__rooms.clear()
+        self.__image_sizes.clear()
+        self.__current = None
+        self.__neighbors.clear()
+
+    def __touch(self, scene_src: str) -> None:
+        """
+        Marks the provided room as the most recently used one.
+        """
+
+        if scene_src in self.__rooms:
+            self.__rooms.move_to_end(scene_src)
+        else:
+            self.__rooms[scene_src] = None
+
+    def __get_template_size(self, scene_src: str) -> int:
+        """
+        Returns the size in bytes of the provided room's template, computed once parsed as the size of its compiled version.
+        Rooms still being parsed count as empty.
+        """
+
+        size: int | None = self.__rooms[scene_src]
+
+        if size is None:
+            if not ASSET_PRELOADER.is_parsed(scene_src = scene_src):
+                return 0
+
+            size = len(write_scene(template = ASSET_PRELOADER.get_template(scene_src = scene_src)))
+            self.__rooms[scene_src] = size
+
+        return size
+
+    def __get_image_size(self, image: str) -> int:
+        """
+        Returns the decoded size in bytes of the provided image, computed once decoded.
+        Images still being decoded count as empty.
+        """
+
+        size: int | None = self.__image_sizes.get(image)
+
+        if size is None:
+            size = ASSET_PRELOADER.get_image_size(image = image)
+
+            if size is None:
+                return 0
+
+            self.__image_sizes[image] = size
+
+        return size
+
+    def __contains__(self, scene_src: str) -> bool:
+        return scene_src in self.__rooms
+
+    def __len__(self) -> int:
+        return len(self.__rooms)
+
+WORLD_MANAGER: WorldManager = WorldManager()